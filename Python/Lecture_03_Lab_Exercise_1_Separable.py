@@ -12,7 +12,7 @@
 import numpy as np
 from scipy.integrate import solve_ivp
 import matplotlib.pyplot as plt
-from sympy import symbols, Function, dsolve, solve
+from sympy import symbols, Function, dsolve, solve, lambdify
 
 
 # Define the separable equation as a function to be used by the solver.
@@ -80,8 +80,8 @@ print("Analytical Specific Solution:", specificSolution)
 # Generate points where both the analytical and numerical solutions will be evaluated.
 # Choosing 100 points provides a smooth curve for plotting between 0 and 2.
 xAnalytical = np.linspace(0, 2, 100)
-# Evaluate the symbolic analytical solution on the numeric grid (convert to float array).
-yAnalytical = np.array([specificSolution.rhs.subs(x, val) for val in xAnalytical], dtype=float)
+# Evaluate the symbolic analytical solution on the numeric grid with one compiled NumPy call.
+yAnalytical = lambdify(x, specificSolution.rhs, "numpy")(xAnalytical)
 
 # Solve the ODE numerically over the interval [0, 2] using SciPy's solve_ivp.
 # We use `t_eval` to get values at the same points used for plotting the analytical solution.
@@ -12,7 +12,7 @@
 import numpy as np
 from scipy.integrate import solve_ivp
 import matplotlib.pyplot as plt
-from sympy import symbols, Function, dsolve, solve
+from sympy import symbols, Function, dsolve, solve, lambdify
 
 
 # Define the logistic growth equation as a function to be used by the numerical solver.
@@ -58,8 +58,8 @@ print("Analytical Specific Solution:", specificSolution)
 # Generate a numeric grid for plotting the analytical solution between 0 and 20.
 # Use 100 points to give smooth curves for comparison with numerical solver output.
 tAnalytical = np.linspace(0, 20, 100)
-# Evaluate the symbolic analytical solution at numeric time points and cast to float array.
-PAnalytical = np.array([specificSolution.rhs.subs(tSym, val) for val in tAnalytical], dtype=float)
+# Evaluate the symbolic analytical solution at all time points with one compiled NumPy call.
+PAnalytical = lambdify(tSym, specificSolution.rhs, "numpy")(tAnalytical)
 
 # Solve the ODE numerically over the interval [0, 20] using solve_ivp.
 # `args` passes model parameters (r, K) into the solver function.
@@ -12,7 +12,7 @@
 import numpy as np
 from scipy.integrate import solve_ivp
 import matplotlib.pyplot as plt
-from sympy import symbols, Function, dsolve, solve
+from sympy import symbols, Function, dsolve, solve, lambdify
 
 
 # Define the drug concentration equation as a function to be used by the numerical solver.
@@ -52,9 +52,9 @@ print("Analytical Specific Solution:")
 print(specificSolution)
 
 # Generate a numeric grid for plotting the analytical solution over 0..20.
-# Using 100 points yields a smooth exponential curve for comparison.
+# Using 100 points yields a smooth exponential curve for comparison (evaluated with lambdify).
 tAnalytical = np.linspace(0, 20, 100)
-CAnalytical = np.array([specificSolution.rhs.subs(tSym, val) for val in tAnalytical], dtype=float)
+CAnalytical = lambdify(tSym, specificSolution.rhs, "numpy")(tAnalytical)
 
 # Solve the ODE numerically over the interval [0, 20] using solve_ivp.
 # `args` contains the elimination rate k for the solver function.
@@ -0,0 +1,286 @@
+'''
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+'''
+
+# Import necessary libraries.
+import os
+import time
+import hmac
+import shutil
+import inspect
+import hashlib
+import tempfile
+import contextlib
+import numpy as np
+import sympy as sp
+import prettytable as pt
+import matplotlib.pyplot as plt
+from collections import OrderedDict
+from sympy import symbols, Function, dsolve, solve
+
+# Compiled sources are stored next to the bytecode cache, which is already ignored by git.
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__", "SymPyEvaluator")
+
+
+class SymbolicEvaluator:
+  """
+  Compiles SymPy expressions to NumPy functions once and memoizes them.
+
+  Expressions are compiled with lambdify using common-subexpression elimination.
+  The compiled callables are kept in an in-memory LRU cache and their generated
+  source is stored on disk, both keyed by a SHA-256 hash of the srepr of the
+  arguments and the expression (plus the target modules and the SymPy version).
+  A new process therefore reloads the source instead of compiling again.
+
+  Loading an entry executes it, so every entry starts with an HMAC-SHA256 of its
+  key and source under a random secret kept in the store (readable by its owner
+  only); entries that fail the check, or fail to load for any reason, are
+  compiled again. If the secret is not private, the disk store is not used. Once
+  the store exceeds maxDiskBytes, the least recently used entries are deleted.
+  """
+
+  def __init__(self, cacheDir=DEFAULT_CACHE_DIR, maxSize=128, modules="numpy", maxDiskBytes=16 * 2 ** 20):
+    self.maxSize = maxSize
+    self.maxDiskBytes = maxDiskBytes
+    self.modules = modules
+    self.memory = OrderedDict()
+    self.digests = {}  # (expr, args) -> key, so repeated calls skip srepr and hashing.
+    self.stats = {"memoryHits": 0, "diskHits": 0, "compiles": 0}
+    # The namespace lambdify executes its generated code in, rebuilt once per evaluator.
+    self.namespace = dict(sp.lambdify([], 0, modules=modules).__globals__)
+    self.secret = None if (cacheDir is None) else self._Secret(cacheDir)
+    self.cacheDir = None if (self.secret is None) else cacheDir
+
+  def Key(self, expr, args):
+    text = "\n".join([sp.srepr(tuple(args)), sp.srepr(expr), repr(self.modules), sp.__version__])
+    return hashlib.sha256(text.encode()).hexdigest()
+
+  @staticmethod
+  def _Secret(cacheDir):
+    """
+    The HMAC secret of a store, created on first use; None if it is not private to this user.
+    """
+    path = os.path.join(cacheDir, "key")
+    try:
+      os.makedirs(cacheDir, mode=0o700, exist_ok=True)
+      if (not os.path.exists(path)):
+        handle, temporary = tempfile.mkstemp(dir=cacheDir, suffix=".tmp")  # Created with mode 0600.
+        try:
+          with os.fdopen(handle, "wb") as file:
+            file.write(os.urandom(32))
+          os.link(temporary, path)  # Fails if another process created the secret first; use theirs.
+        except FileExistsError:
+          pass
+        finally:
+          os.remove(temporary)
+      with open(path, "rb") as file:
+        info = os.fstat(file.fileno())
+        secret = file.read()
+    except OSError:
+      return None  # E.g. a read-only store or a filesystem without hard links: cache in memory only.
+    if (hasattr(os, "getuid")) and ((info.st_uid != os.getuid()) or (info.st_mode & 0o077)):
+      return None  # Someone else could forge entries.
+    return secret if (len(secret) == 32) else None
+
+  def _Sign(self, key, source):
+    return hmac.new(self.secret, f"{key}\n{source}".encode(), hashlib.sha256).hexdigest()
+
+  def _Load(self, key, path):
+    """
+    Compiled function from a cached source file, or None if it is missing, forged or unusable.
+    """
+    try:
+      with open(path, "r", encoding="utf-8") as file:
+        signature, _, source = file.read().partition("\n")
+    except OSError:
+      return None
+    if (not hmac.compare_digest(signature, self._Sign(key, source))):
+      return None  # Not written by this store; never execute it.
+    try:
+      namespace = dict(self.namespace)
+      exec(compile(source, path, "exec"), namespace)
+      function = namespace.get("_lambdifygenerated")
+      if (function is None) or any(name not in namespace for name in function.__code__.co_names):
+        return None  # Written by an incompatible setup; compile again.
+    except Exception:
+      return None
+    with contextlib.suppress(OSError):
+      os.utime(path)  # Mark as recently used for the eviction order.
+    return function
+
+  def _Write(self, key, path, source):
+    """
+    Stores a signed source file; on failure the function is only cached in memory.
+    """
+    temporary = None
+    try:
+      # Write atomically so that concurrent processes never read a partial file.
+      handle, temporary = tempfile.mkstemp(dir=self.cacheDir, suffix=".tmp")
+      with os.fdopen(handle, "w", encoding="utf-8") as file:
+        file.write(f"{self._Sign(key, source)}\n{source}")
+      os.replace(temporary, path)
+    except OSError:
+      if (temporary is not None):
+        with contextlib.suppress(OSError):
+          os.remove(temporary)
+      return
+    self._Evict()
+
+  def _Evict(self):
+    entries = []
+    for entry in os.scandir(self.cacheDir):
+      if (entry.name.endswith(".py")):
+        try:
+          info = entry.stat()
+        except OSError:
+          continue  # Removed by another process meanwhile.
+        entries.append((info.st_mtime, info.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+      if (total <= self.maxDiskBytes):
+        break
+      with contextlib.suppress(OSError):
+        os.remove(path)
+      total -= size
+
+  def Compile(self, expr, args):
+    """
+    Compiled NumPy function of expr with positional arguments args (symbols).
+
+    Parameters:
+    expr (sympy.Expr): Expression to compile (an Eq is compiled through its right-hand side).
+    args (sequence): The symbols, in the order of the arguments of the returned function.
+
+    Returns:
+    function: Vectorized callable; constant expressions are broadcast to the argument shape.
+    """
+    expr = expr.rhs if isinstance(expr, sp.Eq) else sp.sympify(expr)
+    args = tuple(args)
+    key = self.digests.get((expr, args))
+    if (key is None):
+      key = self.digests[(expr, args)] = self.Key(expr, args)
+    if (key in self.memory):
+      self.stats["memoryHits"] += 1
+      self.memory.move_to_end(key)
+      return self.memory[key]
+
+    path = None if (self.cacheDir is None) else os.path.join(self.cacheDir, f"{key}.py")
+    function = None if (path is None) else self._Load(key, path)
+    if (function is not None):
+      self.stats["diskHits"] += 1
+    else:
+      self.stats["compiles"] += 1
+      function = sp.lambdify(args, expr, modules=self.modules, cse=True)
+      if (path is not None):
+        self._Write(key, path, inspect.getsource(function))
+
+    def evaluate(*values):
+      result = function(*values)
+      if (np.ndim(result) == 0):
+        result = np.broadcast_to(result, np.broadcast(*values).shape) if values else result
+      return result
+
+    self.memory[key] = evaluate
+    while (len(self.memory) > self.maxSize):
+      evicted, _ = self.memory.popitem(last=False)
+      self.digests = {pair: digest for pair, digest in self.digests.items() if digest != evicted}
+    return evaluate
+
+  def Evaluate(self, expr, args, *values):
+    """
+    Evaluates expr at the given argument values, compiling it only on first use.
+    """
+    return self.Compile(expr, args)(*values)
+
+
+# Specific solutions of the three Lecture 03 labs, derived exactly as in the labs.
+x, tSym, C1 = symbols("x t C1")
+y = Function("y")(x)
+separable = dsolve(y.diff(x) - x * y, y)
+separable = separable.subs(C1, solve(separable.rhs.subs(x, 0) - 1, C1)[0])
+
+r, K, P0 = 0.5, 100, 10
+P = Function("P")(tSym)
+logistic = dsolve(P.diff(tSym) - r * P * (1.0 - P / K), P)
+logistic = logistic.subs(C1, solve(logistic.rhs.subs(tSym, 0) - P0, C1)[0])
+
+k, C0 = 0.1, 50
+C = Function("C")(tSym)
+drug = dsolve(C.diff(tSym) + k * C, C)
+drug = drug.subs(C1, solve(drug.rhs.subs(tSym, 0) - C0, C1)[0])
+
+cases = [
+  ("Separable", separable, x, np.linspace(0, 2, 1_000_000)),
+  ("Logistic Growth", logistic, tSym, np.linspace(0, 20, 1_000_000)),
+  ("Drug Concentration", drug, tSym, np.linspace(0, 20, 1_000_000)),
+]
+
+# A private, initially empty store so that the first compile is visible.
+cacheDir = tempfile.mkdtemp(prefix="SymPyEvaluatorDemo")
+table = pt.PrettyTable()
+table.field_names = [
+  "Solution", "Points", "subs Loop (ms)", "Cold Compile (ms)", "Disk Load (ms)", "Memory Hit (ms)",
+  "Evaluation (ms)", "Max |Difference|",
+]
+for name, solution, variable, grid in cases:
+  # The per-point subs loop of the labs, timed on 1000 points and scaled to 1e6.
+  start = time.perf_counter()
+  legacy = np.array([solution.rhs.subs(variable, val) for val in grid[::1000]], dtype=float)
+  subsTime = (time.perf_counter() - start) * 1e3 * grid.size / legacy.size
+
+  cold = SymbolicEvaluator(cacheDir=cacheDir)
+  start = time.perf_counter()
+  cold.Compile(solution, [variable])
+  compileTime = (time.perf_counter() - start) * 1e3
+
+  # A fresh evaluator stands in for a new process: the function comes from disk.
+  warm = SymbolicEvaluator(cacheDir=cacheDir)
+  start = time.perf_counter()
+  function = warm.Compile(solution, [variable])
+  diskTime = (time.perf_counter() - start) * 1e3
+  start = time.perf_counter()
+  warm.Compile(solution, [variable])
+  memoryTime = (time.perf_counter() - start) * 1e3
+  assert warm.stats == {"memoryHits": 1, "diskHits": 1, "compiles": 0}
+
+  start = time.perf_counter()
+  values = function(grid)
+  evaluationTime = (time.perf_counter() - start) * 1e3
+  table.add_row([
+    name, grid.size, f"{subsTime:.0f}", f"{compileTime:.1f}", f"{diskTime:.2f}", f"{memoryTime:.3f}",
+    f"{evaluationTime:.1f}", f"{np.max(np.abs(values[::1000] - legacy)):.1e}",
+  ])
+print(table)
+
+# Plot the three solutions evaluated through the cache.
+evaluator = SymbolicEvaluator(cacheDir=cacheDir)
+plt.figure(figsize=(15, 4))
+for i, (name, solution, variable, grid) in enumerate(cases):
+  plt.subplot(1, 3, i + 1)
+  plt.plot(grid[::1000], evaluator.Evaluate(solution, [variable], grid[::1000]), "b-", linewidth=1.5)
+  plt.xlabel(str(variable))
+  plt.ylabel(str(solution.lhs))
+  plt.title(f"{name}: {solution.rhs}", fontsize=9)
+  plt.grid()
+plt.tight_layout()  # Adjust layout to prevent overlap.
+plt.savefig("Lecture_03_Lab_Exercise_4_Evaluator.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot interactively.
+plt.close()  # Close the plot to free memory.
+print(f"Plot evaluator statistics: {evaluator.stats}.")
+
+# An entry edited behind the store's back fails the HMAC check and is compiled again, not executed.
+entry = next(entry.path for entry in os.scandir(cacheDir) if entry.name.endswith(".py"))
+with open(entry, "a", encoding="utf-8") as file:
+  file.write("import os; os.remove(__file__)\n")
+tampered = SymbolicEvaluator(cacheDir=cacheDir)
+for name, solution, variable, grid in cases:
+  tampered.Compile(solution, [variable])
+assert tampered.stats == {"memoryHits": 0, "diskHits": 2, "compiles": 1}
+print(f"Tampered entry recompiled: {tampered.stats}.")
+shutil.rmtree(cacheDir, ignore_errors=True)
@@ -37,6 +37,64 @@ def HeartOscillations(t, y, omega0, gamma, F0=0.0, omegaF=0.0):
   return [dxdt, dvdt]
 
 
+def HeartOscillationsBatched(t, Y, omega0, gamma, F0, omegaF):
+  """
+  Vectorized right-hand side for N heart oscillation scenarios stacked in one block state.
+
+  Parameters:
+  t (float): Time variable.
+  Y (numpy.ndarray): Block state [x_1, ..., x_N, v_1, ..., v_N] with shape (2N,) or (2N, k)
+    (solve_ivp passes k columns when vectorized=True).
+  omega0 (numpy.ndarray): Natural frequencies with shape (N,).
+  gamma (numpy.ndarray): Damping coefficients with shape (N,).
+  F0 (numpy.ndarray): Forcing amplitudes with shape (N,).
+  omegaF (numpy.ndarray): Forcing frequencies with shape (N,).
+
+  Returns:
+  numpy.ndarray: Derivatives in the same block layout and shape as Y.
+  """
+  N = len(gamma)
+  x, v = Y[:N], Y[N:]  # Unpack the displacement and velocity blocks.
+  column = (slice(None),) + (np.newaxis,) * (Y.ndim - 1)  # Broadcast parameters over the k columns.
+  # Derivative of displacement is velocity.
+  dxdt = v
+  # Derivative of velocity is acceleration with damping and forcing term.
+  dvdt = -2 * gamma[column] * v - (omega0 ** 2)[column] * x + (F0 * np.cos(omegaF * t))[column]
+  return np.concatenate([dxdt, dvdt])
+
+
+def SolveHeartOscillationsBatched(omega0, gamma, F0, omegaF, y0, tSpan, tEval, **options):
+  """
+  Integrates all heart oscillation scenarios in a single solve_ivp call.
+
+  All scenarios share the step-size sequence, which is chosen from the RMS error norm of
+  the whole block; tighten rtol when comparing against per-scenario runs.
+
+  Parameters:
+  omega0, gamma, F0, omegaF (float or array-like): Natural frequency, damping, forcing amplitude and
+    frequency; scalars are shared by all scenarios, arrays give one value per scenario.
+  y0 (list): Initial displacement and velocity (shared by all scenarios).
+  tSpan (tuple): Time span for the simulation.
+  tEval (numpy.ndarray): Time points at which to store the computed solution.
+  **options: Further solve_ivp options (method, rtol, atol).
+
+  Returns:
+  t (numpy.ndarray): Time points.
+  x (numpy.ndarray): Displacements with shape (N, len(t)).
+  v (numpy.ndarray): Velocities with shape (N, len(t)).
+  """
+  omega0, gamma, F0, omegaF = np.broadcast_arrays(
+    *(np.asarray(p, dtype=float) for p in (omega0, gamma, F0, omegaF))
+  )
+  N = gamma.size
+  Y0 = np.concatenate([np.full(N, y0[0], dtype=float), np.full(N, y0[1], dtype=float)])
+  sol = solve_ivp(
+    HeartOscillationsBatched, tSpan, Y0, t_eval=tEval, vectorized=True,
+    args=(omega0.ravel(), gamma.ravel(), F0.ravel(), omegaF.ravel()), **options,
+  )
+  return sol.t, sol.y[:N], sol.y[N:]
+
+
 # Simulation parameters: natural frequency, initial state, and time span.
 omega0 = 2 * np.pi  # Natural frequency (1 Hz).
 y0 = [1.0, 0.0]  # Initial displacement and velocity.
@@ -92,23 +150,21 @@ xOverdamped = A * np.exp(r1 * tEval) + B * np.exp(r2 * tEval)
 # ==============================================================
 # ========== Numerical Solutions for the Oscillations ==========
 # ==============================================================
-# Solve the ODE for the different oscillation types.
-solutions = {}
-for key, params in valuesDict.items():
-  sol = solve_ivp(
-    lambda t, y: HeartOscillations(
-      t,  # Unpack the time .
-      y,  # Unpack the state variables.
-      omega0,  # Natural frequency.
-      params["Gamma"],  # Damping coefficient.
-      F0=params["F0"],  # Forcing amplitude.
-      omegaF=params["OmegaF"],  # Forcing frequency.
-    ),
-    tSpan,  # Time span for the simulation.
-    y0,  # Initial conditions for the oscillation.
-    t_eval=tEval,  # Time points at which to store the computed solution.
-  )
-  solutions[key] = sol
+# Solve the ODE for all oscillation types at once in one block system.
+t, x, v = SolveHeartOscillationsBatched(
+  omega0,  # Natural frequency.
+  [params["Gamma"] for params in valuesDict.values()],  # Damping coefficients.
+  [params["F0"] for params in valuesDict.values()],  # Forcing amplitudes.
+  [params["OmegaF"] for params in valuesDict.values()],  # Forcing frequencies.
+  y0,  # Initial conditions for the oscillations.
+  tSpan,  # Time span for the simulation.
+  tEval,  # Time points at which to store the computed solution.
+  rtol=1e-6,  # Shared steps: tighter tolerance than the per-scenario default.
+  atol=1e-9,
+)
+# Split the block solution into the per-scenario solutions.
+solutions = {key: (t, np.vstack([x[i], v[i]])) for i, key in enumerate(valuesDict)}
+
 # ==============================================================
 
 # Plot analytical and numerical results side-by-side for direct comparison.
@@ -135,9 +191,9 @@ plt.title("Oscillations of the Heart (Analytical Solution)")  # Set the title fo
 plt.subplot(1, 2, 2)  # Create a subplot for the numerical results.
 
 # Plot the numerical solutions for each oscillation type.
-for i, (key, sol) in enumerate(solutions.items()):
+for i, (key, (t, y)) in enumerate(solutions.items()):
   # Plot the displacement over time for each oscillation type.
-  plt.plot(sol.t, sol.y[0], label=key, linewidth=2, color=colors[i])
+  plt.plot(t, y[0], label=key, linewidth=2, color=colors[i])
 
 plt.xlabel("Time (t)")  # Label the x-axis as time.
 plt.ylabel("Displacement x(t)")  # Label the y-axis as displacement.
@@ -0,0 +1,204 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+
+
+def StormerVerlet(f, x0, v0, h, tSpan):
+  """
+  Implements the Störmer-Verlet (velocity Verlet / leapfrog) method for x'' = f(t, x, x').
+  The method is symplectic and uses one evaluation of f per step when the force
+  does not depend on the velocity (the undamped case). For velocity-dependent forces
+  the half-step velocity is passed to f, which reduces the method to first order.
+
+  Parameters:
+  f (function): Acceleration f(t, x, v).
+  x0 (float): Initial displacement.
+  v0 (float): Initial velocity.
+  h (float): Time step.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+
+  Returns:
+  t (numpy.ndarray): Time vector.
+  x (numpy.ndarray): Displacement values.
+  v (numpy.ndarray): Velocity values.
+  """
+  # Time vector.
+  t = np.arange(*tSpan, h)
+  x, v = np.zeros(len(t)), np.zeros(len(t))
+  x[0], v[0] = x0, v0
+
+  a = f(t[0], x[0], v[0])  # Acceleration at the start of the first step.
+  for i in range(len(t) - 1):
+    vHalf = v[i] + h / 2.0 * a  # Half kick.
+    x[i + 1] = x[i] + h * vHalf  # Drift.
+    a = f(t[i + 1], x[i + 1], vHalf)  # New acceleration, reused by the next step.
+    v[i + 1] = vHalf + h / 2.0 * a  # Half kick.
+
+  return t, x, v
+
+
+def RungeKuttaNystrom4(f, x0, v0, h, tSpan, velocityDependent=True):
+  """
+  Implements 4th order Runge-Kutta-Nyström methods for x'' = f(t, x, x').
+
+  With velocityDependent=True the general four-stage method is used (damped and forced
+  oscillators). With velocityDependent=False f must not depend on v, and the cheaper
+  three-stage method for x'' = f(t, x) is used.
+
+  Parameters:
+  f (function): Acceleration f(t, x, v).
+  x0 (float): Initial displacement.
+  v0 (float): Initial velocity.
+  h (float): Time step.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+  velocityDependent (bool): Whether f depends on the velocity (default is True).
+
+  Returns:
+  t (numpy.ndarray): Time vector.
+  x (numpy.ndarray): Displacement values.
+  v (numpy.ndarray): Velocity values.
+  """
+  # Time vector.
+  t = np.arange(*tSpan, h)
+  x, v = np.zeros(len(t)), np.zeros(len(t))
+  x[0], v[0] = x0, v0
+
+  for i in range(len(t) - 1):
+    k1 = f(t[i], x[i], v[i])
+    if (velocityDependent):
+      k2 = f(t[i] + h / 2.0, x[i] + h / 2.0 * v[i] + h ** 2 / 8.0 * k1, v[i] + h / 2.0 * k1)
+      k3 = f(t[i] + h / 2.0, x[i] + h / 2.0 * v[i] + h ** 2 / 8.0 * k1, v[i] + h / 2.0 * k2)
+      k4 = f(t[i] + h, x[i] + h * v[i] + h ** 2 / 2.0 * k3, v[i] + h * k3)
+      x[i + 1] = x[i] + h * v[i] + h ** 2 / 6.0 * (k1 + k2 + k3)
+      v[i + 1] = v[i] + h / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+    else:
+      k2 = f(t[i] + h / 2.0, x[i] + h / 2.0 * v[i] + h ** 2 / 8.0 * k1, None)
+      k3 = f(t[i] + h, x[i] + h * v[i] + h ** 2 / 2.0 * k2, None)
+      x[i + 1] = x[i] + h * v[i] + h ** 2 / 6.0 * (k1 + 2.0 * k2)
+      v[i + 1] = v[i] + h / 6.0 * (k1 + 4.0 * k2 + k3)
+
+  return t, x, v
+
+
+def RungeKutta4(f, x0, v0, h, tSpan):
+  """
+  Classical Runge-Kutta 4th order method on the first-order system [x, v]
+  (the approach of the previous labs), with the same interface as above.
+  """
+  t = np.arange(*tSpan, h)
+  x, v = np.zeros(len(t)), np.zeros(len(t))
+  x[0], v[0] = x0, v0
+
+  for i in range(len(t) - 1):
+    k1x, k1v = v[i], f(t[i], x[i], v[i])
+    k2x, k2v = v[i] + h / 2.0 * k1v, f(t[i] + h / 2.0, x[i] + h / 2.0 * k1x, v[i] + h / 2.0 * k1v)
+    k3x, k3v = v[i] + h / 2.0 * k2v, f(t[i] + h / 2.0, x[i] + h / 2.0 * k2x, v[i] + h / 2.0 * k2v)
+    k4x, k4v = v[i] + h * k3v, f(t[i] + h, x[i] + h * k3x, v[i] + h * k3v)
+    x[i + 1] = x[i] + h / 6.0 * (k1x + 2.0 * k2x + 2.0 * k3x + k4x)
+    v[i + 1] = v[i] + h / 6.0 * (k1v + 2.0 * k2v + 2.0 * k3v + k4v)
+
+  return t, x, v
+
+
+def HeartAcceleration(t, x, v, omega0, gamma, F0=0.0, omegaF=0.0):
+  """
+  Acceleration of HeartOscillations (Lecture_04_Lab_Exercise_3_Heart.py) written as x'' = f(t, x, x').
+  """
+  acceleration = -omega0 ** 2 * x + F0 * np.cos(omegaF * t)
+  if (gamma != 0.0):
+    acceleration -= 2 * gamma * v
+  return acceleration
+
+
+def HeartExact(t, omega0, gamma, F0=0.0, omegaF=0.0, x0=1.0, v0=0.0):
+  """
+  Exact underdamped (optionally forced) solution of x'' + 2 * gamma * x' + omega0^2 * x = F0 * cos(omegaF * t).
+  """
+  D = (omega0 ** 2 - omegaF ** 2) ** 2 + (2 * gamma * omegaF) ** 2
+  a, b = F0 * (omega0 ** 2 - omegaF ** 2) / D, F0 * 2 * gamma * omegaF / D  # Particular solution.
+  omegad = np.sqrt(omega0 ** 2 - gamma ** 2)
+  A = x0 - a
+  B = (v0 - b * omegaF + gamma * A) / omegad
+  return (
+    np.exp(-gamma * t) * (A * np.cos(omegad * t) + B * np.sin(omegad * t)) +
+    a * np.cos(omegaF * t) + b * np.sin(omegaF * t)
+  )
+
+
+# Simulation parameters.
+omega0 = 2 * np.pi  # Natural frequency (1 Hz).
+y0 = [1.0, 0.0]  # Initial displacement and velocity.
+
+# ==============================================================
+# ========== Long-Horizon Undamped Oscillation (Energy) ========
+# ==============================================================
+h = 0.05  # Large step size (20 steps per period).
+tSpan = (0, 1000)  # 1000 periods.
+undamped = lambda t, x, v: HeartAcceleration(t, x, v, omega0, 0.0)
+energy = lambda x, v: 0.5 * v ** 2 + 0.5 * omega0 ** 2 * x ** 2  # Conserved energy of the undamped case.
+E0 = energy(*y0)
+
+table = pt.PrettyTable()
+table.field_names = ["Method", "Evaluations per Step", "Max |E - E0| / E0", "Final |E - E0| / E0"]
+energyCurves = {}
+for name, solver, evaluations in [
+  ("RK4 (first-order system)", lambda: RungeKutta4(undamped, *y0, h, tSpan), 4),
+  ("Störmer-Verlet", lambda: StormerVerlet(undamped, *y0, h, tSpan), 1),
+  ("RKN4 (3 stages)", lambda: RungeKuttaNystrom4(undamped, *y0, h, tSpan, velocityDependent=False), 3),
+]:
+  t, x, v = solver()
+  drift = np.abs(energy(x, v) - E0) / E0
+  energyCurves[name] = (t, drift)
+  table.add_row([name, evaluations, f"{drift.max():.3e}", f"{drift[-1]:.3e}"])
+print(f"Undamped oscillation, h = {h}, {tSpan[1]} periods:")
+print(table)
+
+# ==============================================================
+# ============== Damped and Forced Oscillations ================
+# ==============================================================
+table = pt.PrettyTable()
+table.field_names = ["Case", "Method", "h", "Evaluations", "Max Error"]
+tSpan = (0, 20)
+for case, gamma, F0, omegaF in [
+  ("Underdamped", 0.5, 0.0, 0.0),
+  ("Forced Oscillation", 0.5, 1.0, 2 * np.pi),
+]:
+  accel = lambda t, x, v: HeartAcceleration(t, x, v, omega0, gamma, F0, omegaF)
+  for h in [0.05, 0.01]:
+    for name, solver, evaluations in [
+      ("RK4 (first-order system)", RungeKutta4, 4),
+      ("RKN4 (4 stages)", RungeKuttaNystrom4, 4),
+    ]:
+      t, x, v = solver(accel, *y0, h, tSpan)
+      error = np.max(np.abs(x - HeartExact(t, omega0, gamma, F0, omegaF, *y0)))
+      table.add_row([case, name, h, evaluations * (len(t) - 1), f"{error:.3e}"])
+print("Damped and forced oscillations:")
+print(table)
+
+# Plot the relative energy error of the undamped runs.
+plt.figure(figsize=(10, 5))  # Create a figure with a specified size.
+for name, (t, drift) in energyCurves.items():
+  plt.semilogy(t[::20], drift[::20] + 1e-16, label=name)
+plt.title("Undamped Heart Oscillation: Energy Error (h = 0.05)")  # Set the plot title.
+plt.xlabel("Time (t)")  # Label the x-axis as time.
+plt.ylabel("Relative Energy Error |E - E0| / E0")  # Label the y-axis.
+plt.grid(True)  # Enable the grid for better readability.
+plt.legend()  # Show the legend on the plot.
+plt.tight_layout()  # Adjust the layout to prevent overlap of labels and titles.
+
+# Save the plot as a PNG file with high resolution for inclusion in lecture notes.
+plt.savefig("Lecture_04_Lab_Exercise_4_SecondOrder.png", dpi=300, bbox_inches="tight")
+
+# Display the plot interactively.
+plt.show()
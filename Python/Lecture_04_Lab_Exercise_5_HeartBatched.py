@@ -0,0 +1,153 @@
+'''
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+'''
+
+# Import necessary libraries.
+import time
+import numpy as np
+import prettytable as pt
+from scipy.integrate import solve_ivp
+
+
+def HeartOscillations(t, y, omega0, gamma, F0=0.0, omegaF=0.0):
+  """
+  Defines the system of ordinary differential equations (ODEs) for the heart oscillations.
+
+  Parameters:
+  t (float): Time variable.
+  y (list): List containing the state variables [x, v].
+  omega0 (float): Natural frequency.
+  gamma (float): Damping coefficient.
+  F0 (float): Amplitude of the forcing function (default is 0).
+  omegaF (float): Frequency of the forcing function (default is 0).
+
+  Returns:
+  list: Derivatives [dx/dt, dv/dt].
+  """
+  x, v = y  # Unpack the state variables.
+  # Derivative of displacement is velocity.
+  dxdt = v
+  # Derivative of velocity is acceleration with damping and forcing term.
+  dvdt = -2 * gamma * v - omega0 ** 2 * x + F0 * np.cos(omegaF * t)
+  return [dxdt, dvdt]
+
+
+def HeartOscillationsBatched(t, Y, omega0, gamma, F0, omegaF):
+  """
+  Vectorized right-hand side for N heart oscillation scenarios stacked in one block state.
+
+  Parameters:
+  t (float): Time variable.
+  Y (numpy.ndarray): Block state [x_1, ..., x_N, v_1, ..., v_N] with shape (2N,) or (2N, k)
+    (solve_ivp passes k columns when vectorized=True).
+  omega0 (numpy.ndarray): Natural frequencies with shape (N,).
+  gamma (numpy.ndarray): Damping coefficients with shape (N,).
+  F0 (numpy.ndarray): Forcing amplitudes with shape (N,).
+  omegaF (numpy.ndarray): Forcing frequencies with shape (N,).
+
+  Returns:
+  numpy.ndarray: Derivatives in the same block layout and shape as Y.
+  """
+  N = len(gamma)
+  x, v = Y[:N], Y[N:]  # Unpack the displacement and velocity blocks.
+  column = (slice(None),) + (np.newaxis,) * (Y.ndim - 1)  # Broadcast parameters over the k columns.
+  # Derivative of displacement is velocity.
+  dxdt = v
+  # Derivative of velocity is acceleration with damping and forcing term.
+  dvdt = -2 * gamma[column] * v - (omega0 ** 2)[column] * x + (F0 * np.cos(omegaF * t))[column]
+  return np.concatenate([dxdt, dvdt])
+
+
+def SolveHeartOscillationsBatched(omega0, gamma, F0, omegaF, y0, tSpan, tEval, **options):
+  """
+  Integrates all heart oscillation scenarios in a single solve_ivp call.
+
+  All scenarios share the step-size sequence, which is chosen from the RMS error norm of
+  the whole block; tighten rtol when comparing against per-scenario runs.
+
+  Parameters:
+  omega0, gamma, F0, omegaF (float or array-like): Natural frequency, damping, forcing amplitude and
+    frequency; scalars are shared by all scenarios, arrays give one value per scenario.
+  y0 (list): Initial displacement and velocity (shared by all scenarios).
+  tSpan (tuple): Time span for the simulation.
+  tEval (numpy.ndarray): Time points at which to store the computed solution.
+  **options: Further solve_ivp options (method, rtol, atol).
+
+  Returns:
+  t (numpy.ndarray): Time points.
+  x (numpy.ndarray): Displacements with shape (N, len(t)).
+  v (numpy.ndarray): Velocities with shape (N, len(t)).
+  """
+  omega0, gamma, F0, omegaF = np.broadcast_arrays(
+    *(np.asarray(p, dtype=float) for p in (omega0, gamma, F0, omegaF))
+  )
+  N = gamma.size
+  Y0 = np.concatenate([np.full(N, y0[0], dtype=float), np.full(N, y0[1], dtype=float)])
+  sol = solve_ivp(
+    HeartOscillationsBatched, tSpan, Y0, t_eval=tEval, vectorized=True,
+    args=(omega0.ravel(), gamma.ravel(), F0.ravel(), omegaF.ravel()), **options,
+  )
+  return sol.t, sol.y[:N], sol.y[N:]
+
+
+# Simulation parameters of Lecture_04_Lab_Exercise_3_Heart.py.
+omega0 = 2 * np.pi  # Natural frequency (1 Hz).
+y0 = [1.0, 0.0]  # Initial displacement and velocity.
+tSpan = (0, 20)  # Time span for the simulation.
+tEval = np.linspace(*tSpan, 1000)  # Time points at which to store the solution.
+scenarios = {
+  "Undamped"          : {"Gamma": 0.0, "F0": 0.0, "OmegaF": 0.0},
+  "Underdamped"       : {"Gamma": 0.5, "F0": 0.0, "OmegaF": 0.0},
+  "Critically Damped" : {"Gamma": 2 * np.pi, "F0": 0.0, "OmegaF": 0.0},
+  "Overdamped"        : {"Gamma": 3 * np.pi, "F0": 0.0, "OmegaF": 0.0},
+  "Forced Oscillation": {"Gamma": 0.5, "F0": 1.0, "OmegaF": 2 * np.pi},
+}
+
+# Check the batched solution against one solve_ivp call per scenario.
+t, x, v = SolveHeartOscillationsBatched(
+  omega0,
+  [params["Gamma"] for params in scenarios.values()],
+  [params["F0"] for params in scenarios.values()],
+  [params["OmegaF"] for params in scenarios.values()],
+  y0, tSpan, tEval, rtol=1e-6, atol=1e-9,
+)
+table = pt.PrettyTable()
+table.field_names = ["Scenario", "Max |Difference| in x(t)"]
+for i, (name, params) in enumerate(scenarios.items()):
+  sol = solve_ivp(
+    lambda t, y: HeartOscillations(t, y, omega0, params["Gamma"], F0=params["F0"], omegaF=params["OmegaF"]),
+    tSpan, y0, t_eval=tEval, rtol=1e-6, atol=1e-9,
+  )
+  table.add_row([name, f"{np.max(np.abs(sol.y[0] - x[i])):.2e}"])
+print(table)
+
+# Cardiac studies sweep many damping/forcing combinations: compare one call per scenario
+# with a single batched call over a grid of damping and forcing values.
+table = pt.PrettyTable()
+table.field_names = ["Scenarios", "Batched Call (s)", "One Call per Scenario (s)", "Speedup"]
+for nGamma, nF0, runLoop in [(10, 10, True), (40, 25, False)]:
+  gammaGrid, F0Grid = np.meshgrid(np.linspace(0.0, 3 * np.pi, nGamma), np.linspace(0.0, 2.0, nF0))
+  start = time.perf_counter()
+  SolveHeartOscillationsBatched(omega0, gammaGrid.ravel(), F0Grid.ravel(), 2 * np.pi, y0, tSpan, tEval,
+                                rtol=1e-6, atol=1e-9)
+  batchTime = time.perf_counter() - start
+  loopTime = None
+  if (runLoop):
+    start = time.perf_counter()
+    for gamma, F0 in zip(gammaGrid.ravel(), F0Grid.ravel()):
+      solve_ivp(
+        lambda t, y: HeartOscillations(t, y, omega0, gamma, F0=F0, omegaF=2 * np.pi),
+        tSpan, y0, t_eval=tEval, rtol=1e-6, atol=1e-9,
+      )
+    loopTime = time.perf_counter() - start
+  table.add_row([
+    gammaGrid.size, f"{batchTime:.2f}", "-" if (loopTime is None) else f"{loopTime:.2f}",
+    "-" if (loopTime is None) else f"{loopTime / batchTime:.1f}x",
+  ])
+print(table)
@@ -0,0 +1,234 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+from scipy.linalg import expm
+from scipy.integrate import solve_ivp
+
+
+def DrugStateMatrix(k):
+  """
+  State matrix of the drug elimination model dC/dt = -k * C.
+
+  Parameters:
+  k (float): Elimination rate constant.
+
+  Returns:
+  numpy.ndarray: The (1, 1) state matrix.
+  """
+  return np.array([[-k]], dtype=float)
+
+
+def OscillatorStateMatrix(stiffness, damping, F0=0.0, omegaF=0.0):
+  """
+  State matrix of x'' + damping * x' + stiffness * x = F0 * cos(omegaF * t).
+
+  The forcing term is generated exactly by two extra states [cos(omegaF * t), sin(omegaF * t)],
+  which obey a linear ODE themselves. The exponential of the augmented matrix therefore
+  contains the particular-solution operator in its upper-right (2, 2) block.
+
+  Parameters:
+  stiffness (float): Coefficient of x (omega0^2 for the heart, k for the knee).
+  damping (float): Coefficient of x' (2 * gamma for the heart, c for the knee).
+  F0 (float): Amplitude of the forcing function (default is 0).
+  omegaF (float): Frequency of the forcing function (default is 0).
+
+  Returns:
+  numpy.ndarray: (2, 2) state matrix for the unforced case and (4, 4) otherwise.
+  """
+  if (F0 == 0.0):
+    return np.array([
+      [0.0, 1.0],
+      [-stiffness, -damping],
+    ])
+  return np.array([
+    [0.0, 1.0, 0.0, 0.0],  # dx/dt = v.
+    [-stiffness, -damping, F0, 0.0],  # dv/dt = -stiffness * x - damping * v + F0 * cos.
+    [0.0, 0.0, 0.0, -omegaF],  # d(cos)/dt = -omegaF * sin.
+    [0.0, 0.0, omegaF, 0.0],  # d(sin)/dt = omegaF * cos.
+  ])
+
+
+def HeartStateMatrix(omega0, gamma, F0=0.0, omegaF=0.0):
+  """
+  State matrix of HeartOscillations (Lecture_04_Lab_Exercise_3_Heart.py).
+  """
+  return OscillatorStateMatrix(omega0 ** 2, 2 * gamma, F0, omegaF)
+
+
+def KneeStateMatrix(c, k, F0=0.0, omegaF=0.0):
+  """
+  State matrix of KneeModel (Lecture_05_Lab_Exercise_1_Knee.py) with unit mass.
+  """
+  return OscillatorStateMatrix(k, c, F0, omegaF)
+
+
+def AugmentedInitialState(y0, t0=0.0, omegaF=0.0):
+  """
+  Appends the forcing states [cos(omegaF * t0), sin(omegaF * t0)] to the initial condition.
+
+  Parameters:
+  y0 (array-like): Initial displacement and velocity [x0, v0].
+  t0 (float): Initial time.
+  omegaF (float): Frequency of the forcing function.
+
+  Returns:
+  numpy.ndarray: The augmented initial state [x0, v0, cos, sin].
+  """
+  return np.array([*y0, np.cos(omegaF * t0), np.sin(omegaF * t0)], dtype=float)
+
+
+def PropagateLinear(A, y0, h, nSteps, scan=True):
+  """
+  Exact solution of y' = A y on the uniform grid t_i = i * h.
+
+  The propagator expm(A * h) is computed once. With scan=False the trajectory is
+  produced with one matrix-vector product per step. With scan=True the steps are
+  doubled with the powers Phi^(2^j), so the whole trajectory needs only log2(nSteps)
+  large matrix products.
+
+  Parameters:
+  A (numpy.ndarray): State matrix (d, d) or a batch of state matrices (N, d, d).
+  y0 (numpy.ndarray): Initial state (d,) or a batch of initial states (N, d).
+  h (float): Time step.
+  nSteps (int): Number of grid points including the initial one.
+  scan (bool): Use the doubling power scan (default is True).
+
+  Returns:
+  numpy.ndarray: Trajectory with shape (nSteps, d) or (nSteps, N, d).
+  """
+  batched = (np.ndim(A) == 3)
+  A = A if batched else A[None]
+  y0 = np.atleast_2d(np.asarray(y0, dtype=float))
+  y0 = np.broadcast_to(y0, (A.shape[0], A.shape[1]))
+  Phi = expm(A * h)  # One-step propagator for every system in the batch.
+
+  Y = np.empty((nSteps, *y0.shape))
+  Y[0] = y0
+  if (scan):
+    filled, power = 1, Phi
+    while (filled < nSteps):
+      count = min(filled, nSteps - filled)
+      # Y[filled + i] = Phi^filled @ Y[i] for all i < count at once.
+      Y[filled:filled + count] = np.einsum("nij,snj->sni", power, Y[:count])
+      filled += count
+      power = power @ power
+  else:
+    for i in range(nSteps - 1):
+      Y[i + 1] = np.einsum("nij,nj->ni", Phi, Y[i])
+
+  return Y if batched else Y[:, 0]
+
+
+def HeartOscillations(t, y, omega0, gamma, F0=0.0, omegaF=0.0):
+  """
+  Defines the system of ordinary differential equations (ODEs) for the heart oscillations.
+  """
+  x, v = y  # Unpack the state variables.
+  dxdt = v
+  dvdt = -2 * gamma * v - omega0 ** 2 * x + F0 * np.cos(omegaF * t)
+  return [dxdt, dvdt]
+
+
+def KneeModel(t, y, c, k, F0=0.0, omegaF=0.0):
+  """
+  Defines the system of ordinary differential equations (ODEs) for the knee model.
+  """
+  x, v = y  # Unpack the state variables.
+  dxdt = v
+  dvdt = -c * v - k * x + F0 * np.cos(omegaF * t)
+  return [dxdt, dvdt]
+
+
+# ==============================================================
+# ===================== Drug Elimination =======================
+# ==============================================================
+kDrug, C0 = 0.5, 10.0  # Elimination rate and initial concentration.
+tDrug = np.linspace(0, 20, 100)
+CDrug = PropagateLinear(DrugStateMatrix(kDrug), [C0], tDrug[1] - tDrug[0], len(tDrug))[:, 0]
+print(f"Drug elimination max error: {np.max(np.abs(CDrug - C0 * np.exp(-kDrug * tDrug))):.3e}")
+
+# ==============================================================
+# ================= Forced Knee Model (Lecture 05) =============
+# ==============================================================
+c, k, F0, omegaF = 0.5, 4.0, 2.0, 3.0  # Damping, stiffness, forcing amplitude and frequency.
+y0 = [0.1, 0.0]  # Initial displacement and velocity.
+tEval = np.linspace(0, 50, 2500)
+h = tEval[1] - tEval[0]
+
+start = time.perf_counter()
+kneeExact = PropagateLinear(KneeStateMatrix(c, k, F0, omegaF), AugmentedInitialState(y0, 0.0, omegaF), h, len(tEval))
+timeExact = time.perf_counter() - start
+
+start = time.perf_counter()
+kneeReference = solve_ivp(
+  KneeModel, (0, 50), y0, args=(c, k, F0, omegaF), t_eval=tEval, rtol=1e-12, atol=1e-12, method="DOP853",
+)
+timeReference = time.perf_counter() - start
+
+# Pre-derived analytical solution from Lecture 05 (coefficients rounded to three digits).
+partA = np.exp(-0.25 * tEval) * (0.467 * np.cos(1.984 * tEval) - 0.107 * np.sin(1.984 * tEval))
+partB = -0.367 * np.cos(3 * tEval) + 0.11 * np.sin(3 * tEval)
+
+print(f"Knee model: matrix exponential took {timeExact:.4f} s, DOP853 (rtol = 1e-12) took {timeReference:.4f} s.")
+print(f"Knee model: max |expm - DOP853| = {np.max(np.abs(kneeExact[:, 0] - kneeReference.y[0])):.3e}")
+print(f"Knee model: max |expm - (partA + partB)| = {np.max(np.abs(kneeExact[:, 0] - partA - partB)):.3e}")
+
+# ==============================================================
+# ============ Damping Sweep of HeartOscillations ==============
+# ==============================================================
+omega0 = 2 * np.pi  # Natural frequency (1 Hz).
+gammas = np.linspace(0.0, 3 * np.pi, 1000)  # Damping coefficients to sweep.
+tHeart = np.linspace(0, 20, 1000)
+
+start = time.perf_counter()
+AHeart = np.array([HeartStateMatrix(omega0, gamma) for gamma in gammas])
+heartSweep = PropagateLinear(AHeart, [1.0, 0.0], tHeart[1] - tHeart[0], len(tHeart))
+timeSweep = time.perf_counter() - start
+
+# Time a handful of adaptive RK45 runs and extrapolate to the full sweep.
+subset = 20
+start = time.perf_counter()
+for gamma in gammas[:subset]:
+  solve_ivp(HeartOscillations, (0, 20), [1.0, 0.0], args=(omega0, gamma), t_eval=tHeart)
+timeRK45 = (time.perf_counter() - start) * len(gammas) / subset
+print(f"Heart sweep ({len(gammas)} damping values): matrix exponential took {timeSweep:.3f} s, "
+      f"RK45 would take about {timeRK45:.3f} s.")
+
+# Undamped check against the closed form x(t) = cos(omega0 * t).
+print(f"Undamped heart max error: {np.max(np.abs(heartSweep[:, 0, 0] - np.cos(omega0 * tHeart))):.3e}")
+
+# Plot the knee model and the damping sweep.
+plt.figure(figsize=(14, 6))
+plt.subplot(1, 2, 1)
+plt.plot(tEval, kneeExact[:, 0], label="Matrix Exponential", linewidth=2, color="black")
+plt.plot(tEval, partA + partB, label="Analytical Solution (Lecture 05)", linewidth=1.5, color="red", linestyle="--")
+plt.xlabel("Time (t)")  # Label the x-axis as time.
+plt.ylabel("Displacement x(t)")  # Label the y-axis as displacement.
+plt.grid(True)  # Enable the grid for better readability.
+plt.legend()  # Show the legend on the plot.
+plt.title("Knee Model: Exact Matrix-Exponential Propagation")
+
+plt.subplot(1, 2, 2)
+plt.pcolormesh(tHeart, gammas, heartSweep[:, :, 0].T, shading="auto", cmap="coolwarm")
+plt.colorbar(label="Displacement x(t)")
+plt.xlabel("Time (t)")  # Label the x-axis as time.
+plt.ylabel("Damping Coefficient (gamma)")  # Label the y-axis as damping.
+plt.title("Heart Oscillations: Damping Sweep")
+plt.tight_layout()  # Adjust the layout to prevent overlap of labels and titles.
+
+# Save the figure to a PNG file for inclusion in lecture notes.
+plt.savefig("Lecture_05_Lab_Exercise_2_MatrixExponential.png", dpi=300, bbox_inches="tight")
+
+# Display the plot interactively.
+plt.show()
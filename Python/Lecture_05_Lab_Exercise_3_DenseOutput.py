@@ -0,0 +1,211 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.integrate import solve_ivp, RK23, RK45, DOP853
+
+# Step-by-step solver classes. RK23 and RK45 expose their native dense-output polynomials.
+SOLVERS = {"RK23": RK23, "RK45": RK45, "DOP853": DOP853}
+
+
+class DenseTrajectory:
+  """
+  Compact trajectory that stores only the accepted steps and the coefficients of
+  their interpolants in contiguous arrays, and evaluates the solution at any times.
+
+  With kind="hermite" the nodes hold the states and their derivatives and the
+  solution is rebuilt with cubic Hermite interpolation. With kind="native" each step
+  holds the coefficient matrix Q of the Runge-Kutta dense-output polynomial
+  y(t_i + s * h_i) = y_i + h_i * Q_i @ [s, s^2, ..., s^p].
+  """
+
+  def __init__(self, t, y, coefficients, kind):
+    self.t = t  # Accepted step boundaries with shape (M + 1,).
+    self.y = y  # States at the boundaries with shape (M + 1, d).
+    self.coefficients = coefficients  # Derivatives (M + 1, d) or Q matrices (M, d, p).
+    self.kind = kind
+
+  def __call__(self, tQuery):
+    return self.Evaluate(tQuery)
+
+  def Evaluate(self, tQuery):
+    """
+    Evaluates the trajectory at an array of times inside the integration interval.
+
+    Parameters:
+    tQuery (array-like): Times at which to evaluate the solution.
+
+    Returns:
+    numpy.ndarray: States with shape (len(tQuery), d).
+    """
+    tQuery = np.atleast_1d(np.asarray(tQuery, dtype=float))
+    # Index of the step that contains each query time.
+    idx = np.clip(np.searchsorted(self.t, tQuery, side="right") - 1, 0, len(self.t) - 2)
+    h = (self.t[idx + 1] - self.t[idx])[:, None]
+    s = (tQuery[:, None] - self.t[idx, None]) / h
+    if (self.kind == "hermite"):
+      h00 = 2 * s ** 3 - 3 * s ** 2 + 1
+      h10 = s ** 3 - 2 * s ** 2 + s
+      h01 = -2 * s ** 3 + 3 * s ** 2
+      h11 = s ** 3 - s ** 2
+      return (
+        h00 * self.y[idx] + h10 * h * self.coefficients[idx] +
+        h01 * self.y[idx + 1] + h11 * h * self.coefficients[idx + 1]
+      )
+    powers = np.cumprod(np.repeat(s, self.coefficients.shape[2], axis=1), axis=1)
+    return self.y[idx] + h * np.einsum("mdp,mp->md", self.coefficients[idx], powers)
+
+  def Nbytes(self):
+    """
+    Number of bytes held by the stored arrays.
+    """
+    return self.t.nbytes + self.y.nbytes + self.coefficients.nbytes
+
+
+def IntegrateDense(f, tSpan, y0, kind="hermite", method="RK45", **options):
+  """
+  Integrates an ODE and returns a DenseTrajectory instead of values on a t_eval grid.
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  tSpan (tuple): Time span for the solution.
+  y0 (array-like): Initial condition.
+  kind (str): Interpolant to store ("hermite" or "native").
+  method (str): Step-by-step solver in SOLVERS ("native" needs RK23 or RK45).
+  **options: Extra options passed to the solver (rtol, atol, max_step, ...).
+
+  Returns:
+  DenseTrajectory: The compact trajectory.
+  """
+  solver = SOLVERS[method](f, tSpan[0], np.asarray(y0, dtype=float), tSpan[1], **options)
+  d = solver.n
+  if (kind == "native") and (method == "DOP853"):
+    raise ValueError("The native interpolant is only available for RK23 and RK45.")
+
+  # Contiguous buffers that double in size when full (amortized O(1) appends).
+  capacity = 256
+  t = np.empty(capacity)
+  y = np.empty((capacity, d))
+  if (kind == "hermite"):
+    coefficients = np.empty((capacity, d))
+    coefficients[0] = solver.f
+  else:
+    coefficients = np.empty((capacity, d, solver.P.shape[1]))  # Degree of the dense-output polynomial.
+  t[0], y[0] = solver.t, solver.y
+  count = 1
+
+  while (solver.status == "running"):
+    solver.step()
+    if (solver.status == "failed"):
+      raise RuntimeError(f"Solver failed at t = {solver.t}.")
+    if (count == capacity):
+      capacity *= 2
+      t = np.resize(t, capacity)
+      y = np.resize(y, (capacity, d))
+      coefficients = np.resize(coefficients, (capacity, *coefficients.shape[1:]))
+    t[count], y[count] = solver.t, solver.y
+    if (kind == "hermite"):
+      coefficients[count] = solver.f  # Derivative at the new node (FSAL stage).
+    else:
+      coefficients[count - 1] = solver.dense_output().Q
+    count += 1
+
+  coefficients = coefficients[:count] if (kind == "hermite") else coefficients[:count - 1]
+  return DenseTrajectory(t[:count].copy(), y[:count].copy(), coefficients.copy(), kind)
+
+
+def KneeModel(t, y, c, k, F0=0.0, omegaF=0.0):
+  """
+  Defines the system of ordinary differential equations (ODEs) for the knee model.
+  """
+  x, v = y  # Unpack the state variables.
+  dxdt = v
+  dvdt = -c * v - k * x + F0 * np.cos(omegaF * t)
+  return [dxdt, dvdt]
+
+
+def lorenz(t, y, sigma=10, beta=8 / 3, rho=28):
+  """
+  Function to compute the derivatives for the Lorenz-type neuron model.
+  """
+  x, y, z = y
+  dxdt = sigma * (y - x)
+  dydt = x * (rho - z) - y
+  dzdt = x * y - beta * z
+  return [dxdt, dydt, dzdt]
+
+
+# Physical parameters for the knee model (Lecture_05_Lab_Exercise_1_Knee.py).
+c, k, F0, omega0 = 0.5, 4.0, 2.0, 3  # Damping, stiffness, forcing amplitude and frequency.
+y0 = [0.1, 0.0]  # Initial displacement and velocity.
+tSpan = (0, 50)  # Time span for the simulation.
+tEval = np.linspace(*tSpan, 2500)
+knee = lambda t, y: KneeModel(t, y, c, k, F0=F0, omegaF=omega0)
+
+# Analytical solution from Lecture 05.
+partA = np.exp(-0.25 * tEval) * (0.467 * np.cos(1.984 * tEval) - 0.107 * np.sin(1.984 * tEval))
+partB = -0.367 * np.cos(3 * tEval) + 0.11 * np.sin(3 * tEval)
+analyticalSolution = partA + partB
+
+# Compare storage and accuracy of the t_eval grid and the compact trajectories.
+table = pt.PrettyTable()
+table.field_names = ["Model", "Storage", "Stored Floats", "Reduction", "Max |Difference|"]
+
+kneeGrid = solve_ivp(knee, tSpan, y0, t_eval=tEval)
+gridFloats = kneeGrid.t.size + kneeGrid.y.size
+table.add_row(["Knee", "solve_ivp t_eval (2500 points)", gridFloats, "1.0x", "-"])
+for kind in ["hermite", "native"]:
+  trajectory = IntegrateDense(knee, tSpan, y0, kind=kind)
+  floats = trajectory.Nbytes() // 8
+  difference = np.max(np.abs(trajectory(tEval)[:, 0] - kneeGrid.y[0]))
+  table.add_row(["Knee", f"DenseTrajectory ({kind})", floats, f"{gridFloats / floats:.1f}x", f"{difference:.2e}"])
+kneeTrajectory = IntegrateDense(knee, tSpan, y0, kind="hermite")
+
+# Chaotic Lorenz model on the 10000-point grid of the Lecture 08 lab.
+tLorenz = np.linspace(0, 40, 10000)
+lorenzGrid = solve_ivp(lorenz, (0, 40), [0.0, 1.0, 2.0], t_eval=tLorenz)
+gridFloats = lorenzGrid.t.size + lorenzGrid.y.size
+table.add_row(["Lorenz", "solve_ivp t_eval (10000 points)", gridFloats, "1.0x", "-"])
+for kind in ["hermite", "native"]:
+  lorenzTrajectory = IntegrateDense(lorenz, (0, 40), [0.0, 1.0, 2.0], kind=kind)
+  floats = lorenzTrajectory.Nbytes() // 8
+  difference = np.max(np.abs(lorenzTrajectory(tLorenz) - lorenzGrid.y.T))
+  table.add_row([
+    "Lorenz", f"DenseTrajectory ({kind})", floats, f"{gridFloats / floats:.1f}x", f"{difference:.2e}",
+  ])
+print(table)
+
+# Resample the knee trajectory at 10x the original resolution without integrating again.
+tFine = np.linspace(*tSpan, 25000)
+xFine = kneeTrajectory(tFine)[:, 0]
+
+# Create a figure and plot the analytical solution with the resampled trajectory.
+plt.figure(figsize=(10, 6))
+plt.plot(tEval, analyticalSolution, label="Analytical Solution", linewidth=2, color="black")
+plt.plot(tFine, xFine, label="Dense Trajectory (Resampled 25000 Points)", linewidth=1.5, color="red", linestyle="--")
+plt.plot(
+  kneeTrajectory.t, kneeTrajectory.y[:, 0], "bo", markersize=3,
+  label=f"Stored Steps ({len(kneeTrajectory.t)})",
+)
+plt.xlabel("Time (t)")  # Label the x-axis as time.
+plt.ylabel("Displacement x(t)")  # Label the y-axis as displacement.
+plt.grid(True)  # Enable the grid for better readability.
+plt.legend()  # Show the legend on the plot.
+plt.tight_layout()  # Adjust the layout to prevent overlap of labels and titles.
+plt.title("Knee Model: Compact Dense-Output Trajectory")  # Set the title of the plot.
+
+# Save the figure to a PNG file for inclusion in lecture notes.
+plt.savefig("Lecture_05_Lab_Exercise_3_DenseOutput.png", dpi=300, bbox_inches="tight")
+
+# Display the plot interactively.
+plt.show()
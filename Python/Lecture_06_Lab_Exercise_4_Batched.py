@@ -0,0 +1,259 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+
+# Butcher tableaus (A, b, c) of the explicit fixed-step methods.
+# Euler, Heun (Improved Euler) and RK4 all plug into the same stepper below.
+TABLEAUS = {
+  "Euler": (
+    np.array([[0.0]]),
+    np.array([1.0]),
+    np.array([0.0]),
+  ),
+  "Heun" : (
+    np.array([
+      [0.0, 0.0],
+      [1.0, 0.0],
+    ]),
+    np.array([0.5, 0.5]),
+    np.array([0.0, 1.0]),
+  ),
+  "RK4"  : (
+    np.array([
+      [0.0, 0.0, 0.0, 0.0],
+      [0.5, 0.0, 0.0, 0.0],
+      [0.0, 0.5, 0.0, 0.0],
+      [0.0, 0.0, 1.0, 0.0],
+    ]),
+    np.array([1.0, 2.0, 2.0, 1.0]) / 6.0,
+    np.array([0.0, 0.5, 0.5, 1.0]),
+  ),
+}
+
+
+def FixedStepIntegrator(f, y0, params, h, tSpan, method="RK4"):
+  """
+  Advances N trajectories of an ODE system in lockstep with an explicit
+  Runge-Kutta method given by its Butcher tableau.
+
+  Parameters:
+  f (function): Vectorized right-hand side f(t, Y, P) returning an array shaped like Y.
+  y0 (array-like): Initial conditions with shape (N, d).
+  params (array-like): Parameter sets with shape (N, p), one row per trajectory (or None).
+  h (float): Time step.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+  method (str): Name of the tableau in TABLEAUS ("Euler", "Heun" or "RK4").
+
+  Returns:
+  t (numpy.ndarray): Time vector with shape (steps,).
+  Y (numpy.ndarray): Solution values with shape (steps, N, d).
+  """
+  A, b, c = TABLEAUS[method]
+  stages = len(b)
+
+  # Time vector (same convention as the Lecture 06 methods).
+  t = np.arange(*tSpan, h)
+  y0 = np.atleast_2d(np.asarray(y0, dtype=float))
+  if (params is not None):
+    params = np.atleast_2d(np.asarray(params, dtype=float))
+
+  # Preallocate the solution and the stage derivatives for all trajectories.
+  Y = np.zeros((len(t), *y0.shape))
+  Y[0] = y0
+  K = np.zeros((stages, *y0.shape))
+
+  # Every operation inside the loop acts on the whole (N, d) block at once.
+  for i in range(len(t) - 1):
+    for s in range(stages):
+      # Stage value: y_i + h * sum_j A[s, j] * K[j] over the previous stages.
+      yStage = Y[i] + h * np.tensordot(A[s, :s], K[:s], axes=(0, 0))
+      K[s] = f(t[i] + c[s] * h, yStage, params)
+    Y[i + 1] = Y[i] + h * np.tensordot(b, K, axes=(0, 0))
+
+  return t, Y
+
+
+def DrugElimination(t, C, params):
+  """
+  Vectorized right-hand side of the drug elimination ODE dC/dt = -k * C.
+
+  Parameters:
+  t (float): Time variable (not used in this case).
+  C (numpy.ndarray): Concentrations with shape (N, 1).
+  params (numpy.ndarray): Rate constants with shape (N, 1).
+
+  Returns:
+  numpy.ndarray: Derivatives with shape (N, 1).
+  """
+  return -params[:, 0:1] * C
+
+
+def SolveDrugElimination(C0, k, h, tSpan, method):
+  """
+  Shared driver of the drug elimination wrappers below.
+
+  Returns the concentration as a vector for scalar inputs (as in the previous exercises)
+  and as a (steps, N) matrix when arrays of C0 and/or k are given.
+  """
+  C0, k = np.broadcast_arrays(np.asarray(C0, dtype=float), np.asarray(k, dtype=float))
+  t, C = FixedStepIntegrator(
+    DrugElimination,  # Vectorized RHS.
+    C0.reshape(-1, 1),  # Initial concentrations as (N, 1).
+    k.reshape(-1, 1),  # Rate constants as (N, 1).
+    h,  # Time step.
+    tSpan,  # Time span.
+    method=method,  # Butcher tableau.
+  )
+  C = C[:, :, 0]
+  if (C0.ndim == 0):
+    C = C[:, 0]
+  return t, C
+
+
+def EulerMethod(C0, k, h, tSpan):
+  """
+  Implements Euler's method for the drug elimination ODE on top of the batched engine.
+
+  Parameters:
+  C0 (float or array-like): Initial concentration(s) of the drug in mg/L.
+  k (float or array-like): Rate constant(s) for drug elimination in 1/h.
+  h (float): Time step for Euler's method in hours.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+
+  Returns:
+  tEuler (numpy.ndarray): Time vector for Euler's method.
+  CEuler (numpy.ndarray): Concentration values, (steps,) or (steps, N).
+  """
+  return SolveDrugElimination(C0, k, h, tSpan, "Euler")
+
+
+def ImprovedEulerMethod(C0, k, h, tSpan):
+  """
+  Implements the Improved Euler's method (Heun's method) for the drug elimination ODE
+  on top of the batched engine.
+
+  Parameters:
+  C0 (float or array-like): Initial concentration(s) of the drug in mg/L.
+  k (float or array-like): Rate constant(s) for drug elimination in 1/h.
+  h (float): Time step for Improved Euler's method in hours.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+
+  Returns:
+  tImprovedEuler (numpy.ndarray): Time vector for Improved Euler's method.
+  CImprovedEuler (numpy.ndarray): Concentration values, (steps,) or (steps, N).
+  """
+  return SolveDrugElimination(C0, k, h, tSpan, "Heun")
+
+
+def RungeKutta4(C0, k, h, tSpan):
+  """
+  Implements the Runge-Kutta 4th order method for the drug elimination ODE
+  on top of the batched engine.
+
+  Parameters:
+  C0 (float or array-like): Initial concentration(s) of the drug in mg/L.
+  k (float or array-like): Rate constant(s) for drug elimination in 1/h.
+  h (float): Time step for Runge-Kutta method in hours.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+
+  Returns:
+  tRK4 (numpy.ndarray): Time vector for Runge-Kutta method.
+  CRK4 (numpy.ndarray): Concentration values, (steps,) or (steps, N).
+  """
+  return SolveDrugElimination(C0, k, h, tSpan, "RK4")
+
+
+def RungeKutta4Loop(C0, k, h, tSpan):
+  """
+  Reference implementation from Lecture_06_Lab_Exercise_3_RK4.py (one patient per call).
+  """
+  tRK4 = np.arange(*tSpan, h)
+  CRK4 = np.zeros(len(tRK4))
+  CRK4[0] = C0
+  for i in range(len(tRK4) - 1):
+    k1 = -k * CRK4[i]
+    k2 = -k * (CRK4[i] + h / 2.0 * k1)
+    k3 = -k * (CRK4[i] + h / 2.0 * k2)
+    k4 = -k * (CRK4[i] + h * k3)
+    CRK4[i + 1] = CRK4[i] + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+  return tRK4, CRK4
+
+
+# Parameters.
+N = 20000  # Number of simulated patients.
+h = 0.1  # Time step in hours.
+tSpan = (0, 24)  # Time span for the simulation (exclusive of the end time).
+rng = np.random.default_rng(0)  # Random generator for reproducible patient cohorts.
+C0 = rng.uniform(50, 150, N)  # Initial concentrations in mg/L.
+k = rng.lognormal(np.log(0.2), 0.3, N)  # Rate constants in 1/h.
+
+# Solve all patients at once with each tableau and compare with the exact solution.
+table = pt.PrettyTable()
+table.field_names = ["Method", "Patients", "Time (s)", "Max Absolute Error"]
+results = {}
+for name, solver in [
+  ("Euler's", EulerMethod),
+  ("Improved Euler's", ImprovedEulerMethod),
+  ("RK4", RungeKutta4),
+]:
+  start = time.perf_counter()
+  t, C = solver(C0, k, h, tSpan)
+  elapsed = time.perf_counter() - start
+  CExact = C0[None, :] * np.exp(-k[None, :] * t[:, None])
+  results[name] = C
+  table.add_row([name, N, f"{elapsed:.3f}", f"{np.max(np.abs(C - CExact)):.3e}"])
+
+# Time the one-patient-per-call loop on a subset and extrapolate to the full cohort.
+subset = 500
+start = time.perf_counter()
+for i in range(subset):
+  RungeKutta4Loop(C0[i], k[i], h, tSpan)
+elapsed = (time.perf_counter() - start) * N / subset
+table.add_row(["RK4 (loop, extrapolated)", N, f"{elapsed:.3f}", "-"])
+
+# Print the parameters used in the simulation.
+print(f"Parameters used in the simulation:")
+print(f"Number of patients (N): {N}")
+print(f"Time step (h): {h} hours")
+print(f"Time span: {tSpan[0]} to {tSpan[1] - h} hours")
+print(table)
+
+# Plot a few trajectories and the error distribution of each method at the final time.
+plt.figure(figsize=(12, 5))
+plt.subplot(1, 2, 1)
+for i in range(5):
+  plt.plot(t, results["RK4"][:, i], lw=1.5, label=f"Patient {i + 1} (k = {k[i]:.3f})")
+plt.xlabel("Time (hours).")
+plt.ylabel("Drug Concentration (mg/L).")
+plt.title("Batched RK4 Trajectories.")
+plt.grid(True)  # Enable the grid for better readability.
+plt.legend()  # Show the legend on the plot.
+
+plt.subplot(1, 2, 2)
+CFinal = C0 * np.exp(-k * t[-1])
+for name, C in results.items():
+  plt.hist(np.log10(np.abs(C[-1] - CFinal) + 1e-300), bins=50, alpha=0.6, label=name)
+plt.xlabel("log10(Absolute Error) at the Final Time.")
+plt.ylabel("Number of Patients.")
+plt.title("Error Distribution Across Patients.")
+plt.grid(True)  # Enable the grid for better readability.
+plt.legend()  # Show the legend on the plot.
+plt.tight_layout()  # Adjust the layout to prevent overlap of labels and titles.
+
+# Save the plot as a PNG file with high resolution.
+plt.savefig("Lecture_06_Lab_Exercise_4_Batched.png", dpi=300, bbox_inches="tight")
+
+# Display the plot.
+plt.show()
@@ -0,0 +1,314 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+
+# Embedded Runge-Kutta pairs (A, c, b, bHat, order).
+# `b` gives the propagated solution and `bHat` the embedded one used for the error estimate.
+# `order` is the lower order of the pair and sets the exponent of the step-size controller.
+EMBEDDED_PAIRS = {
+  "RKF45" : (
+    np.array([
+      [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+      [1 / 4, 0.0, 0.0, 0.0, 0.0, 0.0],
+      [3 / 32, 9 / 32, 0.0, 0.0, 0.0, 0.0],
+      [1932 / 2197, -7200 / 2197, 7296 / 2197, 0.0, 0.0, 0.0],
+      [439 / 216, -8.0, 3680 / 513, -845 / 4104, 0.0, 0.0],
+      [-8 / 27, 2.0, -3544 / 2565, 1859 / 4104, -11 / 40, 0.0],
+    ]),
+    np.array([0.0, 1 / 4, 3 / 8, 12 / 13, 1.0, 1 / 2]),
+    np.array([16 / 135, 0.0, 6656 / 12825, 28561 / 56430, -9 / 50, 2 / 55]),
+    np.array([25 / 216, 0.0, 1408 / 2565, 2197 / 4104, -1 / 5, 0.0]),
+    4,
+  ),
+  "DOPRI5": (
+    np.array([
+      [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+      [1 / 5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+      [3 / 40, 9 / 40, 0.0, 0.0, 0.0, 0.0, 0.0],
+      [44 / 45, -56 / 15, 32 / 9, 0.0, 0.0, 0.0, 0.0],
+      [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0.0, 0.0, 0.0],
+      [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656, 0.0, 0.0],
+      [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0],
+    ]),
+    np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0]),
+    np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0]),
+    np.array([5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40]),
+    4,
+  ),
+}
+
+
+def ErrorNorm(err, y, yNew, rtol, atol):
+  """
+  Weighted RMS norm of the local error estimate.
+
+  Parameters:
+  err (numpy.ndarray): Difference between the propagated and embedded solutions.
+  y (numpy.ndarray): Solution at the start of the step.
+  yNew (numpy.ndarray): Solution at the end of the step.
+  rtol (float): Relative tolerance.
+  atol (float): Absolute tolerance.
+
+  Returns:
+  float: The scaled error (a step is accepted when it is <= 1).
+  """
+  scale = atol + rtol * np.maximum(np.abs(y), np.abs(yNew))
+  return np.sqrt(np.mean((err / scale) ** 2))
+
+
+def InitialStep(f, t0, y0, f0, order, rtol, atol):
+  """
+  Selects the first step size from the size of the solution and its derivatives
+  (Hairer, Norsett and Wanner, Solving ODEs I, Section II.4).
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  t0 (float): Initial time.
+  y0 (numpy.ndarray): Initial condition.
+  f0 (numpy.ndarray): f(t0, y0).
+  order (int): Order of the error estimate.
+  rtol (float): Relative tolerance.
+  atol (float): Absolute tolerance.
+
+  Returns:
+  float: The initial step size.
+  """
+  scale = atol + rtol * np.abs(y0)
+  d0 = np.sqrt(np.mean((y0 / scale) ** 2))
+  d1 = np.sqrt(np.mean((f0 / scale) ** 2))
+  h0 = 1e-6 if ((d0 < 1e-5) or (d1 < 1e-5)) else 0.01 * d0 / d1
+  f1 = f(t0 + h0, y0 + h0 * f0)
+  d2 = np.sqrt(np.mean(((f1 - f0) / scale) ** 2)) / h0
+  if (max(d1, d2) <= 1e-15):
+    h1 = max(1e-6, h0 * 1e-3)
+  else:
+    h1 = (0.01 / max(d1, d2)) ** (1.0 / (order + 1))
+  return min(100 * h0, h1)
+
+
+def AdaptiveRungeKutta(f, y0, tSpan, rtol=1e-6, atol=1e-9, method="DOPRI5", h0=None, maxSteps=100000):
+  """
+  Solves y' = f(t, y) with an embedded Runge-Kutta pair and a PI step-size controller.
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  y0 (array-like): Initial condition.
+  tSpan (tuple): Time span for the solution as (start time, end time).
+  rtol (float): Relative tolerance.
+  atol (float): Absolute tolerance.
+  method (str): Name of the pair in EMBEDDED_PAIRS ("RKF45" or "DOPRI5").
+  h0 (float): Initial step size (selected automatically when None).
+  maxSteps (int): Maximum number of attempted steps.
+
+  Returns:
+  t (numpy.ndarray): Accepted time points.
+  y (numpy.ndarray): Solution values at the accepted time points with shape (steps, d).
+  stats (dict): Number of RHS evaluations, accepted steps and rejected steps.
+  """
+  A, c, b, bHat, order = EMBEDDED_PAIRS[method]
+  stages = len(b)
+  # First Same As Last: the last stage equals f at the new point and is reused.
+  fsal = np.allclose(A[-1], b) and (c[-1] == 1.0)
+
+  # Controller constants (PI controller with the usual safety limits).
+  safety, facMin, facMax = 0.9, 0.2, 5.0
+  alpha, beta = 0.7 / (order + 1), 0.4 / (order + 1)
+
+  t0, tEnd = tSpan
+  y = np.atleast_1d(np.asarray(y0, dtype=float))
+  K = np.zeros((stages, len(y)))
+  K[0] = f(t0, y)
+  nfev = 1
+  if (h0 is None):
+    h0 = InitialStep(f, t0, y, K[0], order, rtol, atol)
+    nfev += 1
+
+  tOut, yOut = [t0], [y.copy()]
+  t, h = t0, h0
+  errPrev = 1.0
+  accepted, rejected = 0, 0
+  stepRejected = False
+
+  for _ in range(maxSteps):
+    if (t >= tEnd):
+      break
+    h = min(h, tEnd - t)  # Do not step past the end of the interval.
+
+    # Compute the remaining stages (stage 0 is f at the start of the step).
+    for s in range(1, stages):
+      K[s] = f(t + c[s] * h, y + h * (A[s, :s] @ K[:s]))
+    nfev += stages - 1
+    yNew = y + h * (b @ K)
+    err = ErrorNorm(h * ((b - bHat) @ K), y, yNew, rtol, atol)
+
+    if (err <= 1.0):
+      # Accept the step and grow it with the PI controller.
+      if (err == 0.0):
+        factor = facMax
+      else:
+        factor = safety * err ** (-alpha) * errPrev ** beta
+      factor = min(facMax, max(facMin, factor))
+      if (stepRejected):
+        factor = min(1.0, factor)  # No growth right after a rejection.
+      t, y = t + h, yNew
+      tOut.append(t)
+      yOut.append(y)
+      errPrev = max(err, 1e-4)
+      accepted += 1
+      stepRejected = False
+      if (fsal):
+        K[0] = K[-1]
+      else:
+        K[0] = f(t, y)
+        nfev += 1
+      h *= factor
+    else:
+      # Reject the step and shrink it with the integral part of the controller.
+      h *= max(facMin, safety * err ** (-1.0 / (order + 1)))
+      rejected += 1
+      stepRejected = True
+  else:
+    raise RuntimeError(f"Maximum number of steps ({maxSteps}) reached at t = {t}.")
+
+  stats = {"nfev": nfev, "accepted": accepted, "rejected": rejected}
+  return np.array(tOut), np.array(yOut), stats
+
+
+def RungeKuttaAdaptive(C0, k, tSpan, rtol=1e-6, atol=1e-9, method="DOPRI5"):
+  """
+  Adaptive-step replacement for RungeKutta4 on the drug elimination ODE.
+
+  Parameters:
+  C0 (float): Initial concentration of the drug in mg/L.
+  k (float): Rate constant for drug elimination in 1/h.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+  rtol (float): Relative tolerance.
+  atol (float): Absolute tolerance.
+  method (str): Embedded pair ("RKF45" or "DOPRI5").
+
+  Returns:
+  tAdaptive (numpy.ndarray): Accepted time points (non-uniform).
+  CAdaptive (numpy.ndarray): Concentration values at the accepted time points.
+  """
+  tAdaptive, CAdaptive, _ = AdaptiveRungeKutta(
+    lambda t, C: -k * C,  # Drug elimination ODE.
+    [C0],  # Initial concentration.
+    tSpan,  # Time span.
+    rtol=rtol,  # Relative tolerance.
+    atol=atol,  # Absolute tolerance.
+    method=method,  # Embedded pair.
+  )
+  return tAdaptive, CAdaptive[:, 0]
+
+
+def RungeKutta4(C0, k, h, tSpan):
+  """
+  Implements the Runge-Kutta 4th order method for solving the ordinary differential equation
+  representing drug elimination from the body.
+
+  Parameters:
+  C0 (float): Initial concentration of the drug in mg/L.
+  k (float): Rate constant for drug elimination in 1/h.
+  h (float): Time step for Runge-Kutta method in hours.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+
+  Returns:
+  tRK4 (numpy.ndarray): Time vector for Runge-Kutta method.
+  CRK4 (numpy.ndarray): Concentration values calculated using Runge-Kutta method.
+  """
+  # Time vector.
+  tRK4 = np.arange(*tSpan, h)
+  CRK4 = np.zeros(len(tRK4))
+  CRK4[0] = C0
+
+  # Apply Runge-Kutta method.
+  for i in range(len(tRK4) - 1):
+    k1 = -k * CRK4[i]
+    k2 = -k * (CRK4[i] + h / 2.0 * k1)
+    k3 = -k * (CRK4[i] + h / 2.0 * k2)
+    k4 = -k * (CRK4[i] + h * k3)
+    CRK4[i + 1] = CRK4[i] + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+  return tRK4, CRK4
+
+
+# Parameters.
+C0 = 100  # Initial concentration in mg/L.
+k = 0.2  # Rate constant in 1/h.
+tSpan = (0, 72)  # Long time span for the simulation in hours.
+
+# Work-precision comparison: RHS evaluations needed to reach a given maximum relative error.
+table = pt.PrettyTable()
+table.field_names = ["Method", "Setting", "Steps", "Rejected", "RHS Evaluations", "Max Relative Error"]
+curves = {"RK4 (fixed h)": [], "RKF45": [], "DOPRI5": []}
+
+for h in [2.0, 1.0, 0.5, 0.25, 0.1, 0.05]:
+  tRK4, CRK4 = RungeKutta4(C0, k, h, tSpan)
+  error = np.max(np.abs(CRK4 - C0 * np.exp(-k * tRK4)) / (C0 * np.exp(-k * tRK4)))
+  nfev = 4 * (len(tRK4) - 1)
+  curves["RK4 (fixed h)"].append((nfev, error))
+  table.add_row(["RK4", f"h = {h}", len(tRK4) - 1, 0, nfev, f"{error:.3e}"])
+
+for method in ["RKF45", "DOPRI5"]:
+  for rtol in [1e-3, 1e-5, 1e-7, 1e-9, 1e-11]:
+    tAdaptive, CAdaptive, stats = AdaptiveRungeKutta(
+      lambda t, C: -k * C, [C0], tSpan, rtol=rtol, atol=1e-30, method=method,
+    )
+    CExact = C0 * np.exp(-k * tAdaptive)
+    error = np.max(np.abs(CAdaptive[:, 0] - CExact) / CExact)
+    curves[method].append((stats["nfev"], error))
+    table.add_row([
+      method, f"rtol = {rtol:.0e}", stats["accepted"], stats["rejected"], stats["nfev"], f"{error:.3e}",
+    ])
+
+# Print the parameters used in the simulation.
+print(f"Parameters used in the simulation:")
+print(f"Initial concentration (C0): {C0} mg/L")
+print(f"Rate constant (k): {k} 1/h")
+print(f"Time span: {tSpan[0]} to {tSpan[1]} hours")
+print(table)
+
+# Adaptive solution that can be swapped in for RungeKutta4.
+tAdaptive, CAdaptive = RungeKuttaAdaptive(C0, k, tSpan, rtol=1e-6, atol=1e-12)
+tExact = np.linspace(*tSpan, 500)
+CExact = C0 * np.exp(-k * tExact)
+
+# Plot the solution and the work-precision diagram.
+plt.figure(figsize=(12, 5))
+plt.subplot(1, 2, 1)
+plt.plot(tExact, CExact, "r-", label="Exact Solution")
+plt.plot(tAdaptive, CAdaptive, "bo", markersize=4, label="DOPRI5 Accepted Steps (rtol = 1e-6)")
+plt.yscale("log")
+plt.xlabel("Time (hours).")
+plt.ylabel("Drug Concentration (mg/L).")
+plt.title("Adaptive Step Sizes for Drug Elimination.")
+plt.grid(True)  # Enable the grid for better readability.
+plt.legend()  # Show the legend on the plot.
+
+plt.subplot(1, 2, 2)
+for (name, points), style in zip(curves.items(), ["mo-", "gs-", "bd-"]):
+  points = np.array(points)
+  plt.loglog(points[:, 0], points[:, 1], style, label=name)
+plt.xlabel("RHS Evaluations.")
+plt.ylabel("Max Relative Error.")
+plt.title("Work-Precision Diagram.")
+plt.grid(True, which="both")  # Enable the grid for better readability.
+plt.legend()  # Show the legend on the plot.
+plt.tight_layout()  # Adjust the layout to prevent overlap of labels and titles.
+
+# Save the plot as a PNG file with high resolution.
+plt.savefig("Lecture_06_Lab_Exercise_5_Adaptive.png", dpi=300, bbox_inches="tight")
+
+# Display the plot.
+plt.show()
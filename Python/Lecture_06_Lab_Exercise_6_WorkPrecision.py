@@ -0,0 +1,374 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import json
+import time
+import tracemalloc
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.integrate import solve_ivp
+
+
+# ==============================================================
+# ============ Integrators Under Test (From the Labs) ==========
+# ==============================================================
+def EulerMethod(C0, k, h, tSpan):
+  """
+  Euler's method for drug elimination (Lecture_06_Lab_Exercise_1_Euler.py).
+  """
+  tEuler = np.arange(*tSpan, h)
+  CEuler = np.zeros(len(tEuler))
+  CEuler[0] = C0
+  for i in range(len(tEuler) - 1):
+    CEuler[i + 1] = CEuler[i] + h * (-k * CEuler[i])
+  return tEuler, CEuler
+
+
+def ImprovedEulerMethod(C0, k, h, tSpan):
+  """
+  Improved Euler's method for drug elimination (Lecture_06_Lab_Exercise_2_Improved.py).
+  """
+  tImprovedEuler = np.arange(*tSpan, h)
+  CImprovedEuler = np.zeros(len(tImprovedEuler))
+  CImprovedEuler[0] = C0
+  for i in range(len(tImprovedEuler) - 1):
+    slope1 = -k * CImprovedEuler[i]
+    CPredict = CImprovedEuler[i] + h * slope1
+    slope2 = -k * CPredict
+    CImprovedEuler[i + 1] = CImprovedEuler[i] + (h / 2.0) * (slope1 + slope2)
+  return tImprovedEuler, CImprovedEuler
+
+
+def RungeKutta4(C0, k, h, tSpan):
+  """
+  Runge-Kutta 4th order method for drug elimination (Lecture_06_Lab_Exercise_3_RK4.py).
+  """
+  tRK4 = np.arange(*tSpan, h)
+  CRK4 = np.zeros(len(tRK4))
+  CRK4[0] = C0
+  for i in range(len(tRK4) - 1):
+    k1 = -k * CRK4[i]
+    k2 = -k * (CRK4[i] + h / 2.0 * k1)
+    k3 = -k * (CRK4[i] + h / 2.0 * k2)
+    k4 = -k * (CRK4[i] + h * k3)
+    CRK4[i + 1] = CRK4[i] + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+  return tRK4, CRK4
+
+
+def RungeKutta4Scalar(f, x0, tSpan, dt):
+  """
+  Generic scalar Runge-Kutta 4th order method (RungeKutta4 in Lecture_10_Lab_Exercise_1_Hill.py).
+  """
+  t = np.arange(tSpan[0], tSpan[1], dt)
+  x = np.empty(len(t))
+  x[0] = x0
+  for i in range(1, len(t)):
+    xPrev = x[i - 1]
+    k1 = f(xPrev) * dt
+    k2 = f(xPrev + k1 / 2.0) * dt
+    k3 = f(xPrev + k2 / 2.0) * dt
+    k4 = f(xPrev + k3) * dt
+    x[i] = xPrev + (k1 + 2 * k2 + 2 * k3 + k4) / 6.0
+  return t, x
+
+
+def RungeKutta4TwoDimensional(f, z0, tSpan, dt):
+  """
+  Vector Runge-Kutta 4th order method (Lecture_10_Lab_Exercise_2_FHN.py).
+  """
+  t = np.arange(tSpan[0], tSpan[1], dt)
+  z0 = np.asarray(z0, dtype=float).ravel()
+  z = np.empty((len(t), z0.size))
+  z[0] = z0
+  zStage = np.empty(z0.size)
+  kScaled = np.empty(z0.size)
+  for i in range(1, len(t)):
+    zPrev, zNext = z[i - 1], z[i]
+    k = f(zPrev)
+    np.multiply(k, dt / 6.0, out=zNext)
+    np.multiply(k, dt / 2.0, out=zStage)
+    zStage += zPrev
+    k = f(zStage)
+    np.multiply(k, dt / 3.0, out=kScaled)
+    zNext += kScaled
+    np.multiply(k, dt / 2.0, out=zStage)
+    zStage += zPrev
+    k = f(zStage)
+    np.multiply(k, dt / 3.0, out=kScaled)
+    zNext += kScaled
+    np.multiply(k, dt, out=zStage)
+    zStage += zPrev
+    k = f(zStage)
+    np.multiply(k, dt / 6.0, out=kScaled)
+    zNext += kScaled
+    zNext += zPrev
+  return t, z
+
+
+# ==============================================================
+# ============== Test Problems With Exact Solutions ============
+# ==============================================================
+def DrugExact(t, C0=100.0, k=0.2):
+  """
+  Exact drug elimination C(t) = C0 * exp(-k * t).
+  """
+  return C0 * np.exp(-k * t)
+
+
+def LogisticExact(t, P0=10.0, r=0.5, K=100.0):
+  """
+  Exact logistic growth P(t) = K / (1 + (K / P0 - 1) * exp(-r * t)).
+  """
+  return K / (1.0 + (K / P0 - 1.0) * np.exp(-r * t))
+
+
+def DampedExact(t, omega0=2 * np.pi, gamma=0.5, x0=1.0, v0=0.0):
+  """
+  Exact underdamped solution x'' + 2 * gamma * x' + omega0^2 * x = 0 (Lecture_04_Lab_Exercise_2_Damped.py).
+  """
+  omegad = np.sqrt(omega0 ** 2 - gamma ** 2)
+  A, B = x0, (v0 + gamma * x0) / omegad
+  return np.exp(-gamma * t) * (A * np.cos(omegad * t) + B * np.sin(omegad * t))
+
+
+def KneeExact(t, c=0.5, k=4.0, F0=2.0, omegaF=3.0, x0=0.1, v0=0.0):
+  """
+  Exact KneeModel solution, i.e. partA + partB of Lecture_05_Lab_Exercise_1_Knee.py
+  with full-precision coefficients instead of the three-digit rounded ones.
+  """
+  D = (k - omegaF ** 2) ** 2 + (c * omegaF) ** 2
+  a, b = F0 * (k - omegaF ** 2) / D, F0 * c * omegaF / D  # Particular solution coefficients.
+  omegad = np.sqrt(k - c ** 2 / 4)
+  A = x0 - a
+  B = (v0 - b * omegaF + c / 2 * A) / omegad
+  partA = np.exp(-c / 2 * t) * (A * np.cos(omegad * t) + B * np.sin(omegad * t))
+  partB = a * np.cos(omegaF * t) + b * np.sin(omegaF * t)
+  return partA + partB
+
+
+def Logistic(P, r=0.5, K=100.0):
+  """
+  Logistic growth right-hand side (Lecture_03_Lab_Exercise_2_Growth.py).
+  """
+  return r * P * (1.0 - P / K)
+
+
+def Damped(z, omega0=2 * np.pi, gamma=0.5):
+  """
+  HeartOscillations right-hand side without forcing (Lecture_04_Lab_Exercise_3_Heart.py).
+  """
+  x, v = z[0], z[1]
+  return np.array([v, -2 * gamma * v - omega0 ** 2 * x])
+
+
+def Knee(z, c=0.5, k=4.0, F0=2.0, omegaF=3.0):
+  """
+  KneeModel right-hand side with time appended as a third state so that
+  the autonomous RungeKutta4TwoDimensional can integrate the forced model.
+  """
+  x, v, t = z[0], z[1], z[2]
+  return np.array([v, -c * v - k * x + F0 * np.cos(omegaF * t), 1.0])
+
+
+# ==============================================================
+# ======================= Benchmark Driver =====================
+# ==============================================================
+def CountCalls(f):
+  """
+  Wraps f so that every call increments counter[0].
+
+  Returns:
+  tuple: The wrapped function and the counter list.
+  """
+  counter = [0]
+
+  def wrapped(*args, **kwargs):
+    counter[0] += 1
+    return f(*args, **kwargs)
+
+  return wrapped, counter
+
+
+def Measure(run, exact, repeats=3):
+  """
+  Runs one benchmark case and records its cost and accuracy.
+
+  Parameters:
+  run (function): Callable returning (t, x, rhsCalls) for the quantity being compared.
+  exact (function): Exact solution evaluated at the returned time points.
+  repeats (int): Number of timed repetitions (the best one is kept).
+
+  Returns:
+  dict: Wall time, RHS calls, peak memory and max/RMS errors.
+  """
+  # Wall time without tracemalloc (tracing slows down allocations).
+  wallTimes = []
+  for _ in range(repeats):
+    start = time.perf_counter()
+    t, x, rhsCalls = run()
+    wallTimes.append(time.perf_counter() - start)
+
+  # Peak memory in a separate traced run.
+  tracemalloc.start()
+  run()
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  error = np.abs(np.asarray(x) - exact(np.asarray(t)))
+  return {
+    "wallTime"   : min(wallTimes),
+    "rhsCalls"   : int(rhsCalls),
+    "peakMemory" : int(peak),
+    "maxError"   : float(np.max(error)),
+    "rmsError"   : float(np.sqrt(np.mean(error ** 2))),
+    "outputSteps": int(len(t)),
+  }
+
+
+def FixedStepCase(solver, kind, problem, h):
+  """
+  Builds the run() callable of a fixed-step solver on one of the test problems.
+  """
+  tSpan = PROBLEMS[problem]["tSpan"]
+
+  def run():
+    if (kind == "drug"):
+      t, C = solver(100.0, 0.2, h, tSpan)
+      stages = {EulerMethod: 1, ImprovedEulerMethod: 2, RungeKutta4: 4}[solver]
+      return t, C, stages * (len(t) - 1)  # The RHS is inlined, so count stage evaluations.
+    f, counter = CountCalls(PROBLEMS[problem]["rhs"])
+    y0 = PROBLEMS[problem]["y0"]
+    t, z = solver(f, y0[0] if (kind == "scalar") else y0, tSpan, h)
+    x = z if (z.ndim == 1) else z[:, 0]
+    return t, x, counter[0]
+
+  return run
+
+
+def SolveIvpCase(method, problem, rtol):
+  """
+  Builds the run() callable of a solve_ivp method on one of the test problems.
+  """
+  tSpan = PROBLEMS[problem]["tSpan"]
+
+  def run():
+    f, counter = CountCalls(PROBLEMS[problem]["ivp"])
+    sol = solve_ivp(f, tSpan, PROBLEMS[problem]["y0Ivp"], method=method, rtol=rtol, atol=rtol * 1e-3)
+    return sol.t, sol.y[0], counter[0]
+
+  return run
+
+
+# Test problems: "rhs" and "y0" feed the fixed-step labs (autonomous f(z)),
+# "ivp" and "y0Ivp" feed solve_ivp (f(t, y)).
+PROBLEMS = {
+  "drug"    : {
+    "tSpan": (0, 24), "exact": DrugExact,
+    "rhs"  : lambda C: -0.2 * C, "y0": [100.0],
+    "ivp"  : lambda t, C: -0.2 * C, "y0Ivp": [100.0],
+  },
+  "logistic": {
+    "tSpan": (0, 20), "exact": LogisticExact,
+    "rhs"  : Logistic, "y0": [10.0],
+    "ivp"  : lambda t, P: Logistic(P), "y0Ivp": [10.0],
+  },
+  "damped"  : {
+    "tSpan": (0, 10), "exact": DampedExact,
+    "rhs"  : Damped, "y0": [1.0, 0.0],
+    "ivp"  : lambda t, z: Damped(z), "y0Ivp": [1.0, 0.0],
+  },
+  "knee"    : {
+    "tSpan": (0, 50), "exact": KneeExact,
+    "rhs"  : Knee, "y0": [0.1, 0.0, 0.0],
+    "ivp"  : lambda t, z: Knee([z[0], z[1], t])[:2], "y0Ivp": [0.1, 0.0],
+  },
+}
+
+# Cases: (solver name, problem, sweep parameter name, values, case builder).
+stepSizes = [0.2, 0.1, 0.05, 0.02, 0.01, 0.005]
+tolerances = [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9, 1e-10]
+cases = []
+for name, solver in [
+  ("EulerMethod", EulerMethod),
+  ("ImprovedEulerMethod", ImprovedEulerMethod),
+  ("RungeKutta4", RungeKutta4),
+]:
+  cases.append((name, "drug", "h", stepSizes, lambda h, s=solver: FixedStepCase(s, "drug", "drug", h)))
+cases.append((
+  "RungeKutta4 (Hill)", "logistic", "h", stepSizes,
+  lambda h: FixedStepCase(RungeKutta4Scalar, "scalar", "logistic", h),
+))
+for problem in ["logistic", "damped", "knee"]:
+  cases.append((
+    "RungeKutta4TwoDimensional", problem, "h", stepSizes,
+    lambda h, p=problem: FixedStepCase(RungeKutta4TwoDimensional, "vector", p, h),
+  ))
+for problem in PROBLEMS:
+  for method in ["RK45", "DOP853", "LSODA"]:
+    cases.append((
+      f"solve_ivp {method}", problem, "rtol", tolerances,
+      lambda rtol, m=method, p=problem: SolveIvpCase(m, p, rtol),
+    ))
+
+# Run the sweeps.
+records = []
+for name, problem, parameter, values, build in cases:
+  for value in values:
+    result = Measure(build(value), PROBLEMS[problem]["exact"])
+    records.append({"solver": name, "problem": problem, parameter: value, **result})
+
+# Print a summary table: the cheapest setting of each solver that reaches 1e-6 max error.
+table = pt.PrettyTable()
+table.field_names = ["Problem", "Solver", "Setting", "RHS Calls", "Wall Time (s)", "Peak Memory (KB)", "Max Error"]
+for problem in PROBLEMS:
+  for name in sorted({r["solver"] for r in records if (r["problem"] == problem)}):
+    candidates = [
+      r for r in records
+      if (r["problem"] == problem) and (r["solver"] == name) and (r["maxError"] <= 1e-6)
+    ]
+    if (not candidates):
+      table.add_row([problem, name, "not reached", "-", "-", "-", "-"])
+      continue
+    best = min(candidates, key=lambda r: r["rhsCalls"])
+    setting = f"h = {best['h']}" if ("h" in best) else f"rtol = {best['rtol']:.0e}"
+    table.add_row([
+      problem, name, setting, best["rhsCalls"], f"{best['wallTime']:.4f}",
+      f"{best['peakMemory'] / 1024:.1f}", f"{best['maxError']:.2e}",
+    ])
+print("Cheapest setting per solver reaching a max error of 1e-6:")
+print(table)
+
+# Save all records as JSON.
+with open("Lecture_06_Lab_Exercise_6_WorkPrecision.json", "w") as file:
+  json.dump(records, file, indent=2)
+
+# Work-precision plots: max error against RHS calls and against wall time.
+plt.figure(figsize=(16, 12))
+for row, problem in enumerate(PROBLEMS):
+  for col, (metric, label) in enumerate([("rhsCalls", "RHS Calls"), ("wallTime", "Wall Time (s)")]):
+    plt.subplot(len(PROBLEMS), 2, 2 * row + col + 1)
+    for name in sorted({r["solver"] for r in records if (r["problem"] == problem)}):
+      points = [(r[metric], r["maxError"]) for r in records if (r["problem"] == problem) and (r["solver"] == name)]
+      points = np.array(sorted(points))
+      plt.loglog(points[:, 0], points[:, 1], "o-", markersize=3, label=name)
+    plt.xlabel(label)
+    plt.ylabel("Max Error")
+    plt.title(f"Work-Precision: {problem}")
+    plt.grid(True, which="both", alpha=0.3)  # Enable the grid for better readability.
+    plt.legend(fontsize=7)  # Show the legend on the plot.
+plt.tight_layout()  # Adjust the layout to prevent overlap of labels and titles.
+
+# Save the plot as a PNG file with high resolution.
+plt.savefig("Lecture_06_Lab_Exercise_6_WorkPrecision.png", dpi=300, bbox_inches="tight")
+
+# Display the plot.
+plt.show()
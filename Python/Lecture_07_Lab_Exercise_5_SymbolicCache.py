@@ -0,0 +1,318 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import os
+import hmac
+import time
+import shutil
+import hashlib
+import tempfile
+import functools
+import contextlib
+import sympy as sp
+import prettytable as pt
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+  import fcntl  # POSIX file locks.
+except ImportError:
+  fcntl = None
+  import msvcrt  # Windows file locks.
+from sympy import symbols, Function, Heaviside, laplace_transform, inverse_laplace_transform, Eq, solve, dsolve
+
+# Results are stored next to the bytecode cache, which is already ignored by git.
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__", "SymbolicCache")
+
+
+class SymbolicCache:
+  """
+  Content-addressed on-disk cache of SymPy results (dsolve, laplace_transform, ...).
+
+  A call is keyed by a SHA-256 hash of the function name, the srepr of every
+  argument and keyword option, and the SymPy version; the result is stored as
+  its srepr, which SymPy evaluates back to an equal object. Loading an entry
+  evaluates it, so the store must belong to the current user, is created with
+  mode 0700, and every entry starts with an HMAC-SHA256 of its key and text under
+  a random secret kept in the store (readable by its owner only); entries that
+  fail the check are never evaluated, and evaluation sees SymPy names but no
+  builtins. Several processes can share one store:
+  - entries are written to a temporary file and renamed into place, so a reader
+    never sees a partial entry, and unreadable entries are deleted and recomputed;
+  - a process that computes an entry holds an exclusive OS file lock (flock, or
+    msvcrt.locking on Windows) on one of 256 lock files chosen by the key, and the
+    others block on it instead of computing the entry again. The operating system
+    releases the lock when its holder exits, so there are no stale locks, and a
+    derivation may take as long as it needs;
+  - once the store exceeds maxBytes, the least recently used entries (by file
+    modification time, refreshed on every hit) are deleted.
+  """
+
+  def __init__(self, cacheDir=DEFAULT_CACHE_DIR, maxBytes=64 * 2 ** 20, poll=0.05):
+    self.cacheDir = cacheDir
+    self.maxBytes = maxBytes
+    self.poll = poll
+    self.stats = {"hits": 0, "misses": 0, "waits": 0, "evictions": 0}
+    self.namespace = {}
+    exec("from sympy import *", self.namespace)  # Names used by srepr.
+    self.namespace["__builtins__"] = {}  # srepr only needs SymPy constructors.
+    self.secret = self._Secret(cacheDir)
+    if (self.secret is None):
+      raise PermissionError(f"The symbolic cache {cacheDir} is not private to this user.")
+
+  def Key(self, name, args, kwargs):
+    parts = [name, sp.__version__] + [sp.srepr(arg) for arg in args]
+    parts += [f"{key}={sp.srepr(value)}" for key, value in sorted(kwargs.items())]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+  @staticmethod
+  def _Secret(cacheDir):
+    """
+    The HMAC secret of a store, created on first use; None if the store is not private to this user.
+    """
+    os.makedirs(cacheDir, mode=0o700, exist_ok=True)
+    os.makedirs(os.path.join(cacheDir, "locks"), mode=0o700, exist_ok=True)
+    path = os.path.join(cacheDir, "key")
+    try:
+      if (not os.path.exists(path)):
+        handle, temporary = tempfile.mkstemp(dir=cacheDir, suffix=".tmp")  # Created with mode 0600.
+        try:
+          with os.fdopen(handle, "wb") as file:
+            file.write(os.urandom(32))
+          os.link(temporary, path)  # Fails if another process created the secret first; use theirs.
+        except FileExistsError:
+          pass
+        finally:
+          os.remove(temporary)
+      with open(path, "rb") as file:
+        info = os.fstat(file.fileno())
+        secret = file.read()
+      owner = os.stat(cacheDir).st_uid
+    except OSError:
+      return None  # E.g. a read-only store or a filesystem without hard links.
+    if (hasattr(os, "getuid")) and ((owner != os.getuid()) or (info.st_uid != os.getuid()) or (info.st_mode & 0o077)):
+      return None  # Someone else could forge entries.
+    return secret if (len(secret) == 32) else None
+
+  def _Sign(self, key, text):
+    return hmac.new(self.secret, f"{key}\n{text}".encode(), hashlib.sha256).hexdigest()
+
+  def _Read(self, key, path):
+    try:
+      with open(path, "r", encoding="utf-8") as file:
+        signature, _, text = file.read().partition("\n")
+    except OSError:
+      return None, False
+    try:
+      if (not hmac.compare_digest(signature, self._Sign(key, text))):
+        raise ValueError("Unsigned entry.")  # Not written by this store; never evaluate it.
+      result = eval(text, dict(self.namespace))
+    except Exception:
+      # Truncated, corrupt, forged or foreign entry: drop it and recompute.
+      with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+      return None, False
+    with contextlib.suppress(OSError):
+      os.utime(path)  # Mark as recently used for the eviction order.
+    return result, True
+
+  def _Write(self, key, path, text):
+    handle, temporary = tempfile.mkstemp(dir=self.cacheDir, suffix=".tmp")
+    try:
+      with os.fdopen(handle, "w", encoding="utf-8") as file:
+        file.write(f"{self._Sign(key, text)}\n{text}")
+      os.replace(temporary, path)
+    except OSError:
+      with contextlib.suppress(OSError):
+        os.remove(temporary)
+      raise
+
+  def _Evict(self):
+    entries = []
+    for entry in os.scandir(self.cacheDir):
+      if (entry.name.endswith(".srepr")):
+        try:
+          info = entry.stat()
+        except OSError:
+          continue  # Removed by another process meanwhile.
+        entries.append((info.st_mtime, info.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+      if (total <= self.maxBytes):
+        break
+      try:
+        os.remove(path)
+        self.stats["evictions"] += 1
+      except OSError:
+        pass
+      total -= size
+
+  def _Lock(self, key):
+    """
+    Opens and exclusively locks the lock file of a key; returns its descriptor.
+    """
+    descriptor = os.open(os.path.join(self.cacheDir, "locks", f"{key[:2]}.lock"), os.O_CREAT | os.O_RDWR)
+    if (fcntl is not None):
+      try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+      except BlockingIOError:
+        self.stats["waits"] += 1
+        fcntl.flock(descriptor, fcntl.LOCK_EX)  # Block until the holder finishes.
+      return descriptor
+    while (True):
+      try:
+        msvcrt.locking(descriptor, msvcrt.LK_NBLCK, 1)
+        return descriptor
+      except OSError:
+        self.stats["waits"] += 1
+        time.sleep(self.poll)
+
+  @staticmethod
+  def _Unlock(descriptor):
+    try:
+      if (fcntl is not None):
+        fcntl.flock(descriptor, fcntl.LOCK_UN)
+      else:
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+    finally:
+      os.close(descriptor)
+
+  def Call(self, function, *args, **kwargs):
+    """
+    Returns function(*args, **kwargs), from the store when the same call was made before.
+    """
+    key = self.Key(getattr(function, "__name__", repr(function)), args, kwargs)
+    path = os.path.join(self.cacheDir, f"{key}.srepr")
+    result, found = self._Read(key, path)
+    if (found):
+      self.stats["hits"] += 1
+      return result
+    descriptor = self._Lock(key)
+    try:
+      result, found = self._Read(key, path)  # Another process may have written it while this one waited.
+      if (found):
+        self.stats["hits"] += 1
+        return result
+      self.stats["misses"] += 1
+      result = function(*args, **kwargs)
+      text = sp.srepr(result)
+      if (eval(text, dict(self.namespace)) == result):  # Only store what round-trips exactly.
+        self._Write(key, path, text)
+        self._Evict()
+    finally:
+      self._Unlock(descriptor)
+    return result
+
+  def Wrap(self, function):
+    """
+    Memoized version of a SymPy function, e.g. cache.Wrap(sp.dsolve).
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+      return self.Call(function, *args, **kwargs)
+
+    return wrapper
+
+
+class NoCache:
+  """
+  Calls the function directly; the uncached baseline for the derivations below.
+  """
+
+  @staticmethod
+  def Call(function, *args, **kwargs):
+    return function(*args, **kwargs)
+
+
+def DrugDerivation(cache):
+  """
+  The Laplace-transform derivation of Lecture_07_Lab_Exercise_3_Drug.py through a cache.
+  """
+  k, C0, a, R0 = 0.5, 0, 2, 20
+  t, s = symbols("t s", real=True)
+  C = Function("C")(t)
+  lapdC = cache.Call(laplace_transform, C.diff(t), t, s)[0]
+  lapC = cache.Call(laplace_transform, C, t, s)[0]
+  lapRHS = cache.Call(laplace_transform, R0 * Heaviside(t - a), t, s)[0]
+  lapCs = cache.Call(solve, Eq(lapdC + k * lapC, lapRHS), lapC)[0]
+  lapCs = lapCs.subs(C.subs(t, 0), C0)
+  return cache.Call(inverse_laplace_transform, lapCs, s, t)
+
+
+def OscillatorDerivation(cache):
+  """
+  The damped oscillator of the Lecture 04 labs solved with dsolve through a cache.
+  """
+  t = symbols("t", real=True)
+  x = Function("x")(t)
+  return cache.Call(dsolve, x.diff(t, 2) + 0.4 * x.diff(t) + 4 * x, x, ics={x.subs(t, 0): 1, x.diff(t).subs(t, 0): 0})
+
+
+def Worker(cacheDir):
+  # One batch job: derive the drug concentration and report what the cache did.
+  sp.core.cache.clear_cache()
+  cache = SymbolicCache(cacheDir)
+  start = time.perf_counter()
+  result = DrugDerivation(cache)
+  return result, cache.stats, time.perf_counter() - start
+
+
+if (__name__ == "__main__"):
+  # A private temporary store, so that the demo starts cold.
+  cacheDir = tempfile.mkdtemp(prefix="SymbolicCacheDemo")
+  table = pt.PrettyTable()
+  table.field_names = ["Derivation", "Uncached (ms)", "Cold Cache (ms)", "Warm Cache (ms)", "Same Result"]
+  for name, Derivation in [("Drug Infusion (Laplace)", DrugDerivation), ("Damped Oscillator (dsolve)", OscillatorDerivation)]:
+    timings = []
+    for cache in [NoCache(), SymbolicCache(cacheDir), SymbolicCache(cacheDir)]:
+      sp.core.cache.clear_cache()  # SymPy's own in-process cache would hide the cost of the first call.
+      start = time.perf_counter()
+      result = Derivation(cache)
+      timings.append(((time.perf_counter() - start) * 1e3, result))
+    table.add_row([
+      name, f"{timings[0][0]:.0f}", f"{timings[1][0]:.0f}", f"{timings[2][0]:.1f}",
+      all(result == timings[0][1] for _, result in timings),
+    ])
+  print(table)
+
+  # Eight batch jobs in four processes derive the same closed form against a cold store:
+  # the lock lets one process compute each entry while the others wait for it.
+  shutil.rmtree(cacheDir, ignore_errors=True)  # The workers recreate it with mode 0700.
+  with ProcessPoolExecutor(max_workers=4) as executor:
+    results = list(executor.map(Worker, [cacheDir] * 8))
+  misses = sum(stats["misses"] for _, stats, _ in results)
+  hits = sum(stats["hits"] for _, stats, _ in results)
+  assert all(result == results[0][0] for result, _, _ in results)
+  print(f"8 concurrent jobs: {misses} computed entries, {hits} cache hits, identical results.")
+  print(f"C(t) = {results[0][0]}")
+
+  # A tiny size bound keeps only the most recently used entries.
+  small = SymbolicCache(cacheDir, maxBytes=600)
+  OscillatorDerivation(small)
+  remaining = [name for name in os.listdir(cacheDir) if name.endswith(".srepr")]
+  print(f"With maxBytes = 600: {small.stats['evictions']} entries evicted, {len(remaining)} kept.")
+
+  # A truncated entry is dropped and recomputed instead of crashing the call.
+  entry = os.path.join(cacheDir, remaining[0])
+  with open(entry, "r+", encoding="utf-8") as file:
+    file.truncate(len(file.read()) // 2)
+  recovered = SymbolicCache(cacheDir)
+  assert OscillatorDerivation(recovered) == OscillatorDerivation(NoCache())
+  print(f"Truncated entry recomputed: {recovered.stats}.")
+
+  # An entry planted without the store's secret is deleted and recomputed, never evaluated.
+  with open(entry, "w", encoding="utf-8") as file:
+    file.write("0" * 64 + "\n__import__('os').remove(__file__)")
+  forged = SymbolicCache(cacheDir)
+  assert OscillatorDerivation(forged) == OscillatorDerivation(NoCache())
+  print(f"Forged entry recomputed: {forged.stats}.")
+  shutil.rmtree(cacheDir, ignore_errors=True)
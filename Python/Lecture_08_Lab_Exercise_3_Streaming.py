@@ -0,0 +1,227 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import tracemalloc
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.integrate import RK45, DOP853, LSODA
+
+# Step-by-step solver classes that can be driven one step at a time.
+SOLVERS = {"RK45": RK45, "DOP853": DOP853, "LSODA": LSODA}
+
+
+def lorenz(t, y, sigma=10, beta=8 / 3, rho=28):
+  """
+  Function to compute the derivatives for the Lorenz-type neuron model.
+  """
+  x, y, z = y
+  dxdt = sigma * (y - x)
+  dydt = x * (rho - z) - y
+  dzdt = x * y - beta * z
+  return [dxdt, dydt, dzdt]
+
+
+def rossler(t, y, a=0.2, b=0.2, c=5.7):
+  """
+  Function to compute the derivatives for the Rössler-type population model.
+  """
+  x, y, z = y
+  dxdt = -y - z
+  dydt = x + a * y
+  dzdt = b + z * (x - c)
+  return [dxdt, dydt, dzdt]
+
+
+def hindmarshRose(t, y, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Function to compute the derivatives for the Hindmarsh-Rose neuron model.
+  """
+  x, y, z = y
+  dxdt = y - a * x ** 3 + b * x ** 2 + I - z
+  dydt = c - d * x ** 2 - y
+  dzdt = r * (s * (x - x0) - z)
+  return [dxdt, dydt, dzdt]
+
+
+def StreamTrajectory(f, tSpan, y0, dt, chunkSize=4096, method="RK45", **options):
+  """
+  Integrates an ODE and yields the solution on the uniform grid t0, t0 + dt, ...
+  in fixed-size chunks. Only the solver state and the current chunk are kept
+  in memory, so memory use does not grow with the length of the horizon.
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  tSpan (tuple): Time span for the solution.
+  y0 (array-like): Initial condition.
+  dt (float): Spacing of the output grid.
+  chunkSize (int): Number of output samples per chunk (the last chunk may be shorter).
+  method (str): Name of the step-by-step solver in SOLVERS.
+  **options: Extra options passed to the solver (rtol, atol, max_step, ...).
+
+  Yields:
+  tuple: Chunk of time points with shape (n,) and states with shape (n, d).
+  """
+  t0, tEnd = tSpan
+  solver = SOLVERS[method](f, t0, np.asarray(y0, dtype=float), tEnd, **options)
+  nSamples = int(np.floor((tEnd - t0) / dt + 1e-9)) + 1  # Output grid points in [t0, tEnd].
+  d = solver.n
+
+  tChunk, yChunk = np.empty(chunkSize), np.empty((chunkSize, d))
+  filled, nextIndex = 0, 0
+  while (nextIndex < nSamples):
+    if (solver.status != "running"):
+      raise RuntimeError(f"Solver stopped at t = {solver.t}: {solver.status}.")
+    solver.step()
+    interpolant = solver.dense_output()  # Dense output of the step just taken.
+    # Output grid points covered by the last step.
+    lastIndex = min(nSamples - 1, int(np.floor((solver.t - t0) / dt + 1e-9)))
+    while (nextIndex <= lastIndex):
+      count = min(lastIndex - nextIndex + 1, chunkSize - filled)
+      tSamples = t0 + dt * np.arange(nextIndex, nextIndex + count)
+      tChunk[filled:filled + count] = tSamples
+      yChunk[filled:filled + count] = interpolant(tSamples).T
+      filled += count
+      nextIndex += count
+      if (filled == chunkSize):
+        yield tChunk, yChunk
+        tChunk, yChunk = np.empty(chunkSize), np.empty((chunkSize, d))
+        filled = 0
+  if (filled > 0):
+    yield tChunk[:filled], yChunk[:filled]
+
+
+class MemmapSink:
+  """
+  Writes chunks to a .npy file through a memory-mapped array of shape (nSamples, 1 + d),
+  where the first column holds the time points.
+  """
+
+  def __init__(self, path, nSamples, d):
+    self.array = np.lib.format.open_memmap(path, mode="w+", dtype=float, shape=(nSamples, 1 + d))
+    self.count = 0
+
+  def Consume(self, t, y):
+    self.array[self.count:self.count + len(t), 0] = t
+    self.array[self.count:self.count + len(t), 1:] = y
+    self.count += len(t)
+
+  def Close(self):
+    self.array.flush()
+
+
+class OnlineStatsSink:
+  """
+  Reduces chunks online to the count, mean, variance, minimum and maximum of each state
+  (chunks are merged with the parallel variance formula of Chan et al.).
+  """
+
+  def __init__(self):
+    self.count, self.mean, self.M2 = 0, 0.0, 0.0
+    self.minimum, self.maximum = np.inf, -np.inf
+
+  def Consume(self, t, y):
+    n = len(y)
+    chunkMean = y.mean(axis=0)
+    chunkM2 = ((y - chunkMean) ** 2).sum(axis=0)
+    delta = chunkMean - self.mean
+    total = self.count + n
+    self.mean = self.mean + delta * n / total
+    self.M2 = self.M2 + chunkM2 + delta ** 2 * self.count * n / total
+    self.count = total
+    self.minimum = np.minimum(self.minimum, y.min(axis=0))
+    self.maximum = np.maximum(self.maximum, y.max(axis=0))
+
+  def Variance(self):
+    return self.M2 / max(self.count - 1, 1)
+
+  def Close(self):
+    pass
+
+
+class DropSink:
+  """
+  Discards chunks and only counts them (useful for timing and for transients).
+  """
+
+  def __init__(self):
+    self.count = 0
+
+  def Consume(self, t, y):
+    self.count += len(t)
+
+  def Close(self):
+    pass
+
+
+def RunStream(stream, sinks):
+  """
+  Feeds every chunk of a stream to all sinks and closes them at the end.
+
+  Parameters:
+  stream (generator): Output of StreamTrajectory.
+  sinks (list): Objects providing Consume(t, y) and Close().
+
+  Returns:
+  list: The sinks after the stream is exhausted.
+  """
+  for t, y in stream:
+    for sink in sinks:
+      sink.Consume(t, y)
+  for sink in sinks:
+    sink.Close()
+  return sinks
+
+
+# Simulation settings: horizons 50x longer than the Lecture 08 chaos lab.
+dt = 0.004  # Output spacing (the Lecture 08 lab uses 40 / 10000).
+chunkSize = 8192  # Output samples per chunk.
+models = {
+  "Lorenz"        : (lorenz, (0, 2000), [0.0, 1.0, 2.0]),
+  "Rössler"       : (rossler, (0, 5000), [0.0, 0.1, 0.2]),
+  "Hindmarsh-Rose": (hindmarshRose, (0, 2500), [1.0, 1.0, 1.0]),
+}
+
+table = pt.PrettyTable()
+table.field_names = ["Model", "Horizon", "Samples", "Peak Memory (MB)", "Full Array (MB)", "Time (s)", "Mean", "Std"]
+statsPerModel = {}
+for name, (model, tSpan, y0) in models.items():
+  nSamples = int(np.floor((tSpan[1] - tSpan[0]) / dt + 1e-9)) + 1
+  sinks = [OnlineStatsSink()]
+  if (name == "Lorenz"):
+    # Keep the full Lorenz trajectory on disk through a memory-mapped file.
+    sinks.append(MemmapSink("Lecture_08_Lab_Exercise_3_Lorenz.npy", nSamples, len(y0)))
+  tracemalloc.start()
+  start = time.perf_counter()
+  RunStream(StreamTrajectory(model, tSpan, y0, dt, chunkSize=chunkSize), sinks)
+  elapsed = time.perf_counter() - start
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  stats = sinks[0]
+  statsPerModel[name] = stats
+  table.add_row([
+    name, tSpan[1], stats.count, f"{peak / 2 ** 20:.2f}", f"{nSamples * (1 + len(y0)) * 8 / 2 ** 20:.2f}",
+    f"{elapsed:.2f}", np.round(stats.mean, 3), np.round(np.sqrt(stats.Variance()), 3),
+  ])
+print(table)
+
+# Plot a slice of the Lorenz trajectory back from the memory-mapped file.
+lorenzTrajectory = np.load("Lecture_08_Lab_Exercise_3_Lorenz.npy", mmap_mode="r")
+plt.figure(figsize=(12, 6))
+plt.plot(lorenzTrajectory[::5, 1], lorenzTrajectory[::5, 2], lw=0.1)
+plt.title("Lorenz-Type Neuron Model (Streamed to Disk)", fontsize=16)
+plt.xlabel("x", fontsize=14)
+plt.ylabel("y", fontsize=14)
+plt.grid()  # Add grid to the plot.
+plt.savefig("Lecture_08_Lab_Exercise_3_Streaming.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
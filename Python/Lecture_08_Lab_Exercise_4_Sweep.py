@@ -0,0 +1,240 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import os
+import time
+import itertools
+import numpy as np
+import matplotlib.pyplot as plt
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from scipy.integrate import solve_ivp
+
+
+# Models and reductions must be module-level functions so that worker processes can import them.
+def lorenz(t, y, sigma=10, beta=8 / 3, rho=28):
+  """
+  Lorenz-type neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = y
+  dxdt = sigma * (y - x)
+  dydt = x * (rho - z) - y
+  dzdt = x * y - beta * z
+  return [dxdt, dydt, dzdt]
+
+
+def fitzhughNagumo(t, z, I, epsilon=0.08, a=0.7, b=0.8):
+  """
+  FitzHugh-Nagumo model (Lecture_08_Lab_Exercise_1_Bifurcations.py) with the time argument of solve_ivp.
+  """
+  v, w = z
+  dvdt = v - (v ** 3) / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return [dvdt, dwdt]
+
+
+def ZMaximaReduction(t, y, params):
+  """
+  Summarizes a Lorenz run after the transient: [number of distinct z maxima, mean z maximum, std].
+  A single distinct maximum indicates a fixed point or a simple cycle; many indicate chaos.
+  """
+  z = y[2, t > t[-1] / 2]
+  peaks = z[1:-1][(z[1:-1] > z[:-2]) & (z[1:-1] > z[2:])]
+  if (peaks.size == 0):
+    return [0, z[-1], 0.0]
+  return [np.unique(np.round(peaks, 2)).size, peaks.mean(), peaks.std()]
+
+
+def AmplitudeReduction(t, y, params):
+  """
+  Peak-to-peak amplitude of v and its final value after the transient (zero amplitude at a stable equilibrium).
+  """
+  v = y[0, t > t[-1] / 2]
+  return [v.max() - v.min(), v[-1]]
+
+
+def ParameterGrid(axes, mode="product"):
+  """
+  Builds a parameter grid as a structured array with one field per parameter.
+
+  Parameters:
+  axes (dict): Parameter name -> values.
+  mode (str): "product" for the Cartesian grid (last axis varies fastest) or
+    "zip" for a list of parameter sets taken element-wise.
+
+  Returns:
+  numpy.ndarray: Structured array of parameter sets in deterministic order.
+  """
+  names = list(axes)
+  if (mode == "product"):
+    rows = list(itertools.product(*(np.atleast_1d(axes[name]) for name in names)))
+  else:
+    rows = list(zip(*(np.atleast_1d(axes[name]) for name in names)))
+  return np.array(rows, dtype=[(name, np.float64) for name in names])
+
+
+def SweepChunk(resultsName, controlName, shape, model, reduction, y0, tSpan, grid, start, options):
+  """
+  Worker: integrates the runs start .. start + len(grid) and writes their reductions in place.
+
+  Only the reduced values travel back through shared memory; the trajectories never leave
+  the worker. The cancel flag is checked before every run.
+  """
+  resultsMemory = shared_memory.SharedMemory(name=resultsName)
+  controlMemory = shared_memory.SharedMemory(name=controlName)
+  try:
+    results = np.ndarray(shape, dtype=np.float64, buffer=resultsMemory.buf)
+    control = np.ndarray((shape[0] + 1,), dtype=np.int8, buffer=controlMemory.buf)
+    done = 0
+    for i, row in enumerate(grid):
+      if (control[0]):
+        break  # Sweep cancelled.
+      params = {name: row[name] for name in grid.dtype.names}
+      sol = solve_ivp(model, tSpan, y0, args=tuple(params.values()), **options)
+      results[start + i] = reduction(sol.t, sol.y, params)
+      control[1 + start + i] = 1
+      done += 1
+    del results, control  # Release the buffer views before closing.
+    return done
+  finally:
+    resultsMemory.close()
+    controlMemory.close()
+
+
+def RunSweep(
+  model, grid, reduction, nOutputs, y0, tSpan, workers=None, chunkSize=None, progress=None, **options,
+):
+  """
+  Runs a parameter sweep on a process pool with results in shared memory.
+
+  Parameters:
+  model (function): Module-level RHS f(t, y, *params) with the parameters in grid-field order.
+  grid (numpy.ndarray): Structured parameter grid (see ParameterGrid).
+  reduction (function): Module-level reduction(t, y, params) returning nOutputs values.
+  nOutputs (int): Number of values returned by the reduction.
+  y0 (list): Initial condition of every run.
+  tSpan (tuple): Time span of every run.
+  workers (int): Number of worker processes (default os.cpu_count()).
+  chunkSize (int): Runs per work unit (default: about four units per worker).
+  progress (function): Called as progress(completedRuns, totalRuns) after each work unit;
+    returning False cancels the sweep (running units stop at their next run).
+  **options: solve_ivp options (method, rtol, atol, max_step).
+
+  Returns:
+  results (numpy.ndarray): (len(grid), nOutputs) array in grid order (NaN for runs not done).
+  completed (numpy.ndarray): Boolean mask of the runs that were completed.
+  """
+  workers = workers or os.cpu_count()
+  chunkSize = chunkSize or max(1, int(np.ceil(len(grid) / (4 * workers))))
+  shape = (len(grid), nOutputs)
+  resultsMemory = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+  controlMemory = shared_memory.SharedMemory(create=True, size=len(grid) + 1)
+  try:
+    results = np.ndarray(shape, dtype=np.float64, buffer=resultsMemory.buf)
+    control = np.ndarray((len(grid) + 1,), dtype=np.int8, buffer=controlMemory.buf)
+    results[:] = np.nan
+    control[:] = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+      futures = [
+        executor.submit(
+          SweepChunk, resultsMemory.name, controlMemory.name, shape, model, reduction, y0, tSpan,
+          grid[start:start + chunkSize], start, options,
+        )
+        for start in range(0, len(grid), chunkSize)
+      ]
+      completedRuns = 0
+      for future in as_completed(futures):
+        completedRuns += future.result() if (not future.cancelled()) else 0
+        if (progress is not None) and (progress(completedRuns, len(grid)) is False) and (not control[0]):
+          control[0] = 1  # Tell running work units to stop.
+          for pending in futures:
+            pending.cancel()  # Drop work units that have not started.
+    output, completed = results.copy(), control[1:].astype(bool)
+    del results, control  # Release the buffer views before unlinking.
+    return output, completed
+  finally:
+    resultsMemory.close()
+    resultsMemory.unlink()
+    controlMemory.close()
+    controlMemory.unlink()
+
+
+if (__name__ == "__main__"):
+  # The guard is required because worker processes import this module.
+  print(f"CPU cores available: {os.cpu_count()}")
+
+  # ==============================================================
+  # ===================== Lorenz rho Sweep =======================
+  # ==============================================================
+  lorenzGrid = ParameterGrid({"sigma": [10.0], "beta": [8 / 3], "rho": np.linspace(0.5, 200, 240)})
+  options = {"rtol": 1e-8, "atol": 1e-8}
+  timings = {}
+  for workers in sorted({1, 2, os.cpu_count()}):
+    start = time.perf_counter()
+    lorenzResults, completed = RunSweep(
+      lorenz, lorenzGrid, ZMaximaReduction, 3, [1.0, 1.0, 1.0], (0, 100), workers=workers, **options,
+    )
+    timings[workers] = time.perf_counter() - start
+    print(f"Lorenz rho sweep ({len(lorenzGrid)} runs) with {workers} worker(s): {timings[workers]:.2f} s")
+
+  # Serial reference: the same runs in this process give identical values in the same order.
+  serial = np.array([
+    ZMaximaReduction(*(lambda sol: (sol.t, sol.y))(
+      solve_ivp(lorenz, (0, 100), [1.0, 1.0, 1.0], args=tuple(row), **options)
+    ), None)
+    for row in lorenzGrid[:10]
+  ])
+  print("Pool results match the serial loop (first 10 runs):", np.allclose(serial, lorenzResults[:10]))
+
+  # ==============================================================
+  # ============ FHN Hopf Sweep Over the Stimulus I ==============
+  # ==============================================================
+  hopfGrid = ParameterGrid({"I": np.linspace(0.0, 2.5, 120)})
+  hopfResults, _ = RunSweep(
+    fitzhughNagumo, hopfGrid, AmplitudeReduction, 2, [0.0, 0.0], (0, 400), max_step=0.5,
+  )
+  oscillating = hopfGrid["I"][hopfResults[:, 0] > 1e-3]
+  print(f"FHN oscillates (Hopf window) for I in [{oscillating.min():.3f}, {oscillating.max():.3f}]")
+
+  # Cancellation: stop once half of the runs are done; the other rows stay NaN.
+  partial, completed = RunSweep(
+    fitzhughNagumo, hopfGrid, AmplitudeReduction, 2, [0.0, 0.0], (0, 400), chunkSize=10, max_step=0.5,
+    progress=lambda done, total: done < total // 2,
+  )
+  print(f"Cancelled sweep: {completed.sum()} of {len(hopfGrid)} runs completed, "
+        f"{np.isnan(partial[:, 0]).sum()} rows left as NaN.")
+
+  # Plot the two sweeps.
+  plt.figure(figsize=(14, 5))
+  plt.subplot(1, 2, 1)
+  plt.plot(lorenzGrid["rho"], lorenzResults[:, 1], "b.", label="Mean z maximum")
+  plt.fill_between(
+    lorenzGrid["rho"], lorenzResults[:, 1] - lorenzResults[:, 2], lorenzResults[:, 1] + lorenzResults[:, 2],
+    color="b", alpha=0.2, label="Spread of z maxima",
+  )
+  plt.xlabel("Parameter (rho)", fontsize=12)
+  plt.ylabel("z maxima", fontsize=12)
+  plt.title("Lorenz Sweep over rho", fontsize=14)
+  plt.legend()  # Add legend to the plot.
+  plt.grid()  # Add grid to the plot.
+
+  plt.subplot(1, 2, 2)
+  plt.plot(hopfGrid["I"], hopfResults[:, 0], "r.-", label="Amplitude of v")
+  plt.xlabel("Parameter (I)", fontsize=12)
+  plt.ylabel("Peak-to-Peak Amplitude", fontsize=12)
+  plt.title("FitzHugh-Nagumo Hopf Window", fontsize=14)
+  plt.legend()  # Add legend to the plot.
+  plt.grid()  # Add grid to the plot.
+  plt.tight_layout()  # Adjust layout to prevent overlap.
+
+  plt.savefig("Lecture_08_Lab_Exercise_4_Sweep.png", dpi=300, bbox_inches="tight")
+  plt.show()  # Display the plot.
+  plt.close()  # Close the plot to free memory.
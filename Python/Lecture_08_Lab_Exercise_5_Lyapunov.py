@@ -0,0 +1,382 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+
+
+# The models below work on a batch of states with shape (B, d); every parameter
+# is a scalar or an array of shape (B,), so one call evaluates the whole ensemble.
+def lorenz(t, Y, sigma=10, beta=8 / 3, rho=28):
+  """
+  Lorenz-type neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = Y[:, 0], Y[:, 1], Y[:, 2]
+  dxdt = sigma * (y - x)
+  dydt = x * (rho - z) - y
+  dzdt = x * y - beta * z
+  return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def lorenzJacobian(t, Y, sigma=10, beta=8 / 3, rho=28):
+  """
+  Analytic Jacobian of the Lorenz-type neuron model with shape (B, 3, 3).
+  """
+  x, y, z = Y[:, 0], Y[:, 1], Y[:, 2]
+  J = np.zeros((Y.shape[0], 3, 3))
+  J[:, 0, 0], J[:, 0, 1] = -sigma, sigma
+  J[:, 1, 0], J[:, 1, 1], J[:, 1, 2] = rho - z, -1.0, -x
+  J[:, 2, 0], J[:, 2, 1], J[:, 2, 2] = y, x, -beta
+  return J
+
+
+def rossler(t, Y, a=0.2, b=0.2, c=5.7):
+  """
+  Rössler-type population model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = Y[:, 0], Y[:, 1], Y[:, 2]
+  dxdt = -y - z
+  dydt = x + a * y
+  dzdt = b + z * (x - c)
+  return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def rosslerJacobian(t, Y, a=0.2, b=0.2, c=5.7):
+  """
+  Analytic Jacobian of the Rössler-type population model with shape (B, 3, 3).
+  """
+  x, z = Y[:, 0], Y[:, 2]
+  J = np.zeros((Y.shape[0], 3, 3))
+  J[:, 0, 1], J[:, 0, 2] = -1.0, -1.0
+  J[:, 1, 0], J[:, 1, 1] = 1.0, a
+  J[:, 2, 0], J[:, 2, 2] = z, x - c
+  return J
+
+
+def vanDerPol(t, Y, mu=1.0, force=0.5, omega=0.5):
+  """
+  Forced Van der Pol oscillator (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, v = Y[:, 0], Y[:, 1]
+  dxdt = v
+  dvdt = mu * (1 - x ** 2) * v - x + force * np.cos(omega * t)
+  return np.stack([dxdt, dvdt], axis=-1)
+
+
+def vanDerPolJacobian(t, Y, mu=1.0, force=0.5, omega=0.5):
+  """
+  Analytic Jacobian of the forced Van der Pol oscillator with shape (B, 2, 2).
+  """
+  x, v = Y[:, 0], Y[:, 1]
+  J = np.zeros((Y.shape[0], 2, 2))
+  J[:, 0, 1] = 1.0
+  J[:, 1, 0], J[:, 1, 1] = -2 * mu * x * v - 1, mu * (1 - x ** 2)
+  return J
+
+
+def hindmarshRose(t, Y, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Hindmarsh-Rose neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = Y[:, 0], Y[:, 1], Y[:, 2]
+  dxdt = y - a * x ** 3 + b * x ** 2 + I - z
+  dydt = c - d * x ** 2 - y
+  dzdt = r * (s * (x - x0) - z)
+  return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def hindmarshRoseJacobian(t, Y, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Analytic Jacobian of the Hindmarsh-Rose neuron model with shape (B, 3, 3).
+  """
+  x = Y[:, 0]
+  J = np.zeros((Y.shape[0], 3, 3))
+  J[:, 0, 0], J[:, 0, 1], J[:, 0, 2] = -3 * a * x ** 2 + 2 * b * x, 1.0, -1.0
+  J[:, 1, 0], J[:, 1, 1] = -2 * d * x, -1.0
+  J[:, 2, 0], J[:, 2, 2] = r * s, -r
+  return J
+
+
+def BroadcastEnsemble(y0, params):
+  """
+  Broadcasts initial conditions and parameter values to a common ensemble size.
+
+  Parameters:
+  y0 (array-like): One initial condition (d,) or a batch of them (B, d).
+  params (dict): Parameter name -> scalar or array of shape (B,).
+
+  Returns:
+  Y (numpy.ndarray): Initial states with shape (B, d).
+  params (dict): Parameters as arrays of shape (B,).
+  """
+  Y = np.atleast_2d(np.asarray(y0, dtype=float))
+  sizes = [Y.shape[0]] + [np.size(value) for value in params.values()]
+  B = max(sizes)
+  if (any(size not in (1, B) for size in sizes)):
+    raise ValueError(f"Ensemble sizes {sizes} cannot be broadcast together.")
+  Y = np.broadcast_to(Y, (B, Y.shape[1])).copy()
+  params = {name: np.broadcast_to(np.asarray(value, dtype=float), (B,)).copy() for name, value in params.items()}
+  return Y, params
+
+
+def TangentRK4Step(f, jac, t, Y, Q, h, params):
+  """
+  One classical RK4 step of the state and of its tangent vectors.
+
+  The variational equations dQ/dt = J(t, y) Q are integrated with the same stages
+  as the state, so the tangent vectors follow the discrete trajectory exactly.
+
+  Parameters:
+  f (function): Batched model f(t, Y, **params) returning (B, d).
+  jac (function): Batched analytic Jacobian jac(t, Y, **params) returning (B, d, d).
+  t (float): Current time.
+  Y (numpy.ndarray): States with shape (B, d).
+  Q (numpy.ndarray): Tangent vectors stored as columns, shape (B, d, k).
+  h (float): Step size.
+  params (dict): Parameter arrays of shape (B,).
+
+  Returns:
+  tuple: New states, new tangent vectors and the Jacobian at the start of the step.
+  """
+  J1 = jac(t, Y, **params)
+  k1, K1 = f(t, Y, **params), J1 @ Q
+  Y2, Q2 = Y + 0.5 * h * k1, Q + 0.5 * h * K1
+  k2, K2 = f(t + 0.5 * h, Y2, **params), jac(t + 0.5 * h, Y2, **params) @ Q2
+  Y3, Q3 = Y + 0.5 * h * k2, Q + 0.5 * h * K2
+  k3, K3 = f(t + 0.5 * h, Y3, **params), jac(t + 0.5 * h, Y3, **params) @ Q3
+  Y4, Q4 = Y + h * k3, Q + h * K3
+  k4, K4 = f(t + h, Y4, **params), jac(t + h, Y4, **params) @ Q4
+  Y = Y + (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+  Q = Q + (h / 6.0) * (K1 + 2 * K2 + 2 * K3 + K4)
+  return Y, Q, J1
+
+
+def Orthonormalize(Q):
+  """
+  Batched QR re-orthonormalization of the tangent vectors.
+
+  The signs are fixed so that the diagonal of R is positive, which keeps the
+  orientation of the tangent basis continuous between re-orthonormalizations.
+
+  Returns:
+  tuple: Orthonormal tangent vectors (B, d, k) and log of the stretching factors (B, k).
+  """
+  Q, R = np.linalg.qr(Q)
+  diag = np.diagonal(R, axis1=-2, axis2=-1)
+  signs = np.where(diag < 0, -1.0, 1.0)
+  Q = Q * signs[:, None, :]
+  return Q, np.log(np.abs(diag) + 1e-300)
+
+
+def LyapunovStream(
+  f, jac, y0, params=None, h=0.01, tTransient=50.0, tMax=1000.0, nExponents=None, qrEvery=10, reportEvery=10.0,
+):
+  """
+  Integrates an ensemble with its tangent dynamics and yields running Lyapunov estimates.
+
+  Parameters:
+  f (function): Batched model f(t, Y, **params).
+  jac (function): Batched analytic Jacobian jac(t, Y, **params).
+  y0 (array-like): One initial condition (d,) or a batch of them (B, d).
+  params (dict): Parameter name -> scalar or array of shape (B,).
+  h (float): RK4 step size.
+  tTransient (float): Time discarded before the tangent vectors are accumulated.
+  tMax (float): Averaging time after the transient.
+  nExponents (int): Number of leading exponents (default: the full spectrum).
+  qrEvery (int): RK4 steps between QR re-orthonormalizations.
+  reportEvery (float): Averaging time between two yielded reports.
+
+  Yields:
+  dict: Report with the averaging time "t", the running "exponents" (B, k),
+    "change" (B,), the largest change of any exponent since the previous report,
+    and "traceGap" (B,), the sum of the exponents minus the time-averaged trace of
+    the Jacobian (both equal the mean phase-space contraction rate when k = d).
+  """
+  Y, params = BroadcastEnsemble(y0, params or {})
+  B, d = Y.shape
+  k = nExponents or d
+  t = 0.0
+
+  # Settle onto the attractor first; the tangent vectors are not needed here.
+  for _ in range(int(round(tTransient / h))):
+    k1 = f(t, Y, **params)
+    k2 = f(t + 0.5 * h, Y + 0.5 * h * k1, **params)
+    k3 = f(t + 0.5 * h, Y + 0.5 * h * k2, **params)
+    k4 = f(t + h, Y + h * k3, **params)
+    Y = Y + (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+    t += h
+
+  Q = np.broadcast_to(np.eye(d)[:, :k], (B, d, k)).copy()
+  logSums = np.zeros((B, k))
+  traceSum = np.zeros(B)
+  previous = np.full((B, k), np.nan)
+  stepsPerReport = max(qrEvery, int(round(reportEvery / h / qrEvery)) * qrEvery)
+  nSteps = int(round(tMax / h))
+
+  for step in range(1, nSteps + 1):
+    Y, Q, J = TangentRK4Step(f, jac, t, Y, Q, h, params)
+    traceSum += np.trace(J, axis1=-2, axis2=-1) * h
+    t += h
+    if (step % qrEvery == 0) or (step == nSteps):
+      Q, logStretch = Orthonormalize(Q)
+      logSums += logStretch
+    if (step % stepsPerReport == 0) or (step == nSteps):
+      elapsed = step * h
+      exponents = logSums / elapsed
+      report = {
+        "t"        : elapsed,
+        "exponents": exponents,
+        "change"   : np.max(np.abs(exponents - previous), axis=1),
+        "traceGap" : exponents.sum(axis=1) - traceSum / elapsed,
+        "state"    : Y,
+      }
+      previous = exponents
+      yield report
+
+
+def LyapunovSpectrum(f, jac, y0, params=None, tol=1e-3, minTime=100.0, verbose=False, **options):
+  """
+  Runs LyapunovStream until every ensemble member has converged or tMax is reached.
+
+  A member is converged when no exponent moved by more than tol between two
+  consecutive reports after at least minTime of averaging.
+
+  Parameters:
+  f, jac, y0, params: See LyapunovStream.
+  tol (float): Convergence tolerance on the change between reports.
+  minTime (float): Minimum averaging time before convergence is accepted.
+  verbose (bool): Print a line per report.
+  **options: Passed to LyapunovStream (h, tTransient, tMax, nExponents, qrEvery, reportEvery).
+
+  Returns:
+  exponents (numpy.ndarray): Final estimates (B, k), sorted in decreasing order.
+  history (dict): Report times "t" (n,), running "exponents" (n, B, k),
+    "change" (n, B), "traceGap" (n, B) and the boolean "converged" mask (B,).
+  """
+  history = {"t": [], "exponents": [], "change": [], "traceGap": []}
+  converged = None
+  for report in LyapunovStream(f, jac, y0, params, **options):
+    for key in history:
+      history[key].append(report[key])
+    converged = (report["change"] < tol) & (report["t"] >= minTime)
+    if (verbose):
+      print(
+        f"t = {report['t']:8.1f}  max change = {np.nanmax(report['change']):.2e}  "
+        f"converged = {converged.sum()}/{converged.size}"
+      )
+    if (converged.all()):
+      break
+  history = {key: np.array(value) for key, value in history.items()}
+  history["converged"] = converged
+  return -np.sort(-history["exponents"][-1], axis=1), history
+
+
+def ClassifyRegime(exponents, tol=0.005):
+  """
+  Labels each ensemble member from its leading exponents.
+
+  Parameters:
+  exponents (numpy.ndarray): Sorted exponents with shape (B, k).
+  tol (float): Values within +/- tol are treated as zero.
+
+  Returns:
+  numpy.ndarray: One of "chaotic", "quasi-periodic", "periodic" or "fixed point" per member.
+  """
+  positive = (exponents > tol).sum(axis=1)
+  zero = (np.abs(exponents) <= tol).sum(axis=1)
+  return np.where(
+    positive > 0, "chaotic",
+    np.where(zero >= 2, "quasi-periodic", np.where(zero == 1, "periodic", "fixed point")),
+  )
+
+
+# ==============================================================
+# ========== Spectra of the Four Lecture 08 Models =============
+# ==============================================================
+# Reference spectra: Lorenz (0.906, 0, -14.57) and Rössler (0.071, 0, -5.39).
+cases = [
+  ("Lorenz", lorenz, lorenzJacobian, [0.0, 1.0, 2.0], {}, 0.01),
+  ("Rössler", rossler, rosslerJacobian, [0.0, 0.1, 0.2], {}, 0.02),
+  ("Forced Van der Pol", vanDerPol, vanDerPolJacobian, [2.5, 5.0], {}, 0.02),
+  (
+    "Hindmarsh-Rose (bursting)", hindmarshRose, hindmarshRoseJacobian, [1.0, 1.0, 1.0],
+    {"I": 3.25, "r": 0.006, "x0": -1.6}, 0.01,
+  ),
+]
+table = pt.PrettyTable()
+table.field_names = ["Model", "Exponents", "Sum - <tr J>", "Averaging Time", "Regime", "Time (s)"]
+for name, f, jac, y0, params, h in cases:
+  start = time.perf_counter()
+  exponents, history = LyapunovSpectrum(f, jac, y0, params, h=h, tMax=2000.0, tol=1e-3)
+  elapsed = time.perf_counter() - start
+  table.add_row([
+    name,
+    np.array2string(exponents[0], precision=3),
+    f"{history['traceGap'][-1, 0]:.1e}",
+    f"{history['t'][-1]:.0f}",
+    ClassifyRegime(exponents)[0],
+    f"{elapsed:.2f}",
+  ])
+print(table)
+
+# ==============================================================
+# =========== Batched Ensemble: Lorenz Sweep over rho ==========
+# ==============================================================
+# One vectorized run per rho value; all members share every RK4 stage and QR call.
+rhoValues = np.linspace(0.5, 200, 200)
+start = time.perf_counter()
+rhoExponents, rhoHistory = LyapunovSpectrum(
+  lorenz, lorenzJacobian, [1.0, 1.0, 1.0], {"rho": rhoValues}, h=0.005, tMax=300.0, minTime=100.0,
+)
+print(
+  f"Lorenz rho sweep: {rhoValues.size} members in {time.perf_counter() - start:.2f} s, "
+  f"{rhoHistory['converged'].sum()} converged, "
+  f"{(ClassifyRegime(rhoExponents) == 'chaotic').sum()} classified as chaotic."
+)
+
+# Ensemble over initial conditions at the classical parameters: the largest exponent
+# should not depend on where on the attractor the run starts.
+rng = np.random.default_rng(0)
+ensembleExponents, _ = LyapunovSpectrum(
+  lorenz, lorenzJacobian, rng.uniform(-10, 10, (32, 3)) + [0, 0, 25], h=0.01, tMax=500.0,
+)
+print(
+  f"Largest Lorenz exponent over 32 initial conditions: "
+  f"{ensembleExponents[:, 0].mean():.3f} +/- {ensembleExponents[:, 0].std():.3f}"
+)
+
+# Plot the running estimates and the sweep.
+_, lorenzHistory = LyapunovSpectrum(lorenz, lorenzJacobian, [0.0, 1.0, 2.0], h=0.01, tMax=500.0, tol=0.0)
+plt.figure(figsize=(14, 5))
+plt.subplot(1, 2, 1)
+for i in range(3):
+  plt.plot(lorenzHistory["t"], lorenzHistory["exponents"][:, 0, i], label=f"Lambda {i + 1}")
+plt.xlabel("Averaging Time", fontsize=12)
+plt.ylabel("Running Estimate", fontsize=12)
+plt.title("Convergence of the Lorenz Spectrum", fontsize=14)
+plt.legend()  # Add legend to the plot.
+plt.grid()  # Add grid to the plot.
+
+plt.subplot(1, 2, 2)
+plt.plot(rhoValues, rhoExponents[:, 0], "b.-", label="Largest exponent")
+plt.axhline(0, color="k", lw=0.8)
+plt.xlabel("Parameter (rho)", fontsize=12)
+plt.ylabel("Lambda 1", fontsize=12)
+plt.title("Lorenz: Chaotic vs Regular Regimes", fontsize=14)
+plt.legend()  # Add legend to the plot.
+plt.grid()  # Add grid to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+
+plt.savefig("Lecture_08_Lab_Exercise_5_Lyapunov.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
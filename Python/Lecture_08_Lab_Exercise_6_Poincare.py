@@ -0,0 +1,308 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+
+
+# Batched models: states have shape (B, d) and every parameter is a scalar or an array of shape (B,).
+def rossler(t, Y, a=0.2, b=0.2, c=5.7):
+  """
+  Rössler-type population model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = Y[:, 0], Y[:, 1], Y[:, 2]
+  dxdt = -y - z
+  dydt = x + a * y
+  dzdt = b + z * (x - c)
+  return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def vanDerPol(t, Y, mu=1.0, force=0.5, omega=0.5):
+  """
+  Forced Van der Pol oscillator (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, v = Y[:, 0], Y[:, 1]
+  dxdt = v
+  dvdt = mu * (1 - x ** 2) * v - x + force * np.cos(omega * t)
+  return np.stack([dxdt, dvdt], axis=-1)
+
+
+def RK4Step(f, t, Y, h, params, k1=None):
+  """
+  One classical RK4 step for a batch of states; also returns the slope at the new point.
+  """
+  k1 = f(t, Y, **params) if (k1 is None) else k1
+  k2 = f(t + 0.5 * h, Y + 0.5 * h * k1, **params)
+  k3 = f(t + 0.5 * h, Y + 0.5 * h * k2, **params)
+  k4 = f(t + h, Y + h * k3, **params)
+  Yn = Y + (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+  return Yn, f(t + h, Yn, **params)
+
+
+def HermiteCrossing(g0, g1, dg0, dg1, h, iterations=30):
+  """
+  Locates the zero of the cubic Hermite interpolant of g on one step for a batch of crossings.
+
+  Parameters:
+  g0, g1 (numpy.ndarray): Section function at both ends of the step (opposite signs).
+  dg0, dg1 (numpy.ndarray): Time derivatives of the section function at both ends.
+  h (float): Step size.
+  iterations (int): Bisection iterations (2^-30 of the step is below RK4 round-off).
+
+  Returns:
+  numpy.ndarray: Fraction theta in [0, 1] of the step where the crossing happens.
+  """
+
+  def Cubic(theta):
+    h00 = 2 * theta ** 3 - 3 * theta ** 2 + 1
+    h10 = theta ** 3 - 2 * theta ** 2 + theta
+    h01 = -2 * theta ** 3 + 3 * theta ** 2
+    h11 = theta ** 3 - theta ** 2
+    return h00 * g0 + h10 * h * dg0 + h01 * g1 + h11 * h * dg1
+
+  lo, hi = np.zeros_like(g0), np.ones_like(g0)
+  for _ in range(iterations):
+    mid = 0.5 * (lo + hi)
+    left = np.sign(Cubic(mid)) == np.sign(g0)
+    lo, hi = np.where(left, mid, lo), np.where(left, hi, mid)
+  return 0.5 * (lo + hi)
+
+
+def HermiteState(Y0, Y1, F0, F1, h, theta):
+  """
+  Evaluates the cubic Hermite interpolant of the state at fractions theta of the step.
+  """
+  theta = theta[:, None]
+  h00 = 2 * theta ** 3 - 3 * theta ** 2 + 1
+  h10 = theta ** 3 - 2 * theta ** 2 + theta
+  h01 = -2 * theta ** 3 + 3 * theta ** 2
+  h11 = theta ** 3 - theta ** 2
+  return h00 * Y0 + h10 * h * F0 + h01 * Y1 + h11 * h * F1
+
+
+class SectionRecorder:
+  """
+  Fixed-size per-member buffer for Poincaré points.
+
+  Points are written in place into a (B, maxPoints, d) array; members that
+  reach maxPoints simply stop recording, so memory never grows with time.
+  """
+
+  def __init__(self, B, d, maxPoints):
+    self.points = np.full((B, maxPoints, d), np.nan)
+    self.times = np.full((B, maxPoints), np.nan)
+    self.counts = np.zeros(B, dtype=int)
+
+  def Record(self, members, t, Y):
+    keep = self.counts[members] < self.points.shape[1]
+    members, t, Y = members[keep], t[keep], Y[keep]
+    self.points[members, self.counts[members]] = Y
+    self.times[members, self.counts[members]] = t
+    self.counts[members] += 1
+
+  def Full(self):
+    return np.all(self.counts >= self.points.shape[1])
+
+
+def BroadcastEnsemble(y0, params):
+  """
+  Broadcasts initial conditions (d,) or (B, d) and parameters (scalar or (B,)) to a common size.
+  """
+  Y = np.atleast_2d(np.asarray(y0, dtype=float))
+  sizes = [Y.shape[0]] + [np.size(value) for value in params.values()]
+  B = max(sizes)
+  if (any(size not in (1, B) for size in sizes)):
+    raise ValueError(f"Ensemble sizes {sizes} cannot be broadcast together.")
+  Y = np.broadcast_to(Y, (B, Y.shape[1])).copy()
+  params = {name: np.broadcast_to(np.asarray(value, dtype=float), (B,)).copy() for name, value in params.items()}
+  return Y, params
+
+
+def StroboscopicSection(f, y0, params, period, nPoints, nTransient=200, stepsPerPeriod=100):
+  """
+  Records the state once per forcing period for a batch of parameter values.
+
+  The step size is period / stepsPerPeriod, so the section times fall exactly on
+  the RK4 grid and no interpolation is needed. All members share one period.
+
+  Parameters:
+  f (function): Batched model f(t, Y, **params).
+  y0 (array-like): Initial condition (d,) or (B, d).
+  params (dict): Parameter name -> scalar or array of shape (B,).
+  period (float): Forcing period 2 * pi / omega.
+  nPoints (int): Section points recorded per member.
+  nTransient (int): Forcing periods discarded before recording.
+  stepsPerPeriod (int): RK4 steps per forcing period.
+
+  Returns:
+  numpy.ndarray: Section points with shape (B, nPoints, d).
+  """
+  Y, params = BroadcastEnsemble(y0, params)
+  h = period / stepsPerPeriod
+  points = np.empty((Y.shape[0], nPoints, Y.shape[1]))
+  F = f(0.0, Y, **params)
+  for n in range(nTransient + nPoints):
+    for i in range(stepsPerPeriod):
+      Y, F = RK4Step(f, (n * stepsPerPeriod + i) * h, Y, h, params, F)
+    if (n >= nTransient):
+      points[:, n - nTransient] = Y
+  return points
+
+
+def HyperplaneSection(
+  f, y0, params, normal, offset=0.0, direction=1, nPoints=200, h=0.01, tTransient=200.0, tMax=np.inf,
+):
+  """
+  Records the crossings of the hyperplane normal . y = offset for a batch of parameter values.
+
+  Sign changes are detected after every RK4 step and located on the cubic Hermite
+  interpolant built from the states and slopes at both ends of the step, so the
+  crossings keep the accuracy of the integrator at no extra model evaluations.
+
+  Parameters:
+  f (function): Batched model f(t, Y, **params).
+  y0 (array-like): Initial condition (d,) or (B, d).
+  params (dict): Parameter name -> scalar or array of shape (B,).
+  normal (array-like): Normal vector of the section plane.
+  offset (float): Plane offset.
+  direction (int): +1 for upward crossings, -1 for downward, 0 for both.
+  nPoints (int): Maximum number of section points per member.
+  h (float): RK4 step size.
+  tTransient (float): Integration time discarded before recording.
+  tMax (float): Hard stop for members that cross rarely (e.g. at a stable equilibrium).
+
+  Returns:
+  points (numpy.ndarray): Section points (B, nPoints, d), NaN where fewer were found.
+  times (numpy.ndarray): Crossing times (B, nPoints).
+  counts (numpy.ndarray): Number of points recorded per member.
+  """
+  Y, params = BroadcastEnsemble(y0, params)
+  normal = np.asarray(normal, dtype=float)
+  recorder = SectionRecorder(Y.shape[0], Y.shape[1], nPoints)
+  F = f(0.0, Y, **params)
+  t, step = 0.0, 0
+  while (not recorder.Full()) and (t < tTransient + tMax):
+    Yn, Fn = RK4Step(f, t, Y, h, params, F)
+    if (t >= tTransient):
+      g0, g1 = Y @ normal - offset, Yn @ normal - offset
+      crossed = (g0 * g1 < 0) | ((g1 == 0) & (g0 != 0))
+      if (direction != 0):
+        crossed &= np.sign(g1 - g0) == direction
+      members = np.flatnonzero(crossed)
+      if (members.size):
+        theta = HermiteCrossing(
+          g0[members], g1[members], F[members] @ normal, Fn[members] @ normal, h,
+        )
+        recorder.Record(
+          members, t + theta * h,
+          HermiteState(Y[members], Yn[members], F[members], Fn[members], h, theta),
+        )
+    Y, F = Yn, Fn
+    step += 1
+    t = step * h
+  return recorder.points, recorder.times, recorder.counts
+
+
+def OrbitDiagram(parameterValues, points, coordinate=0):
+  """
+  Flattens section points into (parameter, coordinate) pairs for plotting.
+
+  Parameters:
+  parameterValues (numpy.ndarray): Swept values with shape (B,).
+  points (numpy.ndarray): Section points with shape (B, n, d).
+  coordinate (int): State component to plot.
+
+  Returns:
+  tuple: Two 1D arrays with the parameter and coordinate of every valid point.
+  """
+  values = points[:, :, coordinate]
+  valid = ~np.isnan(values)
+  return np.broadcast_to(parameterValues[:, None], values.shape)[valid], values[valid]
+
+
+def CountPeriod(points, coordinate=0, decimals=3, maxPeriod=32):
+  """
+  Number of distinct section values per member (maxPeriod + 1 stands for chaotic or quasi-periodic).
+  """
+  periods = np.empty(points.shape[0], dtype=int)
+  for i, row in enumerate(points[:, :, coordinate]):
+    distinct = np.unique(np.round(row[~np.isnan(row)], decimals)).size
+    periods[i] = distinct if (distinct <= maxPeriod) else maxPeriod + 1
+  return periods
+
+
+# ==============================================================
+# ========= Stroboscopic Section of the Forced Van der Pol =====
+# ==============================================================
+# Sweep the forcing amplitude at mu = 5 and omega = 2.463: quasi-periodic motion at weak
+# forcing, then frequency locking, a chaotic window near force = 5 and a period-3 orbit.
+omega = 2.463
+forceValues = np.linspace(0.0, 10.0, 1000)
+table = pt.PrettyTable()
+table.field_names = ["Section", "Members", "Points", "Stored (MB)", "Trajectory (MB)", "Time (s)"]
+
+start = time.perf_counter()
+vdpPoints = StroboscopicSection(
+  vanDerPol, [2.5, 5.0], {"mu": 5.0, "force": forceValues, "omega": omega},
+  period=2 * np.pi / omega, nPoints=500, nTransient=200, stepsPerPeriod=200,
+)
+elapsed = time.perf_counter() - start
+table.add_row([
+  "Van der Pol (t = k T)", forceValues.size, vdpPoints.shape[0] * vdpPoints.shape[1],
+  f"{vdpPoints.nbytes / 2 ** 20:.1f}", f"{forceValues.size * 700 * 200 * 3 * 8 / 2 ** 20:.0f}", f"{elapsed:.2f}",
+])
+
+# ==============================================================
+# ================ Rössler Section x = 0 Over c ================
+# ==============================================================
+cValues = np.linspace(2.0, 6.0, 1000)
+start = time.perf_counter()
+rosslerPoints, rosslerTimes, rosslerCounts = HyperplaneSection(
+  rossler, [0.0, 0.1, 0.2], {"a": 0.2, "b": 0.2, "c": cValues},
+  normal=[1.0, 0.0, 0.0], direction=-1, nPoints=500, h=0.05, tTransient=300.0, tMax=5000.0,
+)
+elapsed = time.perf_counter() - start
+nSteps = int(np.nanmax(rosslerTimes) / 0.05)  # Steps a dense trajectory would need.
+table.add_row([
+  "Rössler (x = 0)", cValues.size, rosslerCounts.sum(),
+  f"{rosslerPoints.nbytes / 2 ** 20:.1f}", f"{cValues.size * nSteps * 4 * 8 / 2 ** 20:.0f}", f"{elapsed:.2f}",
+])
+print(table)
+
+periods = CountPeriod(rosslerPoints, coordinate=1, decimals=2)
+for label, c in [("Period 1", 2.5), ("Period 2", 3.5), ("Period 4", 4.0), ("Chaotic", 5.7)]:
+  i = np.argmin(np.abs(cValues - c))
+  print(f"Rössler c = {cValues[i]:.3f}: {periods[i]} distinct section value(s) ({label} expected).")
+
+# Plot the two orbit diagrams.
+plt.figure(figsize=(14, 5))
+plt.subplot(1, 2, 1)
+p, x = OrbitDiagram(forceValues, vdpPoints, coordinate=0)
+plt.plot(p, x, ",k", alpha=0.3)
+plt.xlabel("Parameter (force)", fontsize=12)
+plt.ylabel("x at t = k T", fontsize=12)
+plt.title("Forced Van der Pol Orbit Diagram", fontsize=14)
+plt.grid()  # Add grid to the plot.
+
+plt.subplot(1, 2, 2)
+p, y = OrbitDiagram(cValues, rosslerPoints, coordinate=1)
+plt.plot(p, y, ",k", alpha=0.3)
+plt.xlabel("Parameter (c)", fontsize=12)
+plt.ylabel("y at x = 0", fontsize=12)
+plt.title("Rössler Orbit Diagram", fontsize=14)
+plt.grid()  # Add grid to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+
+plt.savefig("Lecture_08_Lab_Exercise_6_Poincare.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
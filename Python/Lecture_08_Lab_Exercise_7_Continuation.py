@@ -0,0 +1,342 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.optimize import fsolve
+
+
+# Models take the state x with shape (n,) and the parameter r, and return dx/dt with shape (n,).
+def SaddleNode(x, r):
+  """
+  Saddle-node normal form (Lecture_08_Lab_Exercise_1_Bifurcations.py).
+  """
+  return r + x ** 2
+
+
+def Transcritical(x, r):
+  """
+  Transcritical normal form (Lecture_08_Lab_Exercise_1_Bifurcations.py).
+  """
+  return r * x - x ** 2
+
+
+def Pitchfork(x, r):
+  """
+  Pitchfork normal form (Lecture_08_Lab_Exercise_1_Bifurcations.py).
+  """
+  return r * x - x ** 3
+
+
+def FitzHughNagumo(z, I, epsilon=0.08, a=0.7, b=0.8):
+  """
+  FitzHugh-Nagumo model (Lecture_08_Lab_Exercise_1_Bifurcations.py) with the stimulus I as parameter.
+  """
+  v, w = z
+  dvdt = v - (v ** 3) / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return np.array([dvdt, dwdt])
+
+
+class CountedModel:
+  """
+  Wraps a model f(x, r) and counts its evaluations and the Newton iterations.
+  """
+
+  def __init__(self, f):
+    self.f = f
+    self.evaluations = 0
+    self.newtonIterations = 0
+
+  def __call__(self, x, r):
+    self.evaluations += 1
+    return np.atleast_1d(np.asarray(self.f(x, r), dtype=float))
+
+
+def Jacobians(f, x, r, h=1e-7):
+  """
+  Central-difference Jacobians of f with respect to the state (n, n) and the parameter (n,).
+  """
+  n = x.size
+  Fx = np.empty((n, n))
+  for j in range(n):
+    e = np.zeros(n)
+    e[j] = h
+    Fx[:, j] = (f(x + e, r) - f(x - e, r)) / (2 * h)
+  Fr = (f(x, r + h) - f(x, r - h)) / (2 * h)
+  return Fx, Fr
+
+
+def Tangent(Fx, Fr, previous=None):
+  """
+  Unit tangent of the branch: the null vector of [Fx | Fr], oriented along the previous tangent.
+  """
+  _, _, Vt = np.linalg.svd(np.column_stack([Fx, Fr]))
+  tau = Vt[-1]
+  if (previous is not None) and (tau @ previous < 0):
+    tau = -tau
+  return tau
+
+
+def Corrector(f, uPred, tau, tol=1e-10, maxIter=8):
+  """
+  Newton corrector on F(x, r) = 0 plus the pseudo-arclength condition tau . (u - uPred) = 0.
+
+  Returns:
+  tuple: Corrected point (or None on failure), number of iterations used.
+  """
+  u = uPred.copy()
+  for iteration in range(1, maxIter + 1):
+    F = f(u[:-1], u[-1])
+    Fx, Fr = Jacobians(f, u[:-1], u[-1])
+    M = np.vstack([np.column_stack([Fx, Fr]), tau])
+    rhs = -np.append(F, tau @ (u - uPred))
+    try:
+      du = np.linalg.solve(M, rhs)
+    except np.linalg.LinAlgError:
+      du = np.linalg.lstsq(M, rhs, rcond=None)[0]  # Exactly at a branch point M is singular.
+    u = u + du
+    if (isinstance(f, CountedModel)):
+      f.newtonIterations += 1
+    if (np.linalg.norm(du) < tol) and (np.linalg.norm(f(u[:-1], u[-1])) < 1e-8):
+      return u, iteration
+  return None, maxIter
+
+
+def TestFunctions(f, u, tau):
+  """
+  Evaluates the eigenvalues and the fold, branch-point and Hopf test functions at a point.
+
+  - Fold: the parameter component of the tangent changes sign.
+  - Branch point: the determinant of the augmented Jacobian [[Fx, Fr], [tau]] changes sign.
+  - Hopf: the product of (lambda_i + lambda_j) over all eigenvalue pairs changes sign.
+  """
+  Fx, Fr = Jacobians(f, u[:-1], u[-1])
+  eigenvalues = np.linalg.eigvals(Fx)
+  n = eigenvalues.size
+  hopf = np.prod([
+    (eigenvalues[i] + eigenvalues[j]).real for i in range(n) for j in range(i + 1, n)
+  ]) if (n > 1) else 1.0
+  tests = {
+    "fold": tau[-1],
+    "branch": np.linalg.det(np.vstack([np.column_stack([Fx, Fr]), tau])),
+    "hopf"  : hopf,
+  }
+  return eigenvalues, tests
+
+
+def LocateSpecialPoint(f, u0, tau0, ds, kind, g0, g1, iterations=12):
+  """
+  Locates the zero of a test function between two accepted points with the Illinois variant of regula falsi.
+
+  Returns:
+  numpy.ndarray: The special point u = (x, r).
+  """
+  lo, hi, gLo, gHi = 0.0, ds, g0, g1
+  u = u0
+  for _ in range(iterations):
+    s = hi - gHi * (hi - lo) / (gHi - gLo)
+    uPred = u0 + s * tau0
+    u, _ = Corrector(f, uPred, tau0)
+    if (u is None):
+      break
+    Fx, Fr = Jacobians(f, u[:-1], u[-1])
+    g = TestFunctions(f, u, Tangent(Fx, Fr, tau0))[1][kind]
+    if (np.sign(g) == np.sign(gLo)):
+      lo, gLo, gHi = s, g, 0.5 * gHi
+    else:
+      hi, gHi, gLo = s, g, 0.5 * gLo
+    if (abs(hi - lo) < 1e-10):
+      break
+  return u if (u is not None) else u0 + 0.5 * ds * tau0
+
+
+def ContinueBranch(
+  f, u, tau, rBounds, xBounds=(-np.inf, np.inf), ds=0.02, dsMin=1e-6, dsMax=0.1, maxSteps=5000, skipFirst=False,
+):
+  """
+  Follows one equilibrium branch from the point u along the tangent tau.
+
+  Parameters:
+  f (function): Model f(x, r).
+  u (numpy.ndarray): Starting point (x, r) on the branch.
+  tau (numpy.ndarray): Initial unit tangent.
+  rBounds (tuple): Parameter window; the branch stops when it leaves it.
+  xBounds (tuple): State window applied to every component.
+  ds, dsMin, dsMax (float): Initial, minimal and maximal arclength step.
+  maxSteps (int): Maximum number of accepted steps.
+  skipFirst (bool): Skip detection on the first step (used after branch switching).
+
+  Returns:
+  dict: "x" (m, n), "r" (m,), "stable" (m,) and "special" (list of detected points).
+  """
+  points, stability, special = [u], [], []
+  eigenvalues, tests = TestFunctions(f, u, tau)
+  stability.append(np.all(eigenvalues.real < 0))
+  for step in range(maxSteps):
+    uNew, iterations = Corrector(f, u + ds * tau, tau)
+    if (uNew is None):
+      ds *= 0.5
+      if (ds < dsMin):
+        break
+      continue
+    Fx, Fr = Jacobians(f, uNew[:-1], uNew[-1])
+    tauNew = Tangent(Fx, Fr, tau)
+    eigenvalues, testsNew = TestFunctions(f, uNew, tauNew)
+    if (not (skipFirst and step == 0)):
+      for kind in ("fold", "branch", "hopf"):
+        if (np.sign(tests[kind]) * np.sign(testsNew[kind]) < 0):
+          uStar = LocateSpecialPoint(f, u, tau, ds, kind, tests[kind], testsNew[kind])
+          if (kind == "hopf"):
+            # A neutral saddle (real eigenvalues summing to zero) also changes the sign; keep true Hopf points.
+            star = np.linalg.eigvals(Jacobians(f, uStar[:-1], uStar[-1])[0])
+            if (np.all(np.abs(star.imag) < 1e-8)):
+              continue
+          special.append({"type": kind, "x": uStar[:-1], "r": uStar[-1], "tangent": tau})
+    points.append(uNew)
+    stability.append(np.all(eigenvalues.real < 0))
+    u, tau, tests = uNew, tauNew, testsNew
+    if (iterations <= 3):
+      ds = min(1.5 * ds, dsMax)  # Fast convergence: lengthen the step.
+    elif (iterations >= 6):
+      ds = max(0.5 * ds, dsMin)  # Slow convergence: shorten the step.
+    if (not (rBounds[0] <= u[-1] <= rBounds[1])) or np.any(u[:-1] < xBounds[0]) or np.any(u[:-1] > xBounds[1]):
+      break
+  points = np.array(points)
+  return {"x": points[:, :-1], "r": points[:, -1], "stable": np.array(stability), "special": special}
+
+
+def Continuation(
+  f, x0, r0, rBounds, xBounds=(-np.inf, np.inf), switchBranches=True, maxBranches=8, **options,
+):
+  """
+  Computes a bifurcation diagram by pseudo-arclength continuation from one equilibrium.
+
+  The starting guess is corrected at fixed r, the branch is followed in both
+  directions, and at every detected branch point the crossing branch is started
+  along the second null vector of [Fx | Fr].
+
+  Parameters:
+  f (function): Model f(x, r).
+  x0 (array-like): Guess of an equilibrium at r = r0.
+  r0 (float): Starting parameter value.
+  rBounds (tuple): Parameter window of the diagram.
+  xBounds (tuple): State window of the diagram.
+  switchBranches (bool): Follow the crossing branches at branch points.
+  maxBranches (int): Maximum number of branches.
+  **options: Passed to ContinueBranch (ds, dsMin, dsMax, maxSteps).
+
+  Returns:
+  list: Branch dictionaries (see ContinueBranch).
+  """
+  x = np.atleast_1d(np.asarray(x0, dtype=float))
+  x = fsolve(lambda y: f(y, r0), x)
+  u = np.append(x, r0)
+  Fx, Fr = Jacobians(f, x, r0)
+  tau = Tangent(Fx, Fr)
+
+  queue = [(u, tau, False), (u, -tau, False)]
+  branches, visited = [], []
+  while (queue) and (len(branches) < maxBranches):
+    u, tau, skipFirst = queue.pop(0)
+    branch = ContinueBranch(f, u, tau, rBounds, xBounds, skipFirst=skipFirst, **options)
+    branches.append(branch)
+    for point in branch["special"]:
+      uStar = np.append(point["x"], point["r"])
+      if (point["type"] != "branch") or (not switchBranches):
+        continue
+      if (any(np.linalg.norm(uStar - v) < 1e-4 for v in visited)):
+        continue  # Already switched here (the crossing branch meets this point too).
+      visited.append(uStar)
+      Fx, Fr = Jacobians(f, uStar[:-1], uStar[-1])
+      _, _, Vt = np.linalg.svd(np.column_stack([Fx, Fr]))
+      kernel = Vt[-2:]  # Two-dimensional kernel at a simple branch point.
+      phi = kernel[np.argmin(np.abs(kernel @ point["tangent"]))]
+      phi = phi - (phi @ point["tangent"]) * point["tangent"]
+      phi /= np.linalg.norm(phi)
+      step = options.get("ds", 0.02)
+      for sign in (1, -1):
+        uStart, _ = Corrector(f, uStar + sign * step * phi, phi)
+        if (uStart is not None):
+          Fx, Fr = Jacobians(f, uStart[:-1], uStart[-1])
+          queue.append((uStart, Tangent(Fx, Fr, sign * phi), True))
+  return branches
+
+
+def PlotBranches(ax, branches, component=0, title="", xLabel="Parameter (r)", yLabel="Equilibrium Points (x)"):
+  """
+  Plots branches split into stable (solid) and unstable (dashed) parts with the detected special points.
+  """
+  markers = {"fold": ("ko", "Fold"), "branch": ("gs", "Branch point"), "hopf": ("m^", "Hopf")}
+  labelled = set()
+  for branch in branches:
+    r, x = branch["r"], branch["x"][:, component]
+    for stable, style, label in ((True, "b-", "Stable"), (False, "r--", "Unstable")):
+      mask = branch["stable"] == stable
+      if (not stable):
+        # Extend each unstable run by one point on both sides so the two parts touch.
+        mask = mask | np.append(mask[1:], False) | np.append(False, mask[:-1])
+      ax.plot(np.where(mask, r, np.nan), np.where(mask, x, np.nan), style, lw=2,
+              label=None if (label in labelled) else label)
+      labelled.add(label)
+    for point in branch["special"]:
+      style, label = markers[point["type"]]
+      ax.plot(point["r"], point["x"][component], style, ms=8, label=None if (label in labelled) else label)
+      labelled.add(label)
+  ax.axhline(0, color="black", lw=0.5, ls="--")
+  ax.set_title(title, fontsize=14)
+  ax.set_xlabel(xLabel, fontsize=12)
+  ax.set_ylabel(yLabel, fontsize=12)
+  ax.legend()  # Add legend to the plot.
+  ax.grid()  # Add grid to the plot.
+
+
+def LegacySolveCount(f, values, guesses):
+  """
+  Function evaluations used by the Lecture 08 per-parameter fsolve loops.
+  """
+  total = 0
+  for r in values:
+    total += fsolve(f, guesses, args=(r,), full_output=True)[1]["nfev"]
+  return total
+
+
+cases = [
+  ("Saddle-Node", SaddleNode, [-1.0], -1.0, (-1, 1), (-1.5, 1.5), np.linspace(-1, 1, 1000), [-1, 1]),
+  ("Transcritical", Transcritical, [0.0], -1.0, (-1, 1), (-1.5, 1.5), np.linspace(-1, 1, 250), [-1, 1]),
+  ("Pitchfork", Pitchfork, [0.0], -1.0, (-1, 1), (-1.5, 1.5), np.linspace(-1, 1, 500), [-1, 0, 1]),
+  ("Hopf (FitzHugh-Nagumo)", FitzHughNagumo, [-1.2, -0.6], -2.5, (-2.5, 2.5), (-5, 5),
+   np.linspace(-2.5, 2.5, 500), [0, 0]),
+]
+table = pt.PrettyTable()
+table.field_names = ["Diagram", "Branches", "Points", "Newton Its", "f Evals", "fsolve f Evals", "Special Points"]
+fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+for ax, (name, model, x0, r0, rBounds, xBounds, legacyValues, legacyGuesses) in zip(axes.ravel(), cases):
+  counted = CountedModel(model)
+  branches = Continuation(counted, x0, r0, rBounds, xBounds, dsMax=0.1)
+  found = [
+    f"{point['type']} at r = {point['r']:.4f}" for branch in branches for point in branch["special"]
+  ]
+  table.add_row([
+    name, len(branches), sum(branch["r"].size for branch in branches), counted.newtonIterations,
+    counted.evaluations, LegacySolveCount(model, legacyValues, legacyGuesses), "; ".join(sorted(set(found))),
+  ])
+  PlotBranches(
+    ax, branches, title=f"{name} Bifurcation Diagram",
+    xLabel="Parameter (I)" if ("Hopf" in name) else "Parameter (r)",
+    yLabel="Equilibrium Membrane Potential (v)" if ("Hopf" in name) else "Equilibrium Points (x)",
+  )
+print(table)
+plt.tight_layout()  # Adjust layout to prevent overlap.
+plt.savefig("Lecture_08_Lab_Exercise_7_Continuation.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
@@ -0,0 +1,234 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import warnings
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.optimize import fsolve
+
+
+# Polynomial right-hand sides as coefficient rows (highest power first) for every r at once.
+def SaddleNodeCoefficients(r):
+  """
+  Coefficients of r + x^2 (Lecture_08_Lab_Exercise_1_Bifurcations.py) with shape (B, 3).
+  """
+  r = np.asarray(r, dtype=float)
+  return np.stack([np.ones_like(r), np.zeros_like(r), r], axis=-1)
+
+
+def TranscriticalCoefficients(r):
+  """
+  Coefficients of r x - x^2 (Lecture_08_Lab_Exercise_1_Bifurcations.py) with shape (B, 3).
+  """
+  r = np.asarray(r, dtype=float)
+  return np.stack([-np.ones_like(r), r, np.zeros_like(r)], axis=-1)
+
+
+def PitchforkCoefficients(r):
+  """
+  Coefficients of r x - x^3 (Lecture_08_Lab_Exercise_1_Bifurcations.py) with shape (B, 4).
+  """
+  r = np.asarray(r, dtype=float)
+  return np.stack([-np.ones_like(r), np.zeros_like(r), r, np.zeros_like(r)], axis=-1)
+
+
+def BatchedPolyval(coefficients, x):
+  """
+  Horner evaluation of one polynomial per point; coefficients (m, n + 1), x (m,) -> (m,).
+  """
+  result = np.zeros_like(x)
+  for k in range(coefficients.shape[1]):
+    result = result * x + coefficients[:, k]
+  return result
+
+
+def BatchedDerivative(coefficients):
+  """
+  Coefficients of the derivatives of many polynomials; (B, n + 1) -> (B, n).
+  """
+  n = coefficients.shape[1] - 1
+  return coefficients[:, :-1] * np.arange(n, 0, -1)
+
+
+def CompanionRoots(coefficients):
+  """
+  Roots of many polynomials of the same degree from one batched eigenvalue call.
+
+  Parameters:
+  coefficients (numpy.ndarray): Shape (B, n + 1), highest power first, non-zero leading coefficient.
+
+  Returns:
+  numpy.ndarray: Complex roots with shape (B, n).
+  """
+  B, n = coefficients.shape[0], coefficients.shape[1] - 1
+  companion = np.zeros((B, n, n))
+  companion[:, 0, :] = -coefficients[:, 1:] / coefficients[:, :1]
+  companion[:, np.arange(1, n), np.arange(n - 1)] = 1.0
+  return np.linalg.eigvals(companion)
+
+
+def QuadraticRoots(coefficients):
+  """
+  Roots of many real quadratics with the cancellation-free formula; (B, 3) -> (B, 2) complex.
+
+  Everything is computed in real arithmetic; complex pairs only fill the imaginary part.
+  """
+  a, b, c = coefficients[:, 0], coefficients[:, 1], coefficients[:, 2]
+  disc = b * b - 4 * a * c
+  sqrtDisc = np.sqrt(np.abs(disc))
+  realPair = disc >= 0
+  roots = np.empty((coefficients.shape[0], 2), dtype=complex)
+
+  # Real pair: q = -(b + sign(b) sqrt(disc)) / 2 avoids subtracting nearly equal numbers.
+  q = -0.5 * (b + np.where(b >= 0, 1.0, -1.0) * sqrtDisc)
+  safeQ = np.where(q == 0, 1.0, q)
+  roots.real[:, 0] = np.where(realPair, q / a, -0.5 * b / a)
+  roots.real[:, 1] = np.where(realPair, np.where(q == 0, 0.0, c / safeQ), -0.5 * b / a)
+  roots.imag[:, 0] = np.where(realPair, 0.0, 0.5 * sqrtDisc / np.abs(a))
+  roots.imag[:, 1] = -roots.imag[:, 0]
+  return roots
+
+
+def PolynomialRoots(coefficients):
+  """
+  Roots of many polynomials of the same degree.
+
+  Zero constant coefficients shared by every row are deflated as explicit roots
+  at x = 0 first (x (r - x^2) becomes a quadratic). Degrees 1 and 2 then use
+  closed forms and higher degrees use batched companion matrices.
+
+  Parameters:
+  coefficients (numpy.ndarray): Shape (B, n + 1), highest power first.
+
+  Returns:
+  numpy.ndarray: Complex roots with shape (B, n).
+  """
+  coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+  if (np.any(coefficients[:, 0] == 0)):
+    raise ValueError("Every polynomial must have a non-zero leading coefficient.")
+  zeroRoots = 0
+  while (coefficients.shape[1] > 1) and np.all(coefficients[:, -1] == 0):
+    coefficients = coefficients[:, :-1]
+    zeroRoots += 1
+  degree = coefficients.shape[1] - 1
+  if (degree == 0):
+    roots = np.empty((coefficients.shape[0], 0), dtype=complex)
+  elif (degree == 1):
+    roots = (-coefficients[:, 1:] / coefficients[:, :1]).astype(complex)
+  elif (degree == 2):
+    roots = QuadraticRoots(coefficients)
+  else:
+    roots = CompanionRoots(coefficients)
+  return np.concatenate([roots, np.zeros((coefficients.shape[0], zeroRoots), dtype=complex)], axis=1)
+
+
+def PolynomialEquilibria(coefficients, r, imagTol=1e-9, newtonSteps=0, flatTol=1e-9):
+  """
+  Real equilibria of dx/dt = p(x; r) and their stability for every r at once.
+
+  Parameters:
+  coefficients (numpy.ndarray): Shape (B, n + 1), one polynomial per parameter value.
+  r (numpy.ndarray): Parameter values with shape (B,).
+  imagTol (float): Relative imaginary-part tolerance for accepting a root as real.
+  newtonSteps (int): Vectorized Newton polishing steps on the real roots (useful near multiple roots).
+  flatTol (float): |p'(x)| below this is reported as non-hyperbolic.
+
+  Returns:
+  dict: Flat arrays "r", "x", "slope" (p'(x)) and "stability"
+    (-1 stable, +1 unstable, 0 non-hyperbolic) with one entry per real equilibrium.
+  """
+  coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+  roots = PolynomialRoots(coefficients)
+  rows, columns = np.nonzero(np.abs(roots.imag) <= imagTol * (1 + np.abs(roots.real)))
+  x = roots.real[rows, columns]
+
+  # Polish the real roots only; each one is evaluated with the polynomial of its own r.
+  polynomial = coefficients[rows]
+  derivative = BatchedDerivative(polynomial)
+  for _ in range(newtonSteps):
+    slope = BatchedPolyval(derivative, x)
+    safe = np.abs(slope) > flatTol
+    x = np.where(safe, x - BatchedPolyval(polynomial, x) / np.where(safe, slope, 1.0), x)
+  slope = BatchedPolyval(derivative, x)
+  stability = np.where(slope < -flatTol, -1, np.where(slope > flatTol, 1, 0))
+  return {"r": np.asarray(r, dtype=float)[rows], "x": x, "slope": slope, "stability": stability}
+
+
+def FsolveEquilibria(dxdt, rValues, guesses):
+  """
+  The per-r fsolve loop of Lecture_08_Lab_Exercise_1_Bifurcations.py, kept for comparison.
+  """
+  equilibria = []
+  for r in rValues:
+    with warnings.catch_warnings():
+      warnings.simplefilter("ignore", RuntimeWarning)  # fsolve warns whenever a guess stalls.
+      roots = fsolve(dxdt, guesses, args=(r,))
+    for root in roots:
+      if (np.isclose(dxdt(root, r), 0)):
+        equilibria.append((r, root))
+  return np.array(equilibria)
+
+
+cases = [
+  ("Saddle-Node", SaddleNodeCoefficients, lambda x, r: r + x ** 2, [-1, 1]),
+  ("Transcritical", TranscriticalCoefficients, lambda x, r: r * x - x ** 2, [-1, 1]),
+  ("Pitchfork", PitchforkCoefficients, lambda x, r: r * x - x ** 3, [-1, 0, 1]),
+]
+table = pt.PrettyTable()
+table.field_names = [
+  "Diagram", "Points (r)", "Batched (ms)", "Companion (ms)", "fsolve (ms)", "fsolve Distinct Roots", "Exact Roots",
+]
+rLab = np.linspace(-1, 1, 1001)
+rLarge = np.linspace(-1, 1, 1_000_000)
+diagrams = {}
+for name, Coefficients, dxdt, guesses in cases:
+  start = time.perf_counter()
+  diagrams[name] = PolynomialEquilibria(Coefficients(rLarge), rLarge)
+  batchedTime = (time.perf_counter() - start) * 1e3
+
+  # The general companion path without deflation or closed forms, for reference.
+  start = time.perf_counter()
+  CompanionRoots(Coefficients(rLarge))
+  companionTime = (time.perf_counter() - start) * 1e3
+
+  # fsolve is timed on the 1001-point lab grid and scaled to 1e6 values.
+  start = time.perf_counter()
+  legacy = FsolveEquilibria(dxdt, rLab, guesses)
+  fsolveTime = (time.perf_counter() - start) * 1e3 * rLarge.size / rLab.size
+
+  # Count distinct real roots per r: fsolve can return the same root twice and miss another one.
+  exact = PolynomialEquilibria(Coefficients(rLab), rLab)
+  exactCount = sum(np.unique(np.round(exact["x"][exact["r"] == r], 6)).size for r in rLab)
+  legacyCount = sum(np.unique(np.round(legacy[legacy[:, 0] == r, 1], 6)).size for r in rLab)
+  table.add_row([
+    name, rLarge.size, f"{batchedTime:.0f}", f"{companionTime:.0f}", f"{fsolveTime:.0f}", legacyCount, exactCount,
+  ])
+print(table)
+
+# Plot the three 1e6-point diagrams (every 50th point is enough for the figure).
+plt.figure(figsize=(18, 5))
+for i, (name, diagram) in enumerate(diagrams.items()):
+  plt.subplot(1, 3, i + 1)
+  for code, style, label in ((-1, "b.", "Stable"), (1, "r.", "Unstable")):
+    mask = diagram["stability"] == code
+    plt.plot(diagram["r"][mask][::50], diagram["x"][mask][::50], style, ms=1, label=label)
+  plt.axhline(0, color="black", lw=0.5, ls="--")
+  plt.title(f"{name} Bifurcation Diagram", fontsize=14)
+  plt.xlabel("Parameter (r)", fontsize=12)
+  plt.ylabel("Equilibrium Points (x)", fontsize=12)
+  plt.legend(markerscale=10)  # Add legend to the plot.
+  plt.grid()  # Add grid to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+plt.savefig("Lecture_08_Lab_Exercise_8_PolynomialRoots.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
@@ -36,11 +36,8 @@ xVals = np.linspace(-15, 15, 50)  # Range of x values for 1D system.
 X = xVals
 
 # Compute the vector field for 1D system.
-U = np.zeros_like(X)  # Initialize velocity component for 1D system.
-for i in range(X.shape[0]):
-  state = [X[i]]  # Unpack the state variable for 1D system.
-  derivatives = System1D(0, state, None)  # Compute the derivative.
-  U[i] = derivatives[0]  # Store the derivative in U.
+# The system only uses element-wise arithmetic, so one call evaluates the whole grid.
+U = System1D(0, [X], None)[0]
 
 # Normalize the vector field for 1D system.
 magnitude = np.sqrt(U ** 2 + 1)  # Magnitude for normalization.
@@ -86,12 +83,7 @@ beta = 0.1  # Parameter beta.
 gamma = 1.0  # Parameter gamma.
 delta = 0.05  # Parameter delta.
 params = [alpha, beta, gamma, delta]  # Parameters for the system.
-U, V = np.zeros_like(X), np.zeros_like(Y)  # Initialize velocity components.
-for i in range(X.shape[0]):
-  for j in range(X.shape[1]):
-    state = [X[i, j], Y[i, j]]
-    derivatives = System2D(0, state, params)
-    U[i, j], V[i, j] = derivatives
+U, V = System2D(0, [X, Y], params)  # Evaluate the whole grid with one broadcast call.
 
 # Plot the vector field.
 plt.figure(figsize=(8, 6))
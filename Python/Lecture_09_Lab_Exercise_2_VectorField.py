@@ -0,0 +1,257 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from collections import OrderedDict
+
+
+# Vectorized RHS protocol: a model is called as model(t, state, params) where state has
+# shape (2, ...) (one row per state variable, any grid shape after it) and it returns
+# the two derivatives with the same trailing shape. System2D of
+# Lecture_09_Lab_Exercise_1_Phase.py and FitzHughNagumo of Lecture_10_Lab_Exercise_2_FHN.py
+# already follow it because they only use element-wise arithmetic.
+def System2D(t, state, params):
+  #  Function to compute the derivatives for a 2D system (Lotka-Volterra).
+  x, y = state  # Unpack the state variables.
+  alpha, beta, gamma, delta = params  # Unpack the parameters.
+  dxdt = alpha * x - beta * x * y  # Derivative of x.
+  dydt = -gamma * y + delta * x * y  # Derivative of y.
+  return [dxdt, dydt]
+
+
+def FitzHughNagumo(t, state, params):
+  # FitzHugh-Nagumo model with params = (epsilon, a, b, I).
+  v, w = state  # Unpack the state variables.
+  epsilon, a, b, I = params  # Unpack the parameters.
+  dvdt = v - v ** 3 / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return [dvdt, dwdt]
+
+
+def Pendulum(t, state, params):
+  # Damped pendulum with params = (damping, omega0).
+  theta, omega = state  # Unpack the state variables.
+  damping, omega0 = params  # Unpack the parameters.
+  return [omega, -damping * omega - omega0 ** 2 * np.sin(theta)]
+
+
+def LoopField(model, params, X, Y, t=0.0):
+  """
+  The nested per-point loop of the Lecture 09 and Lecture 10 labs, kept for comparison
+  and used as the fallback for models that do not follow the vectorized protocol.
+  """
+  U, V = np.zeros_like(X), np.zeros_like(Y)
+  for i in range(X.shape[0]):
+    for j in range(X.shape[1]):
+      U[i, j], V[i, j] = model(t, [X[i, j], Y[i, j]], params)
+  return U, V
+
+
+def EvaluateRHS(model, params, X, Y, t=0.0):
+  """
+  Evaluates a 2D model on a whole grid with a single broadcast call.
+
+  Models that do not follow the vectorized protocol (they raise, or return values
+  of the wrong shape) are evaluated point by point instead.
+
+  Returns:
+  tuple: Derivative grids (U, V) with the shape of X.
+  """
+  try:
+    with np.errstate(all="ignore"):
+      U, V = model(t, np.stack([X, Y]), params)
+      U, V = (np.broadcast_to(np.asarray(component, dtype=float), X.shape) for component in (U, V))
+    return U, V
+  except (TypeError, ValueError):
+    return LoopField(model, params, X, Y, t)
+
+
+class Grid:
+  """
+  Uniform grid over [xMin, xMax] x [yMin, yMax] with nx x ny points, hashable for caching.
+  """
+
+  def __init__(self, xMin, xMax, yMin, yMax, nx, ny=None):
+    self.key = (float(xMin), float(xMax), float(yMin), float(yMax), int(nx), int(nx if ny is None else ny))
+
+  def __hash__(self):
+    return hash(self.key)
+
+  def __eq__(self, other):
+    return isinstance(other, Grid) and self.key == other.key
+
+  def Axes(self):
+    xMin, xMax, yMin, yMax, nx, ny = self.key
+    return np.linspace(xMin, xMax, nx), np.linspace(yMin, yMax, ny)
+
+  def Spacing(self):
+    xMin, xMax, yMin, yMax, nx, ny = self.key
+    return (xMax - xMin) / max(nx - 1, 1), (yMax - yMin) / max(ny - 1, 1)
+
+  def SliceOf(self, parent, rtol=1e-9):
+    """
+    Index slices (rows, columns) that cut this grid out of a finer or equal parent grid,
+    or None when this grid is not a strided sub-lattice of the parent.
+    """
+    slices = []
+    for axis in range(2):
+      start, stop, n = self.key[2 * axis], self.key[2 * axis + 1], self.key[4 + axis]
+      pStart, pStop, pN = parent.key[2 * axis], parent.key[2 * axis + 1], parent.key[4 + axis]
+      pStep = parent.Spacing()[axis]
+      step = self.Spacing()[axis]
+      if (pStep == 0) or (start < pStart - rtol * pStep) or (stop > pStop + rtol * pStep):
+        return None
+      offset, stride = (start - pStart) / pStep, (step / pStep if n > 1 else 1.0)
+      if (abs(offset - round(offset)) > rtol * max(1.0, offset)) or (abs(stride - round(stride)) > rtol * stride):
+        return None
+      offset, stride = int(round(offset)), max(int(round(stride)), 1)
+      if (offset + (n - 1) * stride >= pN):
+        return None
+      slices.append(slice(offset, offset + (n - 1) * stride + 1, stride))
+    return slices[1], slices[0]  # Rows follow y and columns follow x (meshgrid "xy" indexing).
+
+
+class VectorFieldCache:
+  """
+  Cache of evaluated vector fields keyed by (model, params, grid, t).
+
+  A request that is not cached but lies on the lattice of a cached field of the
+  same model and parameters (a zoom into it, or a coarser view of it) is sliced
+  out of that field instead of being evaluated again. The least recently used
+  fields are evicted once more than maxPoints grid points are stored.
+  """
+
+  def __init__(self, maxPoints=20_000_000):
+    self.maxPoints = maxPoints
+    self.fields = OrderedDict()
+    self.stats = {"hits": 0, "slices": 0, "misses": 0}
+
+  @staticmethod
+  def Key(model, params, grid, t):
+    return (model, tuple(np.atleast_1d(np.asarray(params, dtype=float)).tolist()), grid, float(t))
+
+  def Field(self, model, params, grid, t=0.0):
+    """
+    Vector field of a 2D model on a grid.
+
+    Parameters:
+    model (callable): RHS following the vectorized protocol, model(t, state, params).
+    params (sequence): Model parameters.
+    grid (Grid): Evaluation grid.
+    t (float): Time at which the field is evaluated (only matters for non-autonomous models).
+
+    Returns:
+    dict: "X", "Y", "U", "V", the magnitude "M" and the unit directions "UNormalized",
+      "VNormalized" (zero where the field vanishes), all with shape (ny, nx).
+    """
+    key = self.Key(model, params, grid, t)
+    if (key in self.fields):
+      self.stats["hits"] += 1
+      self.fields.move_to_end(key)
+      return self.fields[key]
+
+    for (cachedModel, cachedParams, cachedGrid, cachedT), cached in reversed(self.fields.items()):
+      if (cachedModel is not model) or (cachedParams != key[1]) or (cachedT != key[3]):
+        continue
+      slices = grid.SliceOf(cachedGrid)
+      if (slices is not None):
+        self.stats["slices"] += 1
+        # Copy the slices: a view would keep the whole parent field alive after it is evicted.
+        return self._Store(key, {name: value[slices].copy() for name, value in cached.items()})
+
+    self.stats["misses"] += 1
+    xVals, yVals = grid.Axes()
+    X, Y = np.meshgrid(xVals, yVals)
+    U, V = EvaluateRHS(model, params, X, Y, t)
+    M = np.hypot(U, V)
+    scale = np.divide(1.0, M, out=np.zeros_like(M), where=M > 0)  # Directions and magnitudes in one pass.
+    return self._Store(key, {"X": X, "Y": Y, "U": U, "V": V, "M": M, "UNormalized": U * scale,
+                             "VNormalized": V * scale})
+
+  def _Store(self, key, field):
+    self.fields[key] = field
+    while (len(self.fields) > 1) and (sum(f["X"].size for f in self.fields.values()) > self.maxPoints):
+      self.fields.popitem(last=False)
+    return field
+
+
+lotkaVolterra = (1.0, 0.1, 1.0, 0.05)  # alpha, beta, gamma, delta of Lecture_09_Lab_Exercise_1_Phase.py.
+fhn = (0.08, 0.7, 0.8, 0.5)  # epsilon, a, b, I of Lecture_10_Lab_Exercise_2_FHN.py.
+
+table = pt.PrettyTable()
+table.field_names = ["Model", "Grid", "Loop (ms)", "Broadcast (ms)", "Cached (ms)", "Max |Difference|"]
+cache = VectorFieldCache()
+for name, model, params, bounds in [
+  ("Lotka-Volterra", System2D, lotkaVolterra, (-10, 50, -10, 50)),
+  ("FitzHugh-Nagumo", FitzHughNagumo, fhn, (-5, 5, -5, 5)),
+  ("Damped Pendulum", Pendulum, (0.25, 1.0), (-3 * np.pi, 3 * np.pi, -4, 4)),
+]:
+  for n in [100, 1000]:
+    grid = Grid(*bounds, n)
+    start = time.perf_counter()
+    field = cache.Field(model, params, grid)
+    broadcastTime = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    cache.Field(model, params, grid)
+    cachedTime = (time.perf_counter() - start) * 1e3
+
+    # The loop is timed on at most 100x100 points and scaled to the full grid.
+    m = min(n, 100)
+    start = time.perf_counter()
+    U, V = LoopField(model, params, field["X"][:m, :m], field["Y"][:m, :m])
+    loopTime = (time.perf_counter() - start) * 1e3 * (n * n) / (m * m)
+    difference = max(np.max(np.abs(U - field["U"][:m, :m])), np.max(np.abs(V - field["V"][:m, :m])))
+    table.add_row([name, f"{n}x{n}", f"{loopTime:.0f}", f"{broadcastTime:.1f}", f"{cachedTime:.3f}",
+                   f"{difference:.1e}"])
+print(table)
+
+# Zooms on the lattice of the cached 1000x1000 pendulum field are sliced, not evaluated.
+xAxis, yAxis = Grid(-3 * np.pi, 3 * np.pi, -4, 4, 1000).Axes()
+zooms = [
+  Grid(-3 * np.pi, 3 * np.pi, -4, 4, 100),  # Already cached by the table above.
+  Grid(xAxis[0], xAxis[-1], yAxis[0], yAxis[-1], 334),  # Every third point.
+  Grid(xAxis[300], xAxis[699], yAxis[300], yAxis[699], 400),  # Zoom into the centre.
+  Grid(xAxis[450], xAxis[549], yAxis[450], yAxis[549], 100),  # Deeper zoom.
+]
+before = dict(cache.stats)
+for zoom in zooms:
+  field = cache.Field(Pendulum, (0.25, 1.0), zoom)
+  U, V = EvaluateRHS(Pendulum, (0.25, 1.0), field["X"], field["Y"])
+  assert np.allclose(U, field["U"]) and np.allclose(V, field["V"])
+print(f"Pendulum zooms: {cache.stats['hits'] - before['hits']} cached, "
+      f"{cache.stats['slices'] - before['slices']} sliced from the 1000x1000 field, "
+      f"{cache.stats['misses'] - before['misses']} evaluated.")
+
+# Phase portraits from the cached fields.
+plt.figure(figsize=(18, 5))
+for i, (title, model, params, grid) in enumerate([
+  ("Lotka-Volterra Phase Portrait", System2D, lotkaVolterra, Grid(-10, 50, -10, 50, 100)),
+  ("FitzHugh-Nagumo Phase Portrait", FitzHughNagumo, fhn, Grid(-5, 5, -5, 5, 100)),
+  ("Damped Pendulum (Zoom)", Pendulum, (0.25, 1.0), zooms[2]),
+]):
+  field = cache.Field(model, params, grid)
+  plt.subplot(1, 3, i + 1)
+  plt.streamplot(field["X"], field["Y"], field["U"], field["V"], color=np.log1p(field["M"]), cmap="viridis",
+                 density=1.5, linewidth=0.5, arrowsize=1.5)  # Colour by log-magnitude.
+  s = slice(None, None, max(field["X"].shape[0] // 20, 1))
+  plt.quiver(field["X"][s, s], field["Y"][s, s], field["UNormalized"][s, s], field["VNormalized"][s, s],
+             color="gray", alpha=0.5)  # Unit directions.
+  plt.xlabel("x", fontsize=12)
+  plt.ylabel("y", fontsize=12)
+  plt.title(title, fontsize=14)
+  plt.grid()  # Add grid to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+plt.savefig("Lecture_09_Lab_Exercise_2_VectorField.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
@@ -0,0 +1,228 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+
+
+# Models follow the vectorized protocol of Lecture_09_Lab_Exercise_2_VectorField.py:
+# model(t, state, params) with state of shape (2, ...).
+def System2D(t, state, params):
+  #  Function to compute the derivatives for a 2D system (Lotka-Volterra).
+  x, y = state  # Unpack the state variables.
+  alpha, beta, gamma, delta = params  # Unpack the parameters.
+  dxdt = alpha * x - beta * x * y  # Derivative of x.
+  dydt = -gamma * y + delta * x * y  # Derivative of y.
+  return [dxdt, dydt]
+
+
+def FitzHughNagumo(t, state, params):
+  # FitzHugh-Nagumo model with params = (epsilon, a, b, I).
+  v, w = state  # Unpack the state variables.
+  epsilon, a, b, I = params  # Unpack the parameters.
+  dvdt = v - v ** 3 / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return [dvdt, dwdt]
+
+
+class LatticeEvaluator:
+  """
+  Evaluates a model on points of an integer lattice and remembers every value.
+
+  Points are addressed by integer coordinates (i, j) on the finest lattice the
+  quadtree can reach, so a corner shared by neighbouring cells, or by a parent
+  and its children, is evaluated exactly once. Every batch of new points is
+  evaluated with a single broadcast call.
+  """
+
+  def __init__(self, model, params, origin, spacing, t=0.0):
+    self.model, self.params, self.t = model, params, t
+    self.origin = np.asarray(origin, dtype=float)
+    self.spacing = np.asarray(spacing, dtype=float)
+    self.keys = np.empty(0, dtype=np.int64)  # Sorted lattice keys.
+    self.values = np.empty((0, 2))  # Field values in the order of self.keys.
+    self.evaluations = 0
+
+  def __call__(self, i, j):
+    """
+    Field values (..., 2) at lattice points with integer coordinates i and j (same shape).
+    """
+    keys = (np.asarray(i, dtype=np.int64) << 32) + np.asarray(j, dtype=np.int64)
+    flat = keys.ravel()
+    new = np.unique(flat[~np.isin(flat, self.keys)])
+    if (new.size):
+      x = self.origin[0] + (new >> 32) * self.spacing[0]
+      y = self.origin[1] + (new & 0xFFFFFFFF) * self.spacing[1]
+      U, V = self.model(self.t, np.stack([x, y]), self.params)
+      values = np.stack([np.broadcast_to(U, x.shape), np.broadcast_to(V, x.shape)], axis=-1)
+      self.evaluations += new.size
+      merged = np.concatenate([self.keys, new])
+      order = np.argsort(merged, kind="stable")
+      self.keys, self.values = merged[order], np.concatenate([self.values, values])[order]
+    return self.values[np.searchsorted(self.keys, flat)].reshape(keys.shape + (2,))
+
+
+def RefinementFlags(samples, angleTol, magnitudeTol):
+  """
+  Which cells need refinement, from the field sampled at their four corners and centre.
+
+  Parameters:
+  samples (numpy.ndarray): Field values with shape (C, 5, 2).
+  angleTol (float): Largest allowed angle (radians) between a sample direction and the mean direction.
+  magnitudeTol (float): Largest allowed relative spread of the magnitudes.
+
+  Returns:
+  tuple: Refinement mask (C,) and the sign-change masks of U and V (C,).
+  """
+  U, V = samples[..., 0], samples[..., 1]
+  signU = (U.min(axis=1) <= 0) & (U.max(axis=1) >= 0)  # A u-nullcline may cross the cell.
+  signV = (V.min(axis=1) <= 0) & (V.max(axis=1) >= 0)  # A v-nullcline may cross the cell.
+  M = np.hypot(U, V)
+  unit = samples / np.where(M > 0, M, 1.0)[..., None]
+  mean = unit.mean(axis=1)
+  mean /= np.maximum(np.linalg.norm(mean, axis=1), 1e-300)[:, None]
+  turning = np.min(np.sum(unit * mean[:, None, :], axis=2), axis=1) < np.cos(angleTol)
+  spread = (M.max(axis=1) - M.min(axis=1)) > magnitudeTol * (M.mean(axis=1) + 1e-12)
+  return signU | signV | turning | spread, signU, signV
+
+
+def QuadtreeSample(model, params, bounds, base=8, maxLevel=6, angleTol=np.pi / 12, magnitudeTol=0.5, t=0.0):
+  """
+  Adaptive quadtree sampling of a 2D vector field.
+
+  The domain starts as a base x base grid of cells. Level by level, every cell
+  whose corner and centre samples show a sign change of either component (a
+  nullcline), a turning direction, or a fast-changing magnitude is split into
+  four children; the others become leaves. All cells of a level are tested
+  together, and new samples are evaluated in one call per level.
+
+  Parameters:
+  model (callable): RHS following the vectorized protocol.
+  params (sequence): Model parameters.
+  bounds (tuple): (xMin, xMax, yMin, yMax).
+  base (int): Cells per side at level 0.
+  maxLevel (int): Deepest refinement level.
+  angleTol (float): Direction tolerance (radians) inside one cell.
+  magnitudeTol (float): Relative magnitude tolerance inside one cell.
+  t (float): Time at which the field is evaluated.
+
+  Returns:
+  dict: Sparse leaf list with the lower-left corners "x", "y", sizes "hx", "hy",
+    "level", cell-centre field "U", "V", and the sign-change masks "nullU", "nullV";
+    plus "evaluations", the number of RHS evaluations used.
+  """
+  xMin, xMax, yMin, yMax = bounds
+  n = base * 2 ** (maxLevel + 1)  # Finest lattice: cell centres at maxLevel are lattice points too.
+  evaluator = LatticeEvaluator(model, params, (xMin, yMin), ((xMax - xMin) / n, (yMax - yMin) / n), t)
+  i, j = np.meshgrid(np.arange(base), np.arange(base), indexing="ij")
+  size = 2 ** (maxLevel + 1)  # Cell width in lattice units at the current level.
+  i, j = i.ravel() * size, j.ravel() * size
+  leaves = {name: [] for name in ("i", "j", "size", "level", "samples", "nullU", "nullV")}
+  for level in range(maxLevel + 1):
+    half = size // 2
+    ci = i[:, None] + np.array([0, size, 0, size, half])
+    cj = j[:, None] + np.array([0, 0, size, size, half])
+    samples = evaluator(ci, cj)
+    refine, nullU, nullV = RefinementFlags(samples, angleTol, magnitudeTol)
+    if (level == maxLevel):
+      refine[:] = False
+    for name, value in (("i", i), ("j", j), ("size", np.full(i.size, size)), ("level", np.full(i.size, level)),
+                        ("samples", samples), ("nullU", nullU), ("nullV", nullV)):
+      leaves[name].append(value[~refine])
+    # Children of the refined cells: the four quadrants.
+    i = (i[refine][:, None] + np.array([0, half, 0, half])).ravel()
+    j = (j[refine][:, None] + np.array([0, 0, half, half])).ravel()
+    size = half
+  leaves = {name: np.concatenate(value) for name, value in leaves.items()}
+  dx, dy = evaluator.spacing
+  return {
+    "x": xMin + leaves["i"] * dx, "y": yMin + leaves["j"] * dy,
+    "hx": leaves["size"] * dx, "hy": leaves["size"] * dy, "level": leaves["level"],
+    "U": leaves["samples"][:, 4, 0], "V": leaves["samples"][:, 4, 1],
+    "nullU": leaves["nullU"], "nullV": leaves["nullV"],
+    "evaluations": evaluator.evaluations,
+  }
+
+
+def EquilibriumCells(cells):
+  """
+  Finest leaves crossed by both nullclines: each one may contain an equilibrium.
+  """
+  return np.nonzero(cells["nullU"] & cells["nullV"] & (cells["level"] == cells["level"].max()))[0]
+
+
+epsilon, a, b, I = 0.08, 0.7, 0.8, 0.5  # Parameters of Lecture_10_Lab_Exercise_2_FHN.py.
+cases = [
+  ("Lotka-Volterra", System2D, (1.0, 0.1, 1.0, 0.05), (-10, 50, -10, 50), [(0.0, 0.0), (20.0, 10.0)]),
+  ("FitzHugh-Nagumo", FitzHughNagumo, (epsilon, a, b, I), (-5, 5, -5, 5), None),
+]
+# The FHN equilibria solve b v^3 + 3 (1 - b) v + 3 (a - b I) = 0 on the w-nullcline w = (v + a) / b.
+roots = np.roots([b, 0, 3 * (1 - b), 3 * (a - b * I)])
+cases[1] = cases[1][:4] + ([(v, (v + a) / b) for v in roots[np.abs(roots.imag) < 1e-9].real],)
+
+table = pt.PrettyTable()
+table.field_names = [
+  "Model", "Finest Spacing", "Uniform Evaluations", "Quadtree Evaluations", "Ratio", "Leaves", "Time (ms)",
+  "Equilibria Enclosed",
+]
+results = {}
+for name, model, params, bounds, equilibria in cases:
+  start = time.perf_counter()
+  cells = QuadtreeSample(model, params, bounds, base=8, maxLevel=6)
+  elapsed = (time.perf_counter() - start) * 1e3
+  results[name] = cells
+
+  # A uniform grid with the finest spacing needs one evaluation per finest-cell corner.
+  uniform = (8 * 2 ** 6 + 1) ** 2
+  candidates = EquilibriumCells(cells)
+  enclosed = sum(
+    np.any((cells["x"][candidates] <= x) & (x <= cells["x"][candidates] + cells["hx"][candidates]) &
+           (cells["y"][candidates] <= y) & (y <= cells["y"][candidates] + cells["hy"][candidates]))
+    for x, y in equilibria
+  )
+  table.add_row([
+    name, f"{cells['hx'].min():.4f}", uniform, cells["evaluations"], f"{uniform / cells['evaluations']:.1f}x",
+    len(cells["x"]), f"{elapsed:.0f}", f"{enclosed}/{len(equilibria)}",
+  ])
+print(table)
+
+# Plot the leaf cells coloured by level with the unit field direction at the cell centres.
+plt.figure(figsize=(14, 6))
+for k, (name, model, params, bounds, equilibria) in enumerate(cases):
+  cells = results[name]
+  x, y, hx, hy = cells["x"], cells["y"], cells["hx"], cells["hy"]
+  ax = plt.subplot(1, 2, k + 1)
+  polygons = np.stack([
+    np.stack([x, y], axis=1), np.stack([x + hx, y], axis=1),
+    np.stack([x + hx, y + hy], axis=1), np.stack([x, y + hy], axis=1),
+  ], axis=1)
+  collection = PolyCollection(polygons, array=cells["level"], cmap="viridis", edgecolors="white", linewidths=0.1)
+  ax.add_collection(collection)
+  plt.colorbar(collection, label="Refinement Level")
+  coarse = cells["level"] <= 2  # Arrows on the coarse leaves only, to keep the figure readable.
+  M = np.hypot(cells["U"], cells["V"])
+  scale = np.divide(1.0, M, out=np.zeros_like(M), where=M > 0)
+  plt.quiver(x[coarse] + hx[coarse] / 2, y[coarse] + hy[coarse] / 2, (cells["U"] * scale)[coarse],
+             (cells["V"] * scale)[coarse], color="white", alpha=0.8)
+  plt.plot(*np.array(equilibria).T, "r*", markersize=12, label="Equilibria")
+  plt.xlim(bounds[0], bounds[1])
+  plt.ylim(bounds[2], bounds[3])
+  plt.xlabel("x", fontsize=12)
+  plt.ylabel("y", fontsize=12)
+  plt.title(f"{name} Quadtree ({cells['evaluations']} Evaluations)", fontsize=14)
+  plt.legend(loc="upper right")  # Add legend to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+plt.savefig("Lecture_09_Lab_Exercise_3_Quadtree.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
@@ -0,0 +1,317 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import warnings
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.optimize import fsolve
+
+
+# Models follow the vectorized protocol of Lecture_09_Lab_Exercise_2_VectorField.py:
+# model(t, state, params) with state of shape (2, ...).
+def System2D(t, state, params):
+  #  Function to compute the derivatives for a 2D system (Lotka-Volterra).
+  x, y = state  # Unpack the state variables.
+  alpha, beta, gamma, delta = params  # Unpack the parameters.
+  dxdt = alpha * x - beta * x * y  # Derivative of x.
+  dydt = -gamma * y + delta * x * y  # Derivative of y.
+  return [dxdt, dydt]
+
+
+def FitzHughNagumo(t, state, params):
+  # FitzHugh-Nagumo model with params = (epsilon, a, b, I).
+  v, w = state  # Unpack the state variables.
+  epsilon, a, b, I = params  # Unpack the parameters.
+  dvdt = v - v ** 3 / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return [dvdt, dwdt]
+
+
+def vanDerPol(t, state, params):
+  # Unforced Van der Pol oscillator (Lecture_08_Lab_Exercise_2_Chaos.py with force = 0), params = (mu,).
+  x, v = state  # Unpack the state variables.
+  mu, = params  # Unpack the parameters.
+  return [v, mu * (1 - x ** 2) * v - x]
+
+
+# Marching-squares segment table. Cell corners are numbered 0 (x0, y0), 1 (x1, y0),
+# 2 (x1, y1) and 3 (x0, y1); the case index sets bit k when corner k is positive.
+# Edges are 0 bottom, 1 right, 2 top and 3 left. Every case lists up to two segments
+# as pairs of edges (-1 for none). The saddle cases 5 and 10 use the first row
+# when the cell centre is positive and the second row when it is not.
+SEGMENTS = np.full((16, 2, 2), -1)
+for case, segments in {
+  1: [(0, 3)], 2: [(0, 1)], 3: [(1, 3)], 4: [(1, 2)], 5: [(0, 1), (2, 3)], 6: [(0, 2)], 7: [(2, 3)],
+  8: [(2, 3)], 9: [(0, 2)], 10: [(0, 3), (1, 2)], 11: [(1, 2)], 12: [(1, 3)], 13: [(0, 1)], 14: [(0, 3)],
+}.items():
+  SEGMENTS[case, :len(segments)] = segments
+SADDLE_SEGMENTS = SEGMENTS.copy()
+SADDLE_SEGMENTS[5], SADDLE_SEGMENTS[10] = SEGMENTS[10], SEGMENTS[5]
+
+
+def MarchingSquares(xVals, yVals, F):
+  """
+  Zero-level contour of a sampled function as line segments, one pass over all cells.
+
+  Parameters:
+  xVals (numpy.ndarray): Grid x coordinates (nx,).
+  yVals (numpy.ndarray): Grid y coordinates (ny,).
+  F (numpy.ndarray): Function values with shape (ny, nx) (meshgrid "xy" indexing).
+
+  Returns:
+  dict: "segments" with shape (S, 2, 2) (two endpoints per segment), "cells" (S,) with the
+    flat index of the cell holding each segment, and "edges" (S, 2) with the global id of
+    the grid edge under each endpoint (used to join segments into polylines).
+  """
+  ny, nx = F.shape
+  zero = F == 0
+  if (zero.any()):
+    # A contour along a grid line (or the domain edge) has F == 0 on its nodes and would be lost.
+    # Give such nodes the sign opposite to most of their neighbours (positive on a tie), so the
+    # contour crosses the adjacent edges right at the node.
+    sign = np.pad(np.sign(F), 1)
+    around = sign[:-2, 1:-1] + sign[2:, 1:-1] + sign[1:-1, :-2] + sign[1:-1, 2:]
+    tiny = np.finfo(float).tiny
+    F = np.where(zero, np.where(around > 0, -tiny, tiny), F)
+  positive = F > 0
+  case = positive[:-1, :-1] * 1 + positive[:-1, 1:] * 2 + positive[1:, 1:] * 4 + positive[1:, :-1] * 8
+  active = np.flatnonzero((case != 0) & (case != 15))  # Only cells the contour crosses are processed.
+  j, i = np.divmod(active, nx - 1)
+  f0, f1, f2, f3 = F[j, i], F[j, i + 1], F[j + 1, i + 1], F[j + 1, i]
+  case = case.ravel()[active]
+  table = np.where(((f0 + f1 + f2 + f3) > 0)[:, None, None], SEGMENTS[case], SADDLE_SEGMENTS[case])  # (A, 2, 2).
+
+  # Linear interpolation of the zero on every edge (only used where the edge is crossed).
+  with np.errstate(divide="ignore", invalid="ignore"):
+    s = np.stack([f0 / (f0 - f1), f1 / (f1 - f2), f3 / (f3 - f2), f0 / (f0 - f3)], axis=-1)
+  x0, y0 = xVals[i], yVals[j]
+  dx, dy = xVals[i + 1] - x0, yVals[j + 1] - y0
+  points = np.empty((active.size, 4, 2))
+  points[:, 0, 0], points[:, 0, 1] = x0 + s[:, 0] * dx, y0
+  points[:, 1, 0], points[:, 1, 1] = x0 + dx, y0 + s[:, 1] * dy
+  points[:, 2, 0], points[:, 2, 1] = x0 + s[:, 2] * dx, y0 + dy
+  points[:, 3, 0], points[:, 3, 1] = x0, y0 + s[:, 3] * dy
+
+  # Global edge ids: horizontal edge (j, i) -> 2 (j nx + i), vertical edge (j, i) -> 2 (j nx + i) + 1.
+  base = j * nx + i
+  edgeIds = np.stack([2 * base, 2 * (base + 1) + 1, 2 * (base + nx), 2 * base + 1], axis=-1)
+
+  row, slot = np.nonzero(table[:, :, 0] >= 0)
+  pairs = table[row, slot]  # (S, 2) edge numbers.
+  return {
+    "segments": points[row[:, None], pairs],
+    "cells": active[row],
+    "edges": edgeIds[row[:, None], pairs],
+  }
+
+
+def Polylines(contour):
+  """
+  Joins marching-squares segments that share a grid edge into polylines.
+
+  Returns:
+  list: One (k, 2) array per polyline (closed loops repeat their first point).
+  """
+  edges = contour["edges"]
+  neighbours = {}
+  for k, (a, b) in enumerate(edges):
+    neighbours.setdefault(a, []).append(k)
+    neighbours.setdefault(b, []).append(k)
+  used = np.zeros(len(edges), dtype=bool)
+  # Start at open ends (edges with one segment) first, then at what is left (closed loops).
+  starts = [k for ids in neighbours.values() if (len(ids) == 1) for k in ids] + list(range(len(edges)))
+  lines = []
+  for k in starts:
+    if (used[k]):
+      continue
+    a, b = edges[k]
+    if (len(neighbours[a]) != 1) and (len(neighbours[b]) == 1):
+      a, b = b, a  # Walk away from the open end.
+    points, edge = [contour["segments"][k][0 if edges[k][0] == a else 1]], a
+    while (k is not None) and (not used[k]):
+      used[k] = True
+      end = 1 if edges[k][0] == edge else 0
+      points.append(contour["segments"][k][end])
+      edge = edges[k][end]
+      k = next((m for m in neighbours[edge] if not used[m]), None)
+    lines.append(np.array(points))
+  return lines
+
+
+def SegmentIntersections(contourU, contourV):
+  """
+  Intersections of the two nullclines, testing only segment pairs that share a cell.
+
+  Returns:
+  numpy.ndarray: Equilibrium candidates with shape (k, 2).
+  """
+  # Pair every U segment with every V segment of the same cell (at most 2 x 2 per cell).
+  orderV = np.argsort(contourV["cells"], kind="stable")
+  cellsV = contourV["cells"][orderV]
+  first = np.searchsorted(cellsV, contourU["cells"], side="left")
+  last = np.searchsorted(cellsV, contourU["cells"], side="right")
+  counts = last - first
+  uIndex = np.repeat(np.arange(len(counts)), counts)
+  vIndex = orderV[np.repeat(first, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)]
+  p, r = contourU["segments"][uIndex, 0], contourV["segments"][vIndex, 0]
+  dp = contourU["segments"][uIndex, 1] - p
+  dr = contourV["segments"][vIndex, 1] - r
+  cross = dp[:, 0] * dr[:, 1] - dp[:, 1] * dr[:, 0]
+  safe = np.abs(cross) > 1e-300
+  with np.errstate(divide="ignore", invalid="ignore"):
+    s = ((r - p)[:, 0] * dr[:, 1] - (r - p)[:, 1] * dr[:, 0]) / cross
+    u = ((r - p)[:, 0] * dp[:, 1] - (r - p)[:, 1] * dp[:, 0]) / cross
+  hit = safe & (s >= -1e-9) & (s <= 1 + 1e-9) & (u >= -1e-9) & (u <= 1 + 1e-9)
+  return p[hit] + s[hit, None] * dp[hit]
+
+
+def NewtonRefine(model, params, seeds, tol=1e-12, maxIter=30, h=1e-7, mergeTol=1e-8):
+  """
+  Refines equilibrium candidates with a vectorized Newton iteration and merges duplicates.
+
+  Returns:
+  numpy.ndarray: Distinct converged equilibria with shape (k, 2).
+  """
+  Z = np.array(seeds, dtype=float).T  # Shape (2, S).
+  for _ in range(maxIter):
+    F = np.array(model(0, Z, params), dtype=float)
+    J = np.empty((Z.shape[1], 2, 2))
+    for k in range(2):
+      Zh = Z.copy()
+      Zh[k] += h
+      J[:, :, k] = ((np.array(model(0, Zh, params), dtype=float) - F) / h).T
+    singular = np.abs(np.linalg.det(J)) < 1e-14
+    J[singular] = np.eye(2)
+    step = np.linalg.solve(J, -F.T[:, :, None])[:, :, 0].T
+    step[:, singular] = 0.0
+    Z = Z + step
+    if (np.max(np.abs(step), initial=0.0) < tol):
+      break
+  residual = np.max(np.abs(np.array(model(0, Z, params), dtype=float)), axis=0)
+  Z = Z.T[residual < 1e-9]
+  distance = np.max(np.abs(Z[:, None, :] - Z[None, :, :]), axis=2)
+  duplicate = np.any(np.tril(distance < mergeTol, k=-1), axis=1)  # Keep the first of every cluster.
+  return Z[~duplicate]
+
+
+def Nullclines(model, params, bounds, n=400, t=0.0):
+  """
+  Nullclines and equilibria of a 2D model on a rectangle.
+
+  Both components are evaluated on an n x n grid with one broadcast call, their
+  zero contours are extracted with marching squares, the contours are intersected
+  cell by cell and the intersections are refined with Newton.
+
+  Parameters:
+  model (callable): RHS following the vectorized protocol.
+  params (sequence): Model parameters.
+  bounds (tuple): (xMin, xMax, yMin, yMax).
+  n (int): Grid points per side.
+  t (float): Time at which the field is evaluated.
+
+  Returns:
+  dict: "U" and "V" nullclines as lists of polylines, the raw "candidates" and the
+    refined "equilibria".
+  """
+  xVals = np.linspace(bounds[0], bounds[1], n)
+  yVals = np.linspace(bounds[2], bounds[3], n)
+  X, Y = np.meshgrid(xVals, yVals)
+  U, V = (np.broadcast_to(component, X.shape) for component in model(t, np.stack([X, Y]), params))
+  contourU, contourV = MarchingSquares(xVals, yVals, U), MarchingSquares(xVals, yVals, V)
+  candidates = SegmentIntersections(contourU, contourV)
+  return {
+    "U": Polylines(contourU), "V": Polylines(contourV), "candidates": candidates,
+    "equilibria": NewtonRefine(model, params, candidates) if len(candidates) else np.empty((0, 2)),
+  }
+
+
+def SeedGridEquilibria(model, params, bounds, n=20):
+  """
+  The grid-seeded fsolve of Lecture_10_Lab_Exercise_2_FHN.py, kept for comparison.
+  """
+  points = []
+  with warnings.catch_warnings():
+    warnings.simplefilter("ignore", RuntimeWarning)  # fsolve warns whenever a seed stalls.
+    for x in np.linspace(bounds[0], bounds[1], n):
+      for y in np.linspace(bounds[2], bounds[3], n):
+        eq, info, ier, _ = fsolve(lambda z: model(0, z, params), [x, y], full_output=True)
+        if (ier == 1) and (not any(np.isclose(eq, e).all() for e in points)):
+          points.append(eq)
+  return np.array(points)
+
+
+cases = [
+  ("Lotka-Volterra", System2D, (1.0, 0.1, 1.0, 0.05), (-10, 50, -10, 50), np.array([[0.0, 0.0], [20.0, 10.0]])),
+  # Both nullclines through the origin run along the domain edges, where the field is exactly zero.
+  ("Lotka-Volterra (Edges)", System2D, (1.0, 0.1, 1.0, 0.05), (0, 50, 0, 50), np.array([[0.0, 0.0], [20.0, 10.0]])),
+  ("FitzHugh-Nagumo", FitzHughNagumo, (0.08, 0.7, 0.8, 0.5), (-3, 3, -3, 3), None),
+  ("FitzHugh-Nagumo (b = 2)", FitzHughNagumo, (0.08, 0.7, 2.0, 0.35), (-3, 3, -3, 3), None),
+  ("Van der Pol", vanDerPol, (1.0,), (-3, 3, -3, 3), np.array([[0.0, 0.0]])),
+]
+# FHN equilibria: b v^3 + 3 (1 - b) v + 3 (a - b I) = 0 on the w-nullcline w = (v + a) / b.
+for k, (name, model, params, bounds, exact) in enumerate(cases):
+  if (exact is None):
+    epsilon, a, b, I = params
+    roots = np.roots([b, 0, 3 * (1 - b), 3 * (a - b * I)])
+    v = np.sort(roots[np.abs(roots.imag) < 1e-9].real)
+    cases[k] = (name, model, params, bounds, np.stack([v, (v + a) / b], axis=1))
+
+table = pt.PrettyTable()
+table.field_names = [
+  "Model", "Nullcline Time (ms)", "Polylines (U/V)", "Candidates", "Equilibria", "Max Error",
+  "fsolve 100x100 Seeds (ms, Scaled)", "fsolve Equilibria",
+]
+results = {}
+for name, model, params, bounds, exact in cases:
+  start = time.perf_counter()
+  result = Nullclines(model, params, bounds)
+  elapsed = (time.perf_counter() - start) * 1e3
+  results[name] = result
+  found = result["equilibria"]
+  error = max(np.min(np.max(np.abs(found - e), axis=1)) for e in exact) if len(found) else np.inf
+  assert len(found) == len(exact), name
+
+  start = time.perf_counter()
+  legacy = SeedGridEquilibria(model, params, bounds)
+  legacyTime = (time.perf_counter() - start) * 1e3 * (100 * 100) / (20 * 20)  # Timed on 20x20 seeds.
+  table.add_row([
+    name, f"{elapsed:.1f}", f"{len(result['U'])}/{len(result['V'])}", len(result["candidates"]), len(found),
+    f"{error:.1e}", f"{legacyTime:.0f}", len(legacy),
+  ])
+print(table)
+
+# Plot the nullclines, the candidates and the refined equilibria over the field.
+plt.figure(figsize=(25, 5))
+for k, (name, model, params, bounds, exact) in enumerate(cases):
+  result = results[name]
+  plt.subplot(1, len(cases), k + 1)
+  X, Y = np.meshgrid(np.linspace(bounds[0], bounds[1], 40), np.linspace(bounds[2], bounds[3], 40))
+  U, V = model(0, np.stack([X, Y]), params)
+  plt.streamplot(X, Y, U, V, color="lightgray", density=1.0, linewidth=0.5, arrowsize=1.0)
+  for i, line in enumerate(result["U"]):
+    plt.plot(line[:, 0], line[:, 1], "b-", lw=2, label="dx/dt = 0" if (i == 0) else None)
+  for i, line in enumerate(result["V"]):
+    plt.plot(line[:, 0], line[:, 1], "g-", lw=2, label="dy/dt = 0" if (i == 0) else None)
+  plt.plot(result["candidates"][:, 0], result["candidates"][:, 1], "kx", markersize=10, label="Candidates")
+  plt.plot(result["equilibria"][:, 0], result["equilibria"][:, 1], "r*", markersize=12, label="Equilibria")
+  plt.xlim(bounds[0], bounds[1])
+  plt.ylim(bounds[2], bounds[3])
+  plt.xlabel("x", fontsize=12)
+  plt.ylabel("y", fontsize=12)
+  plt.title(f"{name} Nullclines", fontsize=14)
+  plt.legend(loc="upper right")  # Add legend to the plot.
+  plt.grid()  # Add grid to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+plt.savefig("Lecture_09_Lab_Exercise_4_Nullclines.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
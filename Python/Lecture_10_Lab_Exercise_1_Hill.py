@@ -11,7 +11,6 @@
 # Import necessary libraries.
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import fsolve
 
 
 def HillEquation(x, beta=1.0, n=2, k=1.0, gamma=0.1):
@@ -55,7 +54,110 @@ def HillEquationDerivative(x, beta=1.0, n=2, k=1.0, gamma=0.1):
   return result
 
 
-def RungeKutta4(f, x0, tSpan, dt):
+# Lane status codes returned by BatchedNewton.
+NEWTON_STATUS = {0: "Converged", 1: "Max Iterations", 2: "Zero Derivative", 3: "Non-Finite"}
+
+
+def BatchedNewton(f, df, seeds, params, tol=1e-10, maxIter=100, maxHalvings=10):
+  """
+  Damped Newton method on every (parameter, seed) lane at once.
+
+  The lanes are flattened into one vector; every iteration evaluates f and df
+  only on the lanes that are still active, and a lane leaves the active set as
+  soon as it converges or fails. Steps that do not reduce |f| are halved.
+
+  Parameters:
+  f (function): Vectorized function f(x, **params), e.g. HillEquation.
+  df (function): Vectorized derivative df(x, **params), e.g. HillEquationDerivative.
+  seeds (array-like): Initial guesses with shape (S,).
+  params (dict): Parameter name -> scalar or array of shape (P,).
+  tol (float): Relative step tolerance for convergence.
+  maxIter (int): Maximum number of Newton iterations.
+  maxHalvings (int): Maximum number of step halvings per iteration.
+
+  Returns:
+  roots (numpy.ndarray): Final iterates with shape (P, S).
+  report (dict): "status" (P, S) codes (see NEWTON_STATUS), "converged" (P, S),
+    "iterations" (P, S) and "residual" (P, S) = |f(root)|.
+  """
+  seeds = np.atleast_1d(np.asarray(seeds, dtype=float))
+  P = max([np.size(value) for value in params.values()] + [1])
+  shape = (P, seeds.size)
+  x = np.broadcast_to(seeds, shape).astype(float).ravel()
+  lanes = {
+    name: np.broadcast_to(np.reshape(np.asarray(value, dtype=float), (-1, 1)), shape).ravel()
+    for name, value in params.items()
+  }
+  status = np.ones(x.size, dtype=int)  # Max Iterations until proven otherwise.
+  iterations = np.zeros(x.size, dtype=int)
+  active = np.arange(x.size)
+
+  with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+    for _ in range(maxIter):
+      if (active.size == 0):
+        break
+      laneParams = {name: value[active] for name, value in lanes.items()}
+      xa = x[active]
+      fa, da = f(xa, **laneParams), df(xa, **laneParams)
+
+      # Lanes that cannot take a Newton step leave the active set.
+      nonFinite = ~np.isfinite(fa) | ~np.isfinite(da)
+      flat = ~nonFinite & (np.abs(da) < 1e-14) & (np.abs(fa) > 0)
+      status[active[nonFinite]] = 3
+      status[active[flat]] = 2
+      keep = ~nonFinite & ~flat
+      active, xa, fa, da = active[keep], xa[keep], fa[keep], da[keep]
+      laneParams = {name: value[keep] for name, value in laneParams.items()}
+
+      # Damping: halve the step on lanes where |f| does not decrease.
+      step = np.where(fa == 0, 0.0, -fa / np.where(da == 0, 1.0, da))
+      trial = xa + step
+      fTrial = f(trial, **laneParams)
+      scale = np.ones_like(step)
+      for _ in range(maxHalvings):
+        worse = ~(np.abs(fTrial) < np.abs(fa)) & (np.abs(fa) > 0)
+        if (not worse.any()):
+          break
+        scale[worse] *= 0.5
+        trial[worse] = xa[worse] + scale[worse] * step[worse]
+        fTrial[worse] = f(trial[worse], **{name: value[worse] for name, value in laneParams.items()})
+
+      x[active] = trial
+      iterations[active] += 1
+      done = np.abs(scale * step) <= tol * (1 + np.abs(trial))
+      status[active[done]] = 0
+      active = active[~done]
+
+    residual = np.abs(f(x, **lanes))
+  report = {
+    "status"    : status.reshape(shape),
+    "converged" : (status == 0).reshape(shape),
+    "iterations": iterations.reshape(shape),
+    "residual"  : residual.reshape(shape),
+  }
+  return x.reshape(shape), report
+
+
+def UniqueRoots(roots, converged, atol=1e-6):
+  """
+  Distinct converged roots of every parameter lane, in increasing order.
+
+  Parameters:
+  roots (numpy.ndarray): Roots with shape (P, S) from BatchedNewton.
+  converged (numpy.ndarray): Convergence mask with shape (P, S).
+  atol (float): Roots closer than this are merged.
+
+  Returns:
+  list: One array of distinct roots per parameter value.
+  """
+  values = np.sort(np.where(converged, roots, np.nan), axis=1)  # NaN lanes sort last.
+  repeated = np.zeros(values.shape, dtype=bool)
+  repeated[:, 1:] = np.abs(np.diff(values, axis=1)) <= atol
+  keep = ~np.isnan(values) & ~repeated
+  return np.split(values[keep], np.cumsum(keep.sum(axis=1))[:-1])
+
+
+def RungeKutta4(f, x0, tSpan, dt, out=None):
   """
   Runge-Kutta 4th order method for solving ODEs.
 
@@ -64,20 +166,28 @@ def RungeKutta4(f, x0, tSpan, dt):
   x0 (float): Initial condition.
   tSpan (tuple): Time span for the solution.
   dt (float): Time step size.
+  out (numpy.ndarray): Optional (steps,) array to store the solution in, for example
+    a memory-mapped array from np.lib.format.open_memmap (default is None).
 
   Returns:
   tuple: Time points and corresponding solution values.
   """
   t = np.arange(tSpan[0], tSpan[1], dt)
-  x = np.zeros(len(t))
+  if (out is None):
+    x = np.empty(len(t))  # Preallocate the solution buffer.
+  elif (out.shape != (len(t),)):
+    raise ValueError(f"`out` must have shape {(len(t),)}, got {out.shape}.")
+  else:
+    x = out
   x[0] = x0
 
   for i in range(1, len(t)):
-    k1 = f(x[i - 1]) * dt
-    k2 = f(x[i - 1] + k1 / 2.0) * dt
-    k3 = f(x[i - 1] + k2 / 2.0) * dt
-    k4 = f(x[i - 1] + k3) * dt
-    x[i] = x[i - 1] + (k1 + 2 * k2 + 2 * k3 + k4) / 6.0
+    xPrev = x[i - 1]
+    k1 = f(xPrev) * dt
+    k2 = f(xPrev + k1 / 2.0) * dt
+    k3 = f(xPrev + k2 / 2.0) * dt
+    k4 = f(xPrev + k3) * dt
+    x[i] = xPrev + (k1 + 2 * k2 + 2 * k3 + k4) / 6.0
 
   return t, x
 
@@ -97,12 +207,12 @@ t, x = RungeKutta4(f, x0, tSpan, dt)
 # Compute the response of the Hill equation.
 dxValues = np.array([HillEquation(xI, beta, n, k, gamma) for xI in x])
 
-# Find the equilibrium points.
-equilibriumPoints = []
-for i in range(0, 100):
-  equilibrium = fsolve(lambda x: HillEquation(x, beta, n, k, gamma), i)
-  if (not any(np.isclose(equilibrium, e) for e in equilibriumPoints)):
-    equilibriumPoints.append(equilibrium[0])
+# Find the equilibrium points with Newton's method from the seeds 0, 1, ..., 99 at once.
+seeds = np.arange(0, 100)
+roots, report = BatchedNewton(
+  HillEquation, HillEquationDerivative, seeds, {"beta": beta, "n": n, "k": k, "gamma": gamma},
+)
+equilibriumPoints = list(UniqueRoots(roots, report["converged"])[0])
 
 # Print the equilibrium points.
 print("Equilibrium Points:", equilibriumPoints)
@@ -149,13 +259,16 @@ plt.tight_layout()  # Adjust layout to prevent overlap.
 n = 1  # Set n to 1 for the bifurcation diagram.
 kValues = np.linspace(0.1, 15, 500)  # Range of k values from 0.1 to 15.
 stable, unstable = [], []  # Lists to hold stable and unstable points.
-for kValue in kValues:
-  eqPoints = []
-  for i in range(0, 100):
-    sol = fsolve(lambda x: HillEquation(x, beta, n, kValue, gamma), i)
-    if (not any(np.isclose(sol, e) for e in eqPoints)):
-      eqPoints.append(sol[0])
-  if (eqPoints):
+# One batched Newton call covers all 500 k values x 100 seeds.
+roots, report = BatchedNewton(
+  HillEquation, HillEquationDerivative, seeds, {"beta": beta, "n": n, "k": kValues, "gamma": gamma},
+)
+print(
+  f"Newton lanes for the k sweep: {report['converged'].sum()} of {report['converged'].size} converged "
+  f"(at most {report['iterations'].max()} iterations)."
+)
+for kValue, eqPoints in zip(kValues, UniqueRoots(roots, report["converged"])):
+  if (len(eqPoints)):
     for eq in eqPoints:
       derivativeAtEq = HillEquationDerivative(eq, beta, n, kValue, gamma)
       if (derivativeAtEq < 0):
@@ -182,13 +295,11 @@ plt.tight_layout()  # Adjust layout to prevent overlap.
 k = 1.0  # Set k to 1 for the bifurcation diagram.
 nValues = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]  # Range of n values.
 stableN, unstableN = [], []  # Lists to hold stable and unstable points.
-for nValue in nValues:
-  eqPoints = []
-  for i in range(0, 100):
-    sol = fsolve(lambda x: HillEquation(x, beta, nValue, k, gamma), i)
-    if ((sol[0] >= 0) and (not any(np.isclose(sol, e) for e in eqPoints))):
-      eqPoints.append(sol[0])
-  if (eqPoints):
+roots, report = BatchedNewton(
+  HillEquation, HillEquationDerivative, seeds, {"beta": beta, "n": nValues, "k": k, "gamma": gamma},
+)
+for nValue, eqPoints in zip(nValues, UniqueRoots(roots, report["converged"] & (roots >= 0))):
+  if (len(eqPoints)):
     for eq in eqPoints:
       derivativeAtEq = HillEquationDerivative(eq, beta, nValue, k, gamma)
       if (derivativeAtEq < 0):
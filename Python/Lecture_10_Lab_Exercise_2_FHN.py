@@ -11,7 +11,6 @@
 # Import necessary libraries.
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import fsolve
 from scipy.integrate import solve_ivp
 from mpl_toolkits.mplot3d import Axes3D  # Import 3D plotting tools.
 
@@ -52,33 +51,98 @@ def FitzHughNagumoDerivative(z, epsilon=0.08, a=0.7, b=0.8, I=0.5):
   return J
 
 
-def RungeKutta4TwoDimensional(f, z0, tSpan, dt):
+def FitzHughNagumoEquilibria(epsilon=0.08, a=0.7, b=0.8, I=0.5, imagTol=1e-7, tol=1e-6):
+  """
+  Equilibrium points of the FitzHugh-Nagumo Model for one or many stimulus values.
+
+  On the w-nullcline w = (v + a) / b, so dv/dt = 0 reduces to the cubic
+  b v^3 + 3 (1 - b) v + 3 (a - b I) = 0. The cubics for all stimulus values are
+  solved at once through the eigenvalues of their companion matrices.
+
+  Parameters:
+  epsilon (float): Time scale separation parameter (it does not move the equilibria).
+  a (float): Parameter for recovery variable.
+  b (float): Parameter for recovery variable (must be non-zero).
+  I (float or array-like): External stimulus (current) values.
+  imagTol (float): Relative imaginary-part tolerance for accepting a root as real.
+  tol (float): Relative distance below which real roots are merged (a tangent, double root
+    comes back from the eigenvalue solver as two roots about 1e-8 apart).
+
+  Returns:
+  list: One array of equilibrium points [v, w] with shape (k, 2) per stimulus value.
+  """
+  if (np.any(np.asarray(b) == 0)):
+    raise ValueError("The reduction needs b != 0 (for b = 0 the w-nullcline is the line v = -a).")
+  I = np.atleast_1d(np.asarray(I, dtype=float))
+  companion = np.zeros((I.size, 3, 3))
+  companion[:, 0, 1] = -3 * (1 - b) / b  # Companion matrix of v^3 + 3 (1 - b) / b v + 3 (a - b I) / b.
+  companion[:, 0, 2] = -3 * (a - b * I) / b
+  companion[:, 1, 0] = 1.0
+  companion[:, 2, 1] = 1.0
+  roots = np.linalg.eigvals(companion)
+  equilibria = []
+  for rowRoots in roots:
+    v = np.sort(rowRoots[np.abs(rowRoots.imag) <= imagTol * (1 + np.abs(rowRoots.real))].real)  # Real roots.
+    clusters = np.split(v, np.flatnonzero(np.diff(v) >= tol * (1 + np.abs(v[1:]))) + 1) if (v.size) else []
+    v = np.array([cluster.mean() for cluster in clusters])  # One root per cluster of near-equal roots.
+    equilibria.append(np.column_stack([v, (v + a) / b]))
+  return equilibria
+
+
+def RungeKutta4TwoDimensional(f, z0, tSpan, dt, out=None):
   """
   Runge-Kutta 4th order method for solving ODEs.
 
+  The solution is written in place into one contiguous (steps, d) buffer and the
+  stage values reuse the same scratch arrays on every step.
+
   Parameters:
   f (function): The function representing the ODE.
   z0 (float): Initial condition for the state variable (var1, var2, etc.).
   tSpan (tuple): Time span for the solution.
   dt (float): Time step size.
+  out (numpy.ndarray): Optional (steps, d) array to store the solution in, for example
+    a memory-mapped array from np.lib.format.open_memmap (default is None).
 
   Returns:
   tuple: Time points and corresponding solution values.
   """
   t = np.arange(tSpan[0], tSpan[1], dt)
-  z = []  # Initialize an empty list to store the solution.
-  z.append(np.array(z0))  # Append the initial condition.
+  z0 = np.asarray(z0, dtype=float).ravel()
+  shape = (len(t), z0.size)
+  if (out is None):
+    z = np.empty(shape)  # Preallocate the solution buffer.
+  elif (out.shape != shape):
+    raise ValueError(f"`out` must have shape {shape}, got {out.shape}.")
+  else:
+    z = out
+  z[0] = z0  # Store the initial condition.
+
+  # Scratch buffers reused on every step.
+  zStage = np.empty(z0.size)  # State at which the next stage is evaluated.
+  kScaled = np.empty(z0.size)  # Weighted stage contribution.
 
   for i in range(1, len(t)):
-    k1 = f(z[i - 1]) * dt
-    k2 = f(z[i - 1] + k1 / 2.0) * dt
-    k3 = f(z[i - 1] + k2 / 2.0) * dt
-    k4 = f(z[i - 1] + k3) * dt
-    zn = z[i - 1] + (k1 + 2 * k2 + 2 * k3 + k4) / 6.0
-    z.append(zn)  # Append the new state to the solution list.
-
-  # Convert the list to a numpy array for easier manipulation.
-  z = np.array(z)
+    zPrev, zNext = z[i - 1], z[i]
+    k = f(zPrev)  # k1 / dt.
+    np.multiply(k, dt / 6.0, out=zNext)
+    np.multiply(k, dt / 2.0, out=zStage)
+    zStage += zPrev
+    k = f(zStage)  # k2 / dt.
+    np.multiply(k, dt / 3.0, out=kScaled)
+    zNext += kScaled
+    np.multiply(k, dt / 2.0, out=zStage)
+    zStage += zPrev
+    k = f(zStage)  # k3 / dt.
+    np.multiply(k, dt / 3.0, out=kScaled)
+    zNext += kScaled
+    np.multiply(k, dt, out=zStage)
+    zStage += zPrev
+    k = f(zStage)  # k4 / dt.
+    np.multiply(k, dt / 6.0, out=kScaled)
+    zNext += kScaled
+    zNext += zPrev  # z[i] = z[i - 1] + (k1 + 2 * k2 + 2 * k3 + k4) / 6.
+
   return t, z
 
 
@@ -100,15 +164,9 @@ t, z = RungeKutta4TwoDimensional(f, z0, tSpan, dt)
 dzValues = np.array([FitzHughNagumo(zI, epsilon, a, b, I) for zI in z])
 
 # Find the equilibrium points.
-equilibriumPoints = []
-for i in range(0, 100):
-  for j in range(0, 100):
-    # Solve for equilibrium points using fsolve.
-    # The equilibrium occurs when dx/dt = 0 and dy/dt = 0.
-    # [i, j]: Initial guess for the equilibrium point.
-    equilibrium = fsolve(lambda z: FitzHughNagumo(z, epsilon, a, b, I), [i, j])
-    if (not any(np.isclose(equilibrium, e).all() for e in equilibriumPoints)):
-      equilibriumPoints.append(equilibrium)
+# The equilibrium occurs when dx/dt = 0 and dy/dt = 0; eliminating w through
+# the w-nullcline leaves a cubic in v, so no seed grid of fsolve calls is needed.
+equilibriumPoints = list(FitzHughNagumoEquilibria(epsilon, a, b, I)[0])
 
 # Print the equilibrium points.
 print("Equilibrium Points:", equilibriumPoints)
@@ -160,15 +218,10 @@ plt.tight_layout()  # Adjust layout to prevent overlap.
 
 # Plot the phase portrait and vector field of the FitzHugh-Nagumo system.
 N = 100  # Number of points in the grid for vector field.
-U, V = np.zeros((N, N)), np.zeros((N, N))  # Initialize velocity components for vector field.
 xVals = np.linspace(-5, 5, N)  # Range of prey population values.
 yVals = np.linspace(-5, 5, N)  # Range of predator population values.
 X, Y = np.meshgrid(xVals, yVals)  # Create a grid of prey and predator populations.
-for i in range(X.shape[0]):
-  for j in range(X.shape[1]):
-    state = [X[i, j], Y[i, j]]  # Current state (prey, predator).
-    derivatives = FitzHughNagumo(state, epsilon, a, b, I)  # Compute derivatives.
-    U[i, j], V[i, j] = derivatives  # Store the derivatives in U and V.
+U, V = FitzHughNagumo([X, Y], epsilon, a, b, I)  # Evaluate the whole grid with one broadcast call.
 
 plt.subplot(2, 2, 3)
 for initCond in [
@@ -208,19 +261,9 @@ plt.tight_layout()  # Adjust layout to prevent overlap.
 # Plot the bifurcation diagram by changing the parameter external stimulus I.
 extValues = np.linspace(0.0, 2.5, 10)  # Range of I values for bifurcation analysis.
 stable, unstable = [], []  # Lists to hold stable and unstable points.
-for extValue in extValues:
-  eqPoints = []
-  for i in range(0, 100):
-    for j in range(0, 100):
-      # Solve for equilibrium points using fsolve.
-      equilibrium = fsolve(lambda z: FitzHughNagumo(z, epsilon, a, b, extValue), [i, j])
-      if (
-        # (equilibrium[0] >= 0) and
-        # (equilibrium[1] >= 0) and
-        (not any(np.isclose(equilibrium, e).all() for e in eqPoints))
-      ):
-        eqPoints.append(equilibrium)
-  if (eqPoints):
+# Solve for the equilibrium points of all I values at once.
+for extValue, eqPoints in zip(extValues, FitzHughNagumoEquilibria(epsilon, a, b, extValues)):
+  if (len(eqPoints)):
     for eq in eqPoints:
       J = FitzHughNagumoDerivative(eq, epsilon, a, b, extValue)
       eigenvalues = np.linalg.eigvals(J)  # Compute eigenvalues of the Jacobian.
@@ -0,0 +1,414 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.linalg import lu_factor, lu_solve
+from scipy.integrate import solve_ivp
+
+# Length of the real stability interval of the classical RK4 method.
+RK4_STABILITY_BOUND = 2.785
+
+
+def FitzHughNagumo(z, epsilon=0.08, a=0.7, b=0.8, I=0.5):
+  """
+  FitzHugh-Nagumo Model for Neuron Dynamics (Lecture_10_Lab_Exercise_2_FHN.py).
+  """
+  v, w = z  # Unpack the state variables.
+  dvdt = v - v ** 3 / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return np.array([dvdt, dwdt])
+
+
+def FitzHughNagumoDerivative(z, epsilon=0.08, a=0.7, b=0.8, I=0.5):
+  """
+  Jacobian of the FitzHugh-Nagumo Model (Lecture_10_Lab_Exercise_2_FHN.py).
+  """
+  v, w = z  # Unpack the state variables.
+  return np.array([
+    [1 - v ** 2, -1],  # Derivative of dv/dt with respect to v and w.
+    [epsilon, -epsilon * b]  # Derivative of dw/dt with respect to v and w.
+  ])
+
+
+def HindmarshRose(t, y, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Hindmarsh-Rose neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = y
+  dxdt = y - a * x ** 3 + b * x ** 2 + I - z
+  dydt = c - d * x ** 2 - y
+  dzdt = r * (s * (x - x0) - z)
+  return np.array([dxdt, dydt, dzdt])
+
+
+def HindmarshRoseJacobian(t, y, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Analytic Jacobian of the Hindmarsh-Rose neuron model.
+  """
+  x = y[0]
+  return np.array([
+    [-3 * a * x ** 2 + 2 * b * x, 1.0, -1.0],
+    [-2 * d * x, -1.0, 0.0],
+    [r * s, 0.0, -r],
+  ])
+
+
+def NumericalJacobian(f, t, y, stats):
+  """
+  Forward-difference Jacobian, used when no analytic Jacobian is supplied.
+  It costs one extra RHS evaluation per state variable.
+  """
+  f0 = f(t, y)
+  J = np.empty((len(y), len(y)))
+  for j in range(len(y)):
+    delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(y[j]))
+    yShift = y.copy()
+    yShift[j] += delta
+    J[:, j] = (f(t, yShift) - f0) / delta
+  stats["nfev"] += len(y) + 1
+  return J
+
+
+def UpdateJacobian(f, jac, t, y, state):
+  """
+  Evaluates the Jacobian (analytic when available) and stores it in the Newton state.
+  """
+  state["J"] = jac(t, y) if (jac is not None) else NumericalJacobian(f, t, y, state["stats"])
+  state["stats"]["njev"] += 1
+  state["gammaH"] = None  # The iteration matrix must be refactored.
+
+
+def FactorIterationMatrix(state, gammaH):
+  """
+  LU-factors the Newton iteration matrix I - gammaH * J (only when gammaH or J changed).
+  """
+  if (state["gammaH"] != gammaH):
+    state["lu"] = lu_factor(np.eye(len(state["J"])) - gammaH * state["J"])
+    state["gammaH"] = gammaH
+    state["stats"]["nlu"] += 1
+
+
+def SimplifiedNewton(f, jac, t, yGuess, rhs, gammaH, state, tol, maxIter, fullNewton=False):
+  """
+  Solves y - gammaH * f(t, y) = rhs with the stored LU factors (simplified Newton).
+  With fullNewton=True the Jacobian is re-evaluated and refactored at every iterate.
+
+  Returns:
+  tuple: The iterate and whether it converged. The simplified iteration is abandoned
+  as soon as the contraction rate exceeds 0.9, so that the caller can refresh the Jacobian.
+  """
+  y = yGuess.copy()
+  previous = None
+  for _ in range(maxIter):
+    if (fullNewton):
+      UpdateJacobian(f, jac, t, y, state)
+    FactorIterationMatrix(state, gammaH)
+    residual = y - gammaH * f(t, y) - rhs
+    state["stats"]["nfev"] += 1
+    delta = lu_solve(state["lu"], -residual)
+    y += delta
+    norm = np.sqrt(np.mean((delta / (1.0 + np.abs(y))) ** 2))
+    if (norm < tol):
+      return y, True
+    if (not fullNewton) and (previous is not None) and (norm > 0.9 * previous):
+      return y, False  # Convergence stalled.
+    previous = norm
+  return y, False
+
+
+def ImplicitSolve(f, jac, t, yGuess, rhs, gammaH, state, tol, maxIter):
+  """
+  Simplified Newton with Jacobian reuse. Only when the iteration with the stored
+  Jacobian stalls does it fall back to full Newton; the last Jacobian and its LU
+  factors are kept for the following steps.
+  """
+  y, converged = SimplifiedNewton(f, jac, t, yGuess, rhs, gammaH, state, tol, maxIter)
+  if (not converged):
+    y, converged = SimplifiedNewton(
+      f, jac, t, yGuess, rhs, gammaH, state, tol, 5 * maxIter, fullNewton=True,
+    )
+    if (not converged):
+      raise RuntimeError(f"Newton iteration failed at t = {t}; reduce the step size.")
+  return y
+
+
+def HalvedBackwardEuler(f, jac, t0, y0, h, state, tol, maxIter, depth=0, maxDepth=12):
+  """
+  Backward Euler over [t0, t0 + h], recursively halving the step where Newton fails
+  (e.g., when a large step jumps across the fold of the FHN cubic nullcline and the
+  nearby root of the implicit equation disappears).
+  """
+  try:
+    return ImplicitSolve(f, jac, t0 + h, y0, y0, h, state, tol, maxIter)
+  except RuntimeError:
+    if (depth >= maxDepth):
+      raise
+    state["stats"]["halvings"] += 1
+    yMid = HalvedBackwardEuler(f, jac, t0, y0, h / 2.0, state, tol, maxIter, depth + 1, maxDepth)
+    return HalvedBackwardEuler(f, jac, t0 + h / 2.0, yMid, h / 2.0, state, tol, maxIter, depth + 1, maxDepth)
+
+
+def ImplicitFixedStep(f, y0, tSpan, h, method="BDF2", jac=None, tol=1e-10, maxIter=10):
+  """
+  Fixed-step implicit integrator: backward Euler, trapezoidal rule or BDF2.
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  y0 (array-like): Initial condition.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+  h (float): Time step.
+  method (str): "BackwardEuler", "Trapezoidal" or "BDF2".
+  jac (function): Analytic Jacobian jac(t, y) (finite differences when None).
+  tol (float): Tolerance of the Newton iteration.
+  maxIter (int): Maximum number of Newton iterations.
+
+  Returns:
+  t (numpy.ndarray): Time vector.
+  Y (numpy.ndarray): Solution values with shape (steps, d).
+  stats (dict): RHS evaluations, Jacobian evaluations, LU factorizations and step halvings.
+  """
+  t = np.arange(*tSpan, h)
+  Y = np.zeros((len(t), len(y0)))
+  Y[0] = y0
+  state = {"stats": {"nfev": 0, "njev": 0, "nlu": 0, "halvings": 0}}
+  UpdateJacobian(f, jac, t[0], Y[0], state)
+
+  for i in range(len(t) - 1):
+    if (method == "BackwardEuler") or ((method == "BDF2") and (i == 0)):
+      # y[i+1] - h f(t[i+1], y[i+1]) = y[i] (BDF2 starts with one backward Euler step).
+      gammaH, rhs = h, Y[i]
+    elif (method == "Trapezoidal"):
+      # y[i+1] - h/2 f(t[i+1], y[i+1]) = y[i] + h/2 f(t[i], y[i]).
+      gammaH, rhs = h / 2.0, Y[i] + h / 2.0 * f(t[i], Y[i])
+      state["stats"]["nfev"] += 1
+    else:
+      # y[i+1] - 2h/3 f(t[i+1], y[i+1]) = 4/3 y[i] - 1/3 y[i-1].
+      gammaH, rhs = 2.0 * h / 3.0, 4.0 / 3.0 * Y[i] - 1.0 / 3.0 * Y[i - 1]
+    try:
+      Y[i + 1] = ImplicitSolve(f, jac, t[i + 1], Y[i], rhs, gammaH, state, tol, maxIter)
+    except RuntimeError:
+      # Newton failed on the full step: cross this interval with halved backward Euler steps.
+      Y[i + 1] = HalvedBackwardEuler(f, jac, t[i], Y[i], h / 2.0, state, tol, maxIter)
+      Y[i + 1] = HalvedBackwardEuler(f, jac, t[i] + h / 2.0, Y[i + 1], h / 2.0, state, tol, maxIter)
+
+  return t, Y, state["stats"]
+
+
+def BackwardEuler(f, y0, tSpan, h, jac=None):
+  """
+  Backward Euler method (first order, L-stable).
+  """
+  return ImplicitFixedStep(f, y0, tSpan, h, method="BackwardEuler", jac=jac)
+
+
+def Trapezoidal(f, y0, tSpan, h, jac=None):
+  """
+  Trapezoidal rule (second order, A-stable).
+  """
+  return ImplicitFixedStep(f, y0, tSpan, h, method="Trapezoidal", jac=jac)
+
+
+def BDF2(f, y0, tSpan, h, jac=None):
+  """
+  Second-order backward differentiation formula (A-stable).
+  """
+  return ImplicitFixedStep(f, y0, tSpan, h, method="BDF2", jac=jac)
+
+
+def Rosenbrock2(f, y0, tSpan, rtol=1e-4, atol=1e-7, jac=None, h0=1e-3, maxJacobianAge=20, maxSteps=100000):
+  """
+  Adaptive two-stage Rosenbrock method ROS2 (Verwer et al., 1999) for autonomous systems,
+  with the embedded linearly implicit Euler solution as error estimate.
+
+  ROS2 keeps second order for any matrix in place of the exact Jacobian, so the
+  Jacobian is reused across steps and refreshed only after a rejected step or once
+  it is maxJacobianAge accepted steps old. The LU factors are recomputed only when
+  the step size or the Jacobian changes.
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  y0 (array-like): Initial condition.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+  rtol (float): Relative tolerance.
+  atol (float): Absolute tolerance.
+  jac (function): Analytic Jacobian jac(t, y) (finite differences when None).
+  h0 (float): Initial step size.
+  maxJacobianAge (int): Accepted steps after which the Jacobian is refreshed.
+  maxSteps (int): Maximum number of attempted steps.
+
+  Returns:
+  t (numpy.ndarray): Accepted time points.
+  Y (numpy.ndarray): Solution values with shape (steps, d).
+  stats (dict): Counters and the fraction of accepted steps beyond the RK4 stability limit.
+  """
+  gamma = 1.0 + 1.0 / np.sqrt(2.0)
+  t, tEnd = tSpan
+  y = np.asarray(y0, dtype=float)
+  state = {"stats": {"nfev": 0, "njev": 0, "nlu": 0, "accepted": 0, "rejected": 0, "stiffSteps": 0}}
+  UpdateJacobian(f, jac, t, y, state)
+  age = 0  # Accepted steps since the last Jacobian evaluation.
+  tOut, yOut = [t], [y.copy()]
+  h = h0
+
+  for _ in range(maxSteps):
+    if (t >= tEnd):
+      break
+    if (age >= maxJacobianAge):
+      UpdateJacobian(f, jac, t, y, state)
+      age = 0
+    h = min(h, tEnd - t)
+    FactorIterationMatrix(state, gamma * h)
+    f0 = f(t, y)
+    k1 = lu_solve(state["lu"], f0)
+    k2 = lu_solve(state["lu"], f(t + h, y + h * k1) - 2.0 * k1)
+    state["stats"]["nfev"] += 2
+    yNew = y + 1.5 * h * k1 + 0.5 * h * k2
+    scale = atol + rtol * np.maximum(np.abs(y), np.abs(yNew))
+    err = np.sqrt(np.mean((0.5 * h * (k1 + k2) / scale) ** 2))
+
+    if (err <= 1.0):
+      # Record whether an explicit RK4 step of this size would have been unstable.
+      if (h * np.max(np.abs(np.linalg.eigvals(state["J"]))) > RK4_STABILITY_BOUND):
+        state["stats"]["stiffSteps"] += 1
+      t, y = t + h, yNew
+      tOut.append(t)
+      yOut.append(y.copy())
+      state["stats"]["accepted"] += 1
+      age += 1
+      h *= min(5.0, 0.9 / np.sqrt(max(err, 1e-10)))
+    else:
+      state["stats"]["rejected"] += 1
+      if (age > 0):
+        UpdateJacobian(f, jac, t, y, state)  # Refresh the Jacobian after a rejection.
+        age = 0
+      h *= max(0.2, 0.9 / np.sqrt(err))
+  else:
+    raise RuntimeError(f"Maximum number of steps ({maxSteps}) reached at t = {t}.")
+
+  stats = state["stats"]
+  stats["stiffFraction"] = stats["stiffSteps"] / max(stats["accepted"], 1)
+  return np.array(tOut), np.array(yOut), stats
+
+
+def StiffnessReport(jac, t, Y, h, samples=50):
+  """
+  Estimates stiffness along a trajectory from the Jacobian eigenvalues.
+
+  Parameters:
+  jac (function): Jacobian jac(t, y).
+  t (numpy.ndarray): Time points of the trajectory.
+  Y (numpy.ndarray): States of the trajectory with shape (steps, d).
+  h (float): Step size the explicit method would have to use (or the step size in use).
+  samples (int): Number of trajectory points to inspect.
+
+  Returns:
+  dict: Stiffness ratio, largest stable explicit RK4 step and a recommendation.
+  """
+  idx = np.linspace(0, len(t) - 1, min(samples, len(t))).astype(int)
+  eigenvalues = np.array([np.linalg.eigvals(jac(t[i], Y[i])) for i in idx])
+  realParts = np.abs(eigenvalues.real)
+  fastest = realParts.max(axis=1)
+  slowest = np.where(realParts > 0, realParts, np.inf).min(axis=1)
+  explicitLimit = RK4_STABILITY_BOUND / np.abs(eigenvalues).max()
+  stiffnessRatio = float(np.max(fastest / slowest))
+  stiff = (h > explicitLimit) and (stiffnessRatio > 100)
+  return {
+    "stiffnessRatio"     : stiffnessRatio,
+    "explicitStepLimit"  : float(explicitLimit),
+    "requestedStep"      : h,
+    "recommendedFamily"  : "implicit" if (stiff) else "explicit",
+  }
+
+
+def RungeKutta4(f, y0, tSpan, h):
+  """
+  Explicit Runge-Kutta 4th order method with the same interface as the implicit solvers.
+  """
+  t = np.arange(*tSpan, h)
+  Y = np.zeros((len(t), len(y0)))
+  Y[0] = y0
+  for i in range(len(t) - 1):
+    k1 = f(t[i], Y[i])
+    k2 = f(t[i] + h / 2.0, Y[i] + h / 2.0 * k1)
+    k3 = f(t[i] + h / 2.0, Y[i] + h / 2.0 * k2)
+    k4 = f(t[i] + h, Y[i] + h * k3)
+    Y[i + 1] = Y[i] + h / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+  return t, Y, {"nfev": 4 * (len(t) - 1), "njev": 0, "nlu": 0}
+
+
+# ==============================================================
+# ========= Slow-Fast FitzHugh-Nagumo (Small Epsilon) ==========
+# ==============================================================
+epsilon, a, b, I = 0.001, 0.7, 0.8, 0.0  # Small epsilon: slow recovery variable.
+z0 = [1.0, 0.1]  # Initial conditions (v0, w0).
+tSpan = (0, 3000)  # Long horizon set by the slow time scale 1 / epsilon.
+fhn = lambda t, z: FitzHughNagumo(z, epsilon, a, b, I)
+fhnJac = lambda t, z: FitzHughNagumoDerivative(z, epsilon, a, b, I)
+
+table = pt.PrettyTable()
+table.field_names = ["Model", "Method", "Steps", "RHS Evaluations", "Jacobians", "LU", "Final State"]
+runs = {}
+for name, run in [
+  ("RK4 (h = 0.5)", lambda: RungeKutta4(fhn, z0, tSpan, 0.5)),
+  ("Backward Euler (h = 5)", lambda: BackwardEuler(fhn, z0, tSpan, 5.0, jac=fhnJac)),
+  ("Trapezoidal (h = 5)", lambda: Trapezoidal(fhn, z0, tSpan, 5.0, jac=fhnJac)),
+  ("BDF2 (h = 5)", lambda: BDF2(fhn, z0, tSpan, 5.0, jac=fhnJac)),
+  ("ROS2 adaptive (rtol = 1e-4)", lambda: Rosenbrock2(fhn, z0, tSpan, jac=fhnJac)),
+]:
+  t, Y, stats = run()
+  runs[name] = (t, Y)
+  table.add_row([
+    "FHN", name, len(t) - 1, stats["nfev"], stats["njev"], stats["nlu"], np.round(Y[-1], 4),
+  ])
+sol = solve_ivp(fhn, tSpan, z0, method="RK45", rtol=1e-4, atol=1e-7)
+table.add_row(["FHN", "solve_ivp RK45 (rtol = 1e-4)", len(sol.t) - 1, sol.nfev, 0, 0, np.round(sol.y[:, -1], 4)])
+
+# ==============================================================
+# ================ Hindmarsh-Rose (r = 0.01) ===================
+# ==============================================================
+tSpanHR = (0, 100)
+y0HR = [1.0, 1.0, 1.0]
+t, Y, stats = Rosenbrock2(HindmarshRose, y0HR, tSpanHR, jac=HindmarshRoseJacobian)
+table.add_row([
+  "Hindmarsh-Rose", "ROS2 adaptive (rtol = 1e-4)", len(t) - 1, stats["nfev"], stats["njev"], stats["nlu"],
+  np.round(Y[-1], 4),
+])
+sol = solve_ivp(HindmarshRose, tSpanHR, y0HR, method="RK45", rtol=1e-4, atol=1e-7)
+table.add_row([
+  "Hindmarsh-Rose", "solve_ivp RK45 (rtol = 1e-4)", len(sol.t) - 1, sol.nfev, 0, 0, np.round(sol.y[:, -1], 4),
+])
+print(table)
+
+# Stiffness detector reports.
+tROS, YROS = runs["ROS2 adaptive (rtol = 1e-4)"]
+for name, report in [
+  ("FHN (epsilon = 0.001, h = 5)", StiffnessReport(fhnJac, tROS, YROS, 5.0)),
+  ("Hindmarsh-Rose (h = 0.05)", StiffnessReport(HindmarshRoseJacobian, t, Y, 0.05)),
+]:
+  print(f"Stiffness report for {name}: {report}")
+
+# Plot the FHN solutions of the explicit and implicit families.
+plt.figure(figsize=(12, 5))
+for name, style in [("RK4 (h = 0.5)", "k-"), ("BDF2 (h = 5)", "r--"), ("ROS2 adaptive (rtol = 1e-4)", "bo")]:
+  t, Y = runs[name]
+  plt.plot(t, Y[:, 0], style, label=name, lw=1.5, markersize=3)
+plt.xlabel("Time (t)", fontsize=12)
+plt.ylabel("Membrane Potential (v)", fontsize=12)
+plt.title(f"Slow-Fast FitzHugh-Nagumo (epsilon = {epsilon}): Explicit vs Implicit", fontsize=14)
+plt.legend()  # Add legend for the methods.
+plt.grid()  # Add grid to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+
+plt.savefig("Lecture_10_Lab_Exercise_3_Stiff.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.
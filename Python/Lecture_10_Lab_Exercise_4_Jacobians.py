@@ -0,0 +1,350 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import types
+import inspect
+import numpy as np
+import sympy as sp
+import prettytable as pt
+from scipy.integrate import solve_ivp
+
+
+class SymPyNumPy(types.SimpleNamespace):
+  """
+  Stand-in for the NumPy module while a model is traced with SymPy symbols.
+  """
+
+  def __getattr__(self, name):
+    # Only reached for names that are not defined below; an AttributeError keeps hasattr/getattr working.
+    raise AttributeError(
+      f"np.{name} has no SymPy equivalent for tracing; supported: {', '.join(sorted(vars(self)))}."
+    )
+
+
+SYMPY_NUMPY = SymPyNumPy(
+  cos=sp.cos, sin=sp.sin, tan=sp.tan, exp=sp.exp, log=sp.log, sqrt=sp.sqrt,
+  tanh=sp.tanh, abs=sp.Abs, pi=sp.pi, array=list, asarray=list,
+)
+
+
+def lorenz(t, y, sigma=10, beta=8 / 3, rho=28):
+  """
+  Lorenz-type neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = y
+  dxdt = sigma * (y - x)
+  dydt = x * (rho - z) - y
+  dzdt = x * y - beta * z
+  return [dxdt, dydt, dzdt]
+
+
+def rossler(t, y, a=0.2, b=0.2, c=5.7):
+  """
+  Rössler-type neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = y
+  dxdt = -y - z
+  dydt = x + a * y
+  dzdt = b + z * (x - c)
+  return [dxdt, dydt, dzdt]
+
+
+def vanDerPol(t, y, mu=1.0, force=0.5, omega=0.5):
+  """
+  Forced Van der Pol oscillator (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, v = y
+  dxdt = v
+  dvdt = mu * (1 - x ** 2) * v - x + force * np.cos(omega * t)
+  return [dxdt, dvdt]
+
+
+def hindmarshRose(t, y, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Hindmarsh-Rose neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = y
+  dxdt = y - a * x ** 3 + b * x ** 2 + I - z
+  dydt = c - d * x ** 2 - y
+  dzdt = r * (s * (x - x0) - z)
+  return [dxdt, dydt, dzdt]
+
+
+def System2D(t, state, params):
+  #  Function to compute the derivatives for a 2D system (Lecture_09_Lab_Exercise_1_Phase.py).
+  x, y = state  # Unpack the state variables.
+  alpha, beta, gamma, delta = params  # Unpack the parameters.
+  dxdt = alpha * x - beta * x * y  # Derivative of x.
+  dydt = -gamma * y + delta * x * y  # Derivative of y.
+  return [dxdt, dydt]
+
+
+def HeartOscillations(t, y, omega0, gamma, F0=0.0, omegaF=0.0):
+  """
+  Heart oscillations model (Lecture_04_Lab_Exercise_3_Heart.py).
+  """
+  x, v = y  # Unpack the state variables.
+  dxdt = v
+  dvdt = -2 * gamma * v - omega0 ** 2 * x + F0 * np.cos(omegaF * t)
+  return [dxdt, dvdt]
+
+
+def KneeModel(t, y, c, k, F0=0.0, omegaF=0.0):
+  """
+  Knee model (Lecture_05_Lab_Exercise_1_Knee.py).
+  """
+  x, v = y  # Unpack the state variables.
+  dxdt = v
+  dvdt = -c * v - k * x + F0 * np.cos(omegaF * t)
+  return [dxdt, dvdt]
+
+
+def HillEquation(x, beta=1.0, n=2, k=1.0, gamma=0.1):
+  """
+  Hill equation (Lecture_10_Lab_Exercise_1_Hill.py).
+  """
+  result = (beta * (x ** n) / (k ** n + x ** n)) - (gamma * x)
+  return result
+
+
+def HillEquationDerivative(x, beta=1.0, n=2, k=1.0, gamma=0.1):
+  """
+  Hand-written derivative of the Hill equation (Lecture_10_Lab_Exercise_1_Hill.py).
+  """
+  num = beta * (x ** n)
+  numDerivative = beta * n * (x ** (n - 1))
+  den = k ** n + x ** n
+  denDerivative = n * (x ** (n - 1))
+  result = (numDerivative * den - num * denDerivative) / (den ** 2) - gamma
+  return result
+
+
+def FitzHughNagumo(z, epsilon=0.08, a=0.7, b=0.8, I=0.5):
+  """
+  FitzHugh-Nagumo Model for Neuron Dynamics (Lecture_10_Lab_Exercise_2_FHN.py).
+  """
+  v, w = z  # Unpack the state variables.
+  dvdt = v - v ** 3 / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return np.array([dvdt, dwdt])
+
+
+def FitzHughNagumoDerivative(z, epsilon=0.08, a=0.7, b=0.8, I=0.5):
+  """
+  Hand-written Jacobian of the FitzHugh-Nagumo Model (Lecture_10_Lab_Exercise_2_FHN.py).
+  """
+  v, w = z  # Unpack the state variables.
+  return np.array([
+    [1 - v ** 2, -1],  # Derivative of dv/dt with respect to v and w.
+    [epsilon, -epsilon * b]  # Derivative of dw/dt with respect to v and w.
+  ])
+
+
+def TraceModel(f, nStates, paramNames=None):
+  """
+  Evaluates a model RHS on SymPy symbols.
+
+  The model may take the time first, f(t, y, ...), or the state first, f(y, ...).
+  With nStates=0 the state is a single scalar (as in HillEquation). Every remaining
+  argument becomes a symbol named after it, except the sequence arguments listed in
+  paramNames (such as the params tuple of System2D), which become one symbol per entry.
+
+  Parameters:
+  f (function): The model RHS.
+  nStates (int): Number of state variables (0 for a scalar state).
+  paramNames (dict): Space-separated entry names of each sequence argument.
+
+  Returns:
+  tuple: (expressions, time symbol, state symbols, parameter symbols, argument layout).
+  """
+  argNames = list(inspect.signature(f).parameters)
+  hasTime = (argNames[0] == "t")
+  stateSymbols = list(sp.symbols(f"y0:{max(nStates, 1)}", real=True))
+  t = sp.Symbol("t", real=True)
+
+  layout, paramSymbols, args = [], [], []
+  for name in argNames[1 + hasTime:]:
+    if (paramNames is not None) and (name in paramNames):
+      symbols = list(sp.symbols(paramNames[name], real=True))
+      layout.append((name, len(symbols)))
+      paramSymbols.extend(symbols)
+      args.append(symbols)
+    else:
+      symbol = sp.Symbol(name, real=True)
+      layout.append((name, None))
+      paramSymbols.append(symbol)
+      args.append(symbol)
+
+  state = stateSymbols if (nStates > 0) else stateSymbols[0]
+  # Trace a copy of the model whose np.* calls go to SymPy; the module itself is left untouched.
+  traced = types.FunctionType(f.__code__, {**f.__globals__, "np": SYMPY_NUMPY}, f.__name__, f.__defaults__,
+                              f.__closure__)
+  traced.__kwdefaults__ = f.__kwdefaults__
+  F = traced(t, state, *args) if (hasTime) else traced(state, *args)
+  F = [sp.sympify(e) for e in (F if (nStates > 0) else [F])]
+  return F, t, stateSymbols, paramSymbols, (hasTime, nStates, layout)
+
+
+def GenerateJacobian(f, nStates, paramNames=None):
+  """
+  Generates an analytic, NumPy-vectorized Jacobian for a model RHS.
+
+  The symbolic Jacobian is compiled with lambdify using common-subexpression
+  elimination, and only its structurally nonzero entries are evaluated.
+
+  Parameters:
+  f (function): The model RHS (see TraceModel for the supported signatures).
+  nStates (int): Number of state variables (0 for a scalar state).
+  paramNames (dict): Space-separated entry names of each sequence argument.
+
+  Returns:
+  jac (function): Jacobian with the same signature as f. For a state of shape (d, ...)
+    it returns an array of shape (d, d, ...); for a scalar state, the derivative.
+  info (dict): The symbolic matrix, the sparsity pattern and the constant entries.
+  """
+  F, t, Y, P, (hasTime, nStates, layout) = TraceModel(f, nStates, paramNames)
+  J = sp.Matrix(F).jacobian(Y)
+  d = len(Y)
+  sparsity = np.array([[J[i, j] != 0 for j in range(d)] for i in range(d)])
+  rows, cols = np.nonzero(sparsity)
+  entries = [J[i, j] for i, j in zip(rows, cols)]
+  constant = np.array([[not (J[i, j].free_symbols & set(Y + [t])) for j in range(d)] for i in range(d)])
+  compiled = sp.lambdify([t, Y, P], entries, modules="numpy", cse=True)
+  signature = inspect.signature(f)
+
+  def jac(*args, **kwargs):
+    bound = signature.bind(*args, **kwargs)  # A TypeError names any missing argument.
+    bound.apply_defaults()
+    values = list(bound.arguments.values())
+    tValue = values[0] if (hasTime) else 0.0
+    y = np.asarray(values[int(hasTime)], dtype=float)
+    p = []
+    for (name, size), value in zip(layout, values[1 + hasTime:]):
+      p.extend(value if (size is not None) else [value])
+    state = y.reshape((d,) + y.shape[nStates > 0:]) if (nStates > 0) else y[np.newaxis]
+    out = np.zeros((d, d) + state.shape[1:])
+    for i, j, value in zip(rows, cols, compiled(tValue, state, p)):
+      out[i, j] = value
+    return out if (nStates > 0) else out[0, 0]
+
+  info = {
+    "matrix"   : J,
+    "sparsity" : sparsity,
+    "nnz"      : int(sparsity.sum()),
+    "constant" : constant & sparsity,
+  }
+  return jac, info
+
+
+def FiniteDifferenceJacobian(f, t, y, args=(), hasTime=True):
+  """
+  Forward-difference Jacobian (d + 1 RHS calls), the cost the generated Jacobians remove.
+  """
+  y = np.asarray(y, dtype=float)
+  call = (lambda s: np.asarray(f(t, s, *args), dtype=float)) if (hasTime) else \
+    (lambda s: np.asarray(f(s, *args), dtype=float))
+  f0 = call(y)
+  J = np.empty((len(y), len(y)))
+  for j in range(len(y)):
+    delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(y[j]))
+    yShift = y.copy()
+    yShift[j] += delta
+    J[:, j] = (call(yShift) - f0) / delta
+  return J
+
+
+# ==============================================================
+# ============ Generate and Verify Model Jacobians =============
+# ==============================================================
+models = {
+  # name: (f, nStates, paramNames, extra positional arguments, sample state).
+  "lorenz"            : (lorenz, 3, None, (), [1.0, 2.0, 20.0]),
+  "rossler"           : (rossler, 3, None, (), [1.0, -2.0, 0.5]),
+  "vanDerPol"         : (vanDerPol, 2, None, (), [2.5, 5.0]),
+  "hindmarshRose"     : (hindmarshRose, 3, None, (), [1.0, 1.0, 1.0]),
+  "System2D"          : (System2D, 2, {"params": "alpha beta gamma delta"}, ((1.0, 0.1, 1.5, 0.075),), [10.0, 5.0]),
+  "HeartOscillations" : (HeartOscillations, 2, None, (2 * np.pi, 0.5, 1.0, 1.5), [1.0, 0.0]),
+  "KneeModel"         : (KneeModel, 2, None, (0.5, 4.0, 2.0, 3.0), [0.2, 0.0]),
+  "FitzHughNagumo"    : (FitzHughNagumo, 2, None, (), [1.0, 0.1]),
+  "HillEquation"      : (HillEquation, 0, None, (), 0.7),
+}
+
+rng = np.random.default_rng(0)
+table = pt.PrettyTable()
+table.field_names = [
+  "Model", "d", "Nonzeros", "Constant", "Max Rel. Error vs FD", "Generated (us)", "Finite Diff. (us)",
+]
+jacobians = {}
+for name, (f, nStates, paramNames, args, y0) in models.items():
+  jac, info = GenerateJacobian(f, nStates, paramNames)
+  jacobians[name] = jac
+  hasTime = (list(inspect.signature(f).parameters)[0] == "t")
+  d = max(nStates, 1)
+  errors = []
+  for _ in range(20):
+    y = np.atleast_1d(y0) * (1.0 + 0.2 * rng.standard_normal(d))
+    fScalar = f if (nStates > 0) else (lambda s, *a: [f(s[0], *a)])
+    reference = FiniteDifferenceJacobian(fScalar, 0.3, y, args, hasTime)
+    analytic = jac(0.3, y if (nStates > 0) else y[0], *args) if (hasTime) else \
+      jac(y if (nStates > 0) else y[0], *args)
+    errors.append(np.max(np.abs(np.atleast_2d(analytic) - reference)) / (1.0 + np.max(np.abs(reference))))
+
+  callArgs = (0.3, y0, *args) if (hasTime) else (y0, *args)
+  start = time.perf_counter()
+  for _ in range(2000):
+    jac(*callArgs)
+  generatedTime = (time.perf_counter() - start) / 2000 * 1e6
+  start = time.perf_counter()
+  for _ in range(2000):
+    FiniteDifferenceJacobian(fScalar, 0.3, np.atleast_1d(y0), args, hasTime)
+  fdTime = (time.perf_counter() - start) / 2000 * 1e6
+  table.add_row([
+    name, d, info["nnz"], int(info["constant"].sum()), f"{max(errors):.2e}",
+    f"{generatedTime:.1f}", f"{fdTime:.1f}",
+  ])
+print(table)
+
+# The generated Jacobians reproduce the hand-written derivatives of the FHN and Hill labs.
+z = rng.uniform(-2, 2, size=(2, 1000))
+fhnJac = jacobians["FitzHughNagumo"]
+print(
+  "Max |generated - FitzHughNagumoDerivative| over 1000 states:",
+  max(np.max(np.abs(fhnJac(z[:, i]) - FitzHughNagumoDerivative(z[:, i]))) for i in range(z.shape[1])),
+)
+x = np.linspace(0.05, 10, 1000)
+print(
+  "Max |generated - HillEquationDerivative| (vectorized over 1000 points):",
+  np.max(np.abs(jacobians["HillEquation"](x, n=3) - HillEquationDerivative(x, n=3))),
+)
+print("Vectorized Lorenz Jacobian for 1000 states has shape:", jacobians["lorenz"](0.0, rng.normal(size=(3, 1000))).shape)
+
+# ==============================================================
+# =========== Implicit solve_ivp With and Without jac= =========
+# ==============================================================
+table = pt.PrettyTable()
+table.field_names = ["Model", "Method", "Jacobian", "Reported nfev", "Actual RHS Calls", "Jacobian Evaluations", "Time (ms)"]
+for name, y0, tSpan in [
+  ("hindmarshRose", [1.0, 1.0, 1.0], (0, 200)),
+  ("vanDerPol", [2.5, 5.0], (0, 100)),
+  ("lorenz", [0.0, 1.0, 2.0], (0, 20)),
+]:
+  f = models[name][0]
+  for method in ["BDF", "Radau"]:
+    for label, options in [("finite differences", {}), ("generated", {"jac": jacobians[name]})]:
+      calls = [0]
+      counted = lambda t, y, f=f: (calls.__setitem__(0, calls[0] + 1), f(t, y))[1]
+      start = time.perf_counter()
+      sol = solve_ivp(counted, tSpan, y0, method=method, rtol=1e-6, atol=1e-9, **options)
+      elapsed = (time.perf_counter() - start) * 1e3
+      # solve_ivp does not include the finite-difference Jacobian calls in nfev.
+      table.add_row([name, method, label, sol.nfev, calls[0], sol.njev, f"{elapsed:.1f}"])
+print(table)
@@ -0,0 +1,316 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import numpy as np
+import prettytable as pt
+from scipy.optimize import brentq
+from scipy.integrate import solve_ivp, RK45, DOP853
+
+
+def FitzHughNagumo(z, epsilon=0.08, a=0.7, b=0.8, I=0.5):
+  """
+  FitzHugh-Nagumo Model for Neuron Dynamics (Lecture_10_Lab_Exercise_2_FHN.py).
+  """
+  v, w = z  # Unpack the state variables.
+  dvdt = v - v ** 3 / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return np.array([dvdt, dwdt])
+
+
+def hindmarshRose(t, y, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Hindmarsh-Rose neuron model (Lecture_08_Lab_Exercise_2_Chaos.py).
+  """
+  x, y, z = y
+  dxdt = y - a * x ** 3 + b * x ** 2 + I - z
+  dydt = c - d * x ** 2 - y
+  dzdt = r * (s * (x - x0) - z)
+  return np.array([dxdt, dydt, dzdt])
+
+
+def DrugElimination(t, C, k=0.2):
+  """
+  First-order drug elimination dC/dt = -k * C (Lecture_06_Lab_Exercise_3_RK4.py).
+  """
+  return -k * C
+
+
+class EventRecorder:
+  """
+  Detects, locates and records the zero crossings of a vectorized event function.
+
+  The event function g(t, y) returns an array of m values; event k occurs where
+  component k changes sign. Crossings are located with brentq on a continuous
+  extension of the step, so their accuracy is that of the integrator, not of the
+  output grid.
+
+  Parameters:
+  g (function): Event function g(t, y) returning m values.
+  d (int): Number of state variables.
+  direction (array-like): Per-event filter: +1 rising, -1 falling, 0 both (default 0).
+  terminal (array-like): Per-event count after which integration stops (0 never, True = 1).
+  maxEvents (int): Stop after this many events in total (default None).
+  xtol (float): Absolute tolerance of the located event times.
+  """
+
+  def __init__(self, g, d, direction=0, terminal=0, maxEvents=None, xtol=1e-12):
+    self.g = g
+    self.d = d
+    self.xtol = xtol
+    self.maxEvents = maxEvents
+    self.direction = None if (np.ndim(direction) == 0) else np.asarray(direction)
+    self.terminal = None if (np.ndim(terminal) == 0) else np.asarray(terminal, dtype=int)
+    self.scalarDirection, self.scalarTerminal = direction, int(terminal) if (np.ndim(terminal) == 0) else 0
+    self.counts = None
+    self.rows = []
+
+  def Evaluate(self, t, y):
+    return np.atleast_1d(np.asarray(self.g(t, y), dtype=float))
+
+  def Process(self, tPrev, gPrev, tNew, gNew, solution):
+    """
+    Records the crossings in (tPrev, tNew] in time order.
+
+    Parameters:
+    tPrev, tNew (float): Step interval.
+    gPrev, gNew (numpy.ndarray): Event function values at the ends of the step.
+    solution (function): Continuous extension of the step, solution(t) -> y.
+
+    Returns:
+    tuple: (stop, tStop, yStop). When stop is True the integration must end at tStop.
+    """
+    m = len(gNew)
+    if (self.counts is None):
+      self.counts = np.zeros(m, dtype=int)
+      if (self.direction is None):
+        self.direction = np.full(m, self.scalarDirection)
+      if (self.terminal is None):
+        self.terminal = np.full(m, self.scalarTerminal)
+
+    up = (gPrev < 0) & (gNew >= 0)
+    down = (gPrev > 0) & (gNew <= 0)
+    active = ((up & (self.direction >= 0)) | (down & (self.direction <= 0)))
+    found = []
+    for k in np.flatnonzero(active):
+      gk = lambda s, k=k: self.Evaluate(s, solution(s))[k]
+      tEvent = brentq(gk, tPrev, tNew, xtol=self.xtol)
+      found.append((tEvent, k, 1 if (up[k]) else -1))
+
+    for tEvent, k, sign in sorted(found):
+      yEvent = solution(tEvent)
+      self.rows.append((k, tEvent, yEvent, sign))
+      self.counts[k] += 1
+      if ((self.terminal[k] > 0) and (self.counts[k] >= self.terminal[k])) or \
+        ((self.maxEvents is not None) and (len(self.rows) >= self.maxEvents)):
+        return True, tEvent, yEvent
+    return False, tNew, None
+
+  def Table(self):
+    """
+    Returns the recorded events as a structured array with fields event, t, y, direction.
+    """
+    table = np.zeros(len(self.rows), dtype=[
+      ("event", np.int32), ("t", np.float64), ("y", np.float64, (self.d,)), ("direction", np.int8),
+    ])
+    for i, row in enumerate(self.rows):
+      table[i] = row
+    return table
+
+
+def RungeKutta4Step(f, t, y, h):
+  """
+  A single classical RK4 step.
+  """
+  k1 = f(t, y)
+  k2 = f(t + h / 2.0, y + h / 2.0 * k1)
+  k3 = f(t + h / 2.0, y + h / 2.0 * k2)
+  k4 = f(t + h, y + h * k3)
+  return y + h / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+
+def RungeKutta4Events(f, y0, tSpan, h, g, direction=0, terminal=0, maxEvents=None, store=True):
+  """
+  Fixed-step RK4 with event detection and early termination.
+
+  Crossings are located by root-finding on the RK4 step itself: the state at t[i] + s
+  is RK4Step(t[i], y[i], s), so the event times carry the integrator's own accuracy
+  (a cubic Hermite interpolant would limit them to third order).
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  y0 (array-like): Initial condition.
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+  h (float): Time step.
+  g (function): Vectorized event function g(t, y) returning m values.
+  direction, terminal, maxEvents: See EventRecorder.
+  store (bool): Keep the trajectory (False keeps only the events and the final state).
+
+  Returns:
+  t (numpy.ndarray): Time points (or only the final time when store is False).
+  Y (numpy.ndarray): Solution values (or only the final state when store is False).
+  events (numpy.ndarray): Structured event table (see EventRecorder.Table).
+  """
+  y = np.asarray(y0, dtype=float)
+  recorder = EventRecorder(g, len(y), direction, terminal, maxEvents)
+  grid = np.arange(*tSpan, h)  # Same time grid as the other fixed-step labs.
+  t = grid[0]
+  gPrev = recorder.Evaluate(t, y)
+  tOut, yOut = [t], [y]
+
+  for i in range(len(grid) - 1):
+    yNew = RungeKutta4Step(f, grid[i], y, grid[i + 1] - grid[i])
+    gNew = recorder.Evaluate(grid[i + 1], yNew)
+    solution = lambda s, t=grid[i], y=y: RungeKutta4Step(f, t, y, s - t)
+    stop, tStop, yStop = recorder.Process(grid[i], gPrev, grid[i + 1], gNew, solution)
+    if (stop):
+      t, y = tStop, yStop
+    else:
+      t, y, gPrev = grid[i + 1], yNew, gNew
+    if (store):
+      tOut.append(t)
+      yOut.append(y)
+    if (stop):
+      break
+
+  if (not store):
+    return np.array([t]), y[np.newaxis], recorder.Table()
+  return np.array(tOut), np.array(yOut), recorder.Table()
+
+
+def SolveIvpEvents(f, tSpan, y0, g, direction=0, terminal=0, maxEvents=None, method="DOP853", **options):
+  """
+  Adaptive integration (SciPy RK45 or DOP853 steppers) with the same event subsystem.
+
+  Crossings are located on the solver's dense output of each step. Unlike the events
+  argument of solve_ivp, this accepts one vectorized event function and a global
+  maxEvents, and it stores no trajectory.
+
+  Parameters:
+  f (function): The function representing the ODE f(t, y).
+  tSpan (tuple): Time span for the simulation as (start time, end time).
+  y0 (array-like): Initial condition.
+  g (function): Vectorized event function g(t, y) returning m values.
+  direction, terminal, maxEvents: See EventRecorder.
+  method (str): "RK45" or "DOP853".
+  **options: Solver options such as rtol and atol.
+
+  Returns:
+  tEnd (float): Time at which the integration stopped.
+  yEnd (numpy.ndarray): State at tEnd.
+  events (numpy.ndarray): Structured event table (see EventRecorder.Table).
+  nfev (int): Number of RHS evaluations.
+  """
+  solver = {"RK45": RK45, "DOP853": DOP853}[method](f, tSpan[0], np.asarray(y0, dtype=float), tSpan[1], **options)
+  recorder = EventRecorder(g, len(y0), direction, terminal, maxEvents)
+  gPrev = recorder.Evaluate(solver.t, solver.y)
+
+  while (solver.status == "running"):
+    tPrev = solver.t
+    message = solver.step()
+    if (solver.status == "failed"):
+      raise RuntimeError(message)
+    gNew = recorder.Evaluate(solver.t, solver.y)
+    stop, tStop, yStop = recorder.Process(tPrev, gPrev, solver.t, gNew, solver.dense_output())
+    if (stop):
+      return tStop, yStop, recorder.Table(), solver.nfev
+    gPrev = gNew
+  return solver.t, solver.y, recorder.Table(), solver.nfev
+
+
+def PrintEvents(title, events, limit=8):
+  """
+  Prints the first rows of an event table.
+  """
+  table = pt.PrettyTable()
+  table.field_names = ["Event", "Time", "State", "Direction"]
+  for row in events[:limit]:
+    table.add_row([row["event"], f"{row['t']:.10f}", np.round(row["y"], 6), "+" if (row["direction"] > 0) else "-"])
+  print(f"{title} ({len(events)} events)")
+  print(table)
+
+
+def EventTimeError(events, reference):
+  """
+  Largest time difference between matching events of two event tables.
+
+  Events are matched by type and by order of occurrence within the type, so the
+  tables must record the same number of events of every type.
+
+  Parameters:
+  events, reference: Event tables with fields event and t.
+
+  Returns:
+  float: Maximum absolute difference of the matched event times.
+  """
+  error = 0.0
+  for k in np.union1d(events["event"], reference["event"]):
+    t, tReference = events["t"][events["event"] == k], reference["t"][reference["event"] == k]
+    if (t.size != tReference.size):
+      raise ValueError(
+        f"Event {k} occurred {t.size} times but {tReference.size} times in the reference; "
+        "the event times cannot be matched."
+      )
+    error = max(error, np.max(np.abs(t - tReference), initial=0.0))
+  return error
+
+
+# ==============================================================
+# ============ FitzHugh-Nagumo Spike Times (v = 1) =============
+# ==============================================================
+epsilon, a, b, I = 0.08, 0.7, 0.8, 0.5  # Oscillatory regime (I = 1.5 in the FHN lab settles to rest).
+fhn = lambda t, z: FitzHughNagumo(z, epsilon, a, b, I)
+spike = lambda t, z: [z[0] - 1.0, z[0] + 1.0]  # Upstroke (v = 1) and downstroke (v = -1).
+
+# Reference spike times from the adaptive DOP853 driver at tight tolerances.
+_, _, reference, _ = SolveIvpEvents(fhn, (0, 100), [1.0, 0.1], spike, direction=[1, -1], rtol=1e-12, atol=1e-12)
+table = pt.PrettyTable()
+table.field_names = ["Method", "Stored Points", "Events", "Max Event-Time Error"]
+for h in [0.05, 0.01]:
+  t, Y, events = RungeKutta4Events(fhn, [1.0, 0.1], (0, 100), h, spike, direction=[1, -1], store=False)
+  table.add_row([f"RK4 events (h = {h})", len(t), len(events), f"{EventTimeError(events, reference):.2e}"])
+_, _, events, nfev = SolveIvpEvents(fhn, (0, 100), [1.0, 0.1], spike, direction=[1, -1], rtol=1e-9, atol=1e-12)
+table.add_row([f"DOP853 events (rtol = 1e-9, {nfev} RHS calls)", 0, len(events), f"{EventTimeError(events, reference):.2e}"])
+
+# The previous approach: sample densely and look for sign changes on the output grid.
+sol = solve_ivp(fhn, (0, 100), [1.0, 0.1], t_eval=np.linspace(0, 100, 10000), rtol=1e-12, atol=1e-12)
+crossings = np.flatnonzero((sol.y[0, :-1] < 1.0) & (sol.y[0, 1:] >= 1.0)) + 1
+sampled = {"event": np.zeros(crossings.size, dtype=int), "t": sol.t[crossings]}  # Upstrokes only.
+table.add_row([
+  "Post-processing 10k samples", sol.t.size, len(crossings),
+  f"{EventTimeError(sampled, reference[reference['event'] == 0]):.2e}",
+])
+print(table)
+PrintEvents("FitzHugh-Nagumo spike up/down strokes", reference)
+print("Interspike intervals:", np.round(np.diff(reference["t"][reference["event"] == 0]), 8))
+
+# ==============================================================
+# ====== Hindmarsh-Rose Bursts: Stop After the First 20 Spikes ======
+# ==============================================================
+tEnd, yEnd, events, nfev = SolveIvpEvents(
+  hindmarshRose, (0, 2000), [1.0, 1.0, 1.0], lambda t, y: [y[0] - 1.0], direction=1, maxEvents=20,
+  rtol=1e-9, atol=1e-12,
+)
+print(f"Hindmarsh-Rose: 20 spikes found by t = {tEnd:.4f} using {nfev} RHS calls (horizon was 2000).")
+PrintEvents("Hindmarsh-Rose spikes", events)
+
+# ==============================================================
+# ==== Drug Elimination: Stop When the Level Falls Below Therapeutic ====
+# ==============================================================
+C0, k, CTherapeutic = 100, 0.2, 10.0  # Initial concentration (mg/L), rate (1/h), threshold (mg/L).
+t, C, events = RungeKutta4Events(
+  lambda t, C: DrugElimination(t, C, k), [C0], (0, 100), 0.1, lambda t, C: [C[0] - CTherapeutic],
+  direction=-1, terminal=1,
+)
+exact = np.log(C0 / CTherapeutic) / k
+print(
+  f"Concentration fell below {CTherapeutic} mg/L at t = {events['t'][0]:.10f} h "
+  f"(exact {exact:.10f} h); integration stopped after {len(t) - 1} of 1000 steps."
+)
@@ -0,0 +1,438 @@
+"""
+========================================================================
+        ╦ ╦┌─┐┌─┐┌─┐┌─┐┌┬┐  ╔╦╗┌─┐┌─┐┌┬┐┬ ┬  ╔╗ ┌─┐┬  ┌─┐┬ ┬┌─┐
+        ╠═╣│ │└─┐└─┐├─┤│││  ║║║├─┤│ ┬ ││└┬┘  ╠╩╗├─┤│  ├─┤├─┤├─┤
+        ╩ ╩└─┘└─┘└─┘┴ ┴┴ ┴  ╩ ╩┴ ┴└─┘─┴┘ ┴   ╚═╝┴ ┴┴─┘┴ ┴┴ ┴┴ ┴
+========================================================================
+# Author: Hossam Magdy Balaha
+# Permissions and Citation: Refer to the README file.
+"""
+
+# Import necessary libraries.
+import time
+import warnings
+import numpy as np
+import prettytable as pt
+import matplotlib.pyplot as plt
+from scipy.optimize import fsolve
+
+
+# Models take the state z with shape (d,) or (d, S) so that many seeds can be evaluated at once.
+def FitzHughNagumo(z, epsilon=0.08, a=0.7, b=0.8, I=0.5):
+  """
+  FitzHugh-Nagumo Model for Neuron Dynamics (Lecture_10_Lab_Exercise_2_FHN.py).
+  """
+  v, w = z  # Unpack the state variables.
+  dvdt = v - v ** 3 / 3 - w + I
+  dwdt = epsilon * (v + a - b * w)
+  return np.array([dvdt, dwdt])
+
+
+def HindmarshRose(z, I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Hindmarsh-Rose neuron model (Lecture_08_Lab_Exercise_2_Chaos.py) without the time argument.
+  """
+  x, y, w = z  # Unpack the state variables (w is the slow adaptation current z).
+  dxdt = y - a * x ** 3 + b * x ** 2 + I - w
+  dydt = c - d * x ** 2 - y
+  dwdt = r * (s * (x - x0) - w)
+  return np.array([dxdt, dydt, dwdt])
+
+
+def HillEquation(x, beta=1.0, n=2, k=1.0, gamma=0.1):
+  """
+  Hill equation (Lecture_10_Lab_Exercise_1_Hill.py); not polynomial for non-integer n.
+  """
+  return (beta * (x ** n) / (k ** n + x ** n)) - (gamma * x)
+
+
+def FitzHughNagumoReduction(epsilon=0.08, a=0.7, b=0.8, I=0.5):
+  """
+  Eliminates w through the linear nullcline w = (v + a) / b.
+
+  dv/dt = 0 then becomes the cubic b v^3 + 3 (1 - b) v + 3 (a - b I) = 0 (epsilon drops out).
+
+  Returns:
+  coefficients (numpy.ndarray): Cubic coefficients with shape (B, 4), highest power first.
+  lift (function): Maps (v, rows) back to full states (m, 2).
+  """
+  if (np.any(np.asarray(b) == 0)):
+    raise ValueError("The reduction needs b != 0 (for b = 0 the w-nullcline is the line v = -a).")
+  a, b, I = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in (a, b, I)))
+  coefficients = np.stack([b, np.zeros_like(b), 3 * (1 - b), 3 * (a - b * I)], axis=-1)
+  lift = lambda v, rows: np.column_stack([v, (v + a[rows]) / b[rows]])
+  return coefficients, lift
+
+
+def HindmarshRoseReduction(I=-5, r=0.01, a=1.0, b=3, c=1, d=5, s=4, x0=1.6):
+  """
+  Eliminates y = c - d x^2 and z = s (x - x0) through the two fast/slow nullclines.
+
+  dx/dt = 0 then becomes -a x^3 + (b - d) x^2 - s x + (c + I + s x0) = 0 (r drops out).
+  """
+  I, a, b, c, d, s, x0 = np.broadcast_arrays(
+    *(np.atleast_1d(np.asarray(p, dtype=float)) for p in (I, a, b, c, d, s, x0))
+  )
+  coefficients = np.stack([-a, b - d, -s, c + I + s * x0], axis=-1)
+  lift = lambda x, rows: np.column_stack([x, c[rows] - d[rows] * x ** 2, s[rows] * (x - x0[rows])])
+  return coefficients, lift
+
+
+# Models whose equilibria reduce to one polynomial in a single state variable.
+REDUCTIONS = {
+  FitzHughNagumo: FitzHughNagumoReduction,
+  HindmarshRose : HindmarshRoseReduction,
+}
+
+
+def CompanionRoots(coefficients):
+  """
+  Roots of many polynomials of the same degree from one batched eigenvalue call; (B, n + 1) -> (B, n).
+  """
+  B, n = coefficients.shape[0], coefficients.shape[1] - 1
+  companion = np.zeros((B, n, n))
+  companion[:, 0, :] = -coefficients[:, 1:] / coefficients[:, :1]
+  companion[:, np.arange(1, n), np.arange(n - 1)] = 1.0
+  return np.linalg.eigvals(companion)
+
+
+def ReducedEquilibria(reduction, params, imagTol=1e-7, tol=1e-6):
+  """
+  Solves the reduced polynomial for every parameter set at once and lifts the real roots.
+
+  Parameters:
+  reduction (function): Returns (coefficients, lift) for the parameters.
+  params (dict): Parameter name -> scalar or array of shape (B,).
+  imagTol (float): Relative imaginary-part tolerance for accepting a root as real.
+  tol (float): Real roots closer than this (relative) are merged; the eigenvalue solver returns
+    a double root as two roots about 1e-8 apart.
+
+  Returns:
+  list: One (k, d) array of equilibria per parameter set, sorted by the reduced variable.
+  """
+  coefficients, lift = reduction(**params)
+  roots = CompanionRoots(coefficients)
+
+  # Sort the real roots of every row and drop repeated ones (complex roots become NaN and sort last).
+  x = np.where(np.abs(roots.imag) <= imagTol * (1 + np.abs(roots.real)), roots.real, np.nan)
+  x = np.sort(x, axis=1)
+  repeated = np.zeros_like(x, dtype=bool)
+  repeated[:, 1:] = np.abs(np.diff(x, axis=1)) < tol * (1 + np.abs(x[:, 1:]))
+  rows, columns = np.nonzero(~np.isnan(x) & ~repeated)
+  x = x[rows, columns]
+
+  # One Newton step on the reduced polynomial sharpens roots returned by the eigenvalue solver.
+  polynomial = coefficients[rows]
+  value, slope = np.zeros_like(x), np.zeros_like(x)
+  for k in range(polynomial.shape[1]):
+    slope = slope * x + value
+    value = value * x + polynomial[:, k]
+  safe = np.abs(slope) > 1e-12
+  x = np.where(safe, x - value / np.where(safe, slope, 1.0), x)
+
+  counts = np.bincount(rows, minlength=coefficients.shape[0])
+  return np.split(lift(x, rows), np.cumsum(counts)[:-1])
+
+
+def SeededNewton(model, params, seeds, tol=1e-10, maxIter=50, h=1e-7):
+  """
+  Vectorized Newton iteration from many seeds for one parameter set.
+
+  All seeds are iterated together: the model is evaluated on a (d, S) state array
+  and the (S, d, d) finite-difference Jacobians are solved in one batched call.
+
+  Returns:
+  tuple: Final states (S, d) and a boolean mask of the converged seeds.
+  """
+  Z = np.array(seeds, dtype=float).T  # Shape (d, S).
+  d, S = Z.shape
+  converged = np.zeros(S, dtype=bool)
+  for _ in range(maxIter):
+    F = np.asarray(model(Z, **params), dtype=float).reshape(d, S)
+    J = np.empty((S, d, d))
+    for j in range(d):
+      Zh = Z.copy()
+      Zh[j] += h
+      J[:, :, j] = ((np.asarray(model(Zh, **params), dtype=float).reshape(d, S) - F) / h).T
+    singular = np.abs(np.linalg.det(J)) < 1e-14
+    J[singular] = np.eye(d)  # Frozen seeds: their step is discarded below.
+    step = np.linalg.solve(J, -F.T[:, :, None])[:, :, 0].T
+    step[:, singular] = 0.0
+    Z = Z + step
+    converged = (np.max(np.abs(step), axis=0) < tol) & ~singular
+    if (converged.all()):
+      break
+  residual = np.max(np.abs(np.asarray(model(Z, **params), dtype=float).reshape(d, S)), axis=0)
+  return Z.T, converged & (residual < 1e-8)
+
+
+class SpatialHashIndex:
+  """
+  Tolerance-aware index of distinct points (e.g. equilibria) in d dimensions.
+
+  Points are quantized to a grid of cells of width tol. Two points closer than
+  tol in the max-norm (the per-component test of np.isclose with atol = tol)
+  lie in the same or in neighbouring cells, so every lookup only inspects the
+  3^d cells around a point instead of all stored points. Each cell holds at
+  most one representative, because representatives are more than tol apart.
+  """
+
+  def __init__(self, d, tol=1e-8):
+    self.d = d
+    self.tol = tol
+    self.cells = {}  # Cell tuple -> index of the representative stored in it.
+    self.points = np.empty((16, d))  # Representatives (grown by doubling).
+    self.counts = np.zeros(16, dtype=int)  # Multiplicity of every representative.
+    self.size = 0
+    self.offsets = np.array(np.meshgrid(*[[-1, 0, 1]] * d, indexing="ij")).reshape(d, -1).T
+
+  def __len__(self):
+    return self.size
+
+  @property
+  def representatives(self):
+    return self.points[:self.size]
+
+  @property
+  def multiplicities(self):
+    return self.counts[:self.size]
+
+  def _Nearest(self, cell, points):
+    """
+    Index of the nearest representative within tol for points sharing one cell (-1 if none).
+    """
+    candidates = [self.cells[key] for key in map(tuple, self.offsets + cell) if key in self.cells]
+    if (not candidates):
+      return np.full(len(points), -1)
+    distance = np.max(np.abs(points[:, None, :] - self.points[candidates][None, :, :]), axis=2)
+    nearest = np.argmin(distance, axis=1)
+    return np.where(distance[np.arange(len(points)), nearest] <= self.tol, np.asarray(candidates)[nearest], -1)
+
+  def _Grow(self):
+    self.points = np.concatenate([self.points, np.empty_like(self.points)])
+    self.counts = np.concatenate([self.counts, np.zeros_like(self.counts)])
+
+  def _Group(self, points):
+    """
+    Groups points by cell; the Python loop then runs over occupied cells, not over points.
+    """
+    points = np.atleast_2d(np.asarray(points, dtype=float)).reshape(-1, self.d)
+    cells = np.floor(points / self.tol).astype(np.int64)
+    uniqueCells, inverse = np.unique(cells, axis=0, return_inverse=True)
+    order = np.argsort(inverse.ravel(), kind="stable")
+    bounds = np.cumsum(np.bincount(inverse.ravel(), minlength=len(uniqueCells)))[:-1]
+    return points, uniqueCells, np.split(order, bounds)
+
+  def Query(self, points):
+    """
+    Labels of the representatives within tol of each point (-1 where there is none).
+    """
+    points, uniqueCells, groups = self._Group(points)
+    labels = np.full(len(points), -1)
+    for cell, members in zip(uniqueCells, groups):
+      labels[members] = self._Nearest(cell, points[members])
+    return labels
+
+  def Insert(self, points):
+    """
+    Inserts many points at once and returns the label of the representative of each one.
+
+    A point within tol of a stored representative joins it (its multiplicity grows);
+    otherwise the first such point of its cell becomes a new representative and the
+    remaining points of that cell, all within tol of it, join it.
+    """
+    points, uniqueCells, groups = self._Group(points)
+    labels = np.empty(len(points), dtype=int)
+    for cell, members in zip(uniqueCells, groups):
+      found = self._Nearest(cell, points[members])
+      if (np.any(found < 0)):
+        if (self.size == len(self.points)):
+          self._Grow()
+        self.points[self.size] = points[members[np.argmax(found < 0)]]
+        self.cells[tuple(cell)] = self.size
+        found[found < 0] = self.size
+        self.size += 1
+      labels[members] = found
+    np.add.at(self.counts, labels, 1)
+    return labels
+
+
+def Equilibria(model, params, seeds=None, tol=1e-8):
+  """
+  Equilibria of a model for one or many parameter sets.
+
+  Models listed in REDUCTIONS are solved exactly through their 1-D polynomial;
+  every other model falls back to seeded Newton for each parameter set.
+
+  Parameters:
+  model (function): Model f(z, **params).
+  params (dict): Parameter name -> scalar or array of shape (B,).
+  seeds (numpy.ndarray): Seeds with shape (S, d) for the Newton fallback.
+  tol (float): Equilibria closer than this (max-norm) are merged.
+
+  Returns:
+  list: One (k, d) array of equilibria per parameter set.
+  """
+  if (model in REDUCTIONS):
+    return ReducedEquilibria(REDUCTIONS[model], params, tol=tol)
+  if (seeds is None):
+    raise ValueError("Models without a polynomial reduction need seeds for the Newton fallback.")
+  B = max([np.size(value) for value in params.values()] + [1])
+  arrays = {name: np.broadcast_to(np.asarray(value, dtype=float), (B,)) for name, value in params.items()}
+  equilibria = []
+  for i in range(B):
+    Z, ok = SeededNewton(model, {name: value[i] for name, value in arrays.items()}, seeds)
+    index = SpatialHashIndex(Z.shape[1], tol)
+    index.Insert(Z[ok])
+    equilibria.append(index.representatives.copy())
+  return equilibria
+
+
+def Classify(model, equilibrium, params, h=1e-7):
+  """
+  Labels an equilibrium from the eigenvalues of its finite-difference Jacobian.
+  """
+  d = equilibrium.size
+  F = np.asarray(model(equilibrium, **params), dtype=float)
+  J = np.empty((d, d))
+  for j in range(d):
+    e = np.zeros(d)
+    e[j] = h
+    J[:, j] = (np.asarray(model(equilibrium + e, **params), dtype=float) - F) / h
+  real = np.linalg.eigvals(J).real
+  if (np.all(real < 0)):
+    return "Stable"
+  if (np.all(real > 0)):
+    return "Unstable"
+  return "Saddle Point (or Neutral)"
+
+
+epsilon, a, b = 0.08, 0.7, 0.8
+table = pt.PrettyTable()
+table.field_names = ["Method", "Parameter Sets", "Time (ms)", "Equilibria Found"]
+
+# The seed-grid fsolve of Lecture_10_Lab_Exercise_2_FHN.py, timed on a 20x20 grid and scaled to 100x100.
+def SeedGridEquilibria(I, n=20):
+  points = []
+  with warnings.catch_warnings():
+    warnings.simplefilter("ignore", RuntimeWarning)  # fsolve warns whenever a seed stalls.
+    for i in range(n):
+      for j in range(n):
+        eq = fsolve(lambda z: FitzHughNagumo(z, epsilon, a, b, I), [i, j])
+        if (not any(np.isclose(eq, e).all() for e in points)):
+          points.append(eq)
+  return points
+
+extValues = np.linspace(0.0, 2.5, 10)
+start = time.perf_counter()
+legacy = [SeedGridEquilibria(I) for I in extValues]
+legacyTime = (time.perf_counter() - start) * 1e3 * (100 * 100) / (20 * 20)
+table.add_row(["fsolve seed grid (100x100, scaled)", extValues.size, f"{legacyTime:.0f}",
+               sum(len(points) for points in legacy)])
+
+params = {"epsilon": epsilon, "a": a, "b": b, "I": extValues}
+start = time.perf_counter()
+reduced = Equilibria(FitzHughNagumo, params)
+table.add_row(["Nullcline reduction", extValues.size, f"{(time.perf_counter() - start) * 1e3:.2f}",
+               sum(len(eq) for eq in reduced)])
+
+IFine = np.linspace(-1.0, 3.0, 100000)
+start = time.perf_counter()
+fine = Equilibria(FitzHughNagumo, {"epsilon": epsilon, "a": a, "b": b, "I": IFine})
+table.add_row(["Nullcline reduction", IFine.size, f"{(time.perf_counter() - start) * 1e3:.0f}",
+               sum(len(eq) for eq in fine)])
+
+# A parameter set with three equilibria (b = 2 makes the cubic non-monotonic).
+three = Equilibria(FitzHughNagumo, {"epsilon": epsilon, "a": 0.7, "b": 2.0, "I": 0.35})[0]
+
+IHR = np.linspace(-10, 10, 1000)
+start = time.perf_counter()
+hrEquilibria = Equilibria(HindmarshRose, {"I": IHR})
+table.add_row(["Nullcline reduction (Hindmarsh-Rose)", IHR.size, f"{(time.perf_counter() - start) * 1e3:.1f}",
+               sum(len(eq) for eq in hrEquilibria)])
+
+# Non-polynomial fallback: seeded Newton on the Hill equation with a non-integer coefficient.
+seeds = np.linspace(0.0, 12.0, 50)[:, None]
+nValues = np.linspace(1.5, 4.0, 50)
+start = time.perf_counter()
+with np.errstate(invalid="ignore"):  # Seeds that step below x = 0 give NaN and are dropped.
+  hill = Equilibria(HillEquation, {"beta": 1.0, "n": nValues, "k": 1.0, "gamma": 0.1}, seeds=seeds)
+table.add_row(["Seeded Newton fallback (Hill)", nValues.size, f"{(time.perf_counter() - start) * 1e3:.0f}",
+               sum(len(eq) for eq in hill)])
+print(table)
+
+# Deduplication of many Newton candidates: uncoupled pendula (dθ/dt = -sin θ) have an
+# equilibrium at every (kπ, mπ), so thousands of seeds give thousands of distinct points.
+def Pendula(z):
+  return -np.sin(z)
+
+def IscloseScan(points):
+  distinct = []
+  for point in points:
+    if (not any(np.isclose(point, e, rtol=0, atol=1e-8).all() for e in distinct)):
+      distinct.append(point)
+  return distinct
+
+rng = np.random.default_rng(0)
+dedupTable = pt.PrettyTable()
+dedupTable.field_names = ["Candidates", "Distinct", "isclose Scan (ms)", "Spatial Hash (ms)", "Max Multiplicity"]
+for n in [250, 1000, 4000, 16000, 64000]:
+  Z, ok = SeededNewton(Pendula, {}, rng.uniform(-100, 100, size=(n, 2)))
+  candidates = Z[ok]
+  start = time.perf_counter()
+  index = SpatialHashIndex(2, tol=1e-8)
+  labels = index.Insert(candidates)
+  hashTime = (time.perf_counter() - start) * 1e3
+  assert np.all(index.Query(candidates) == labels)
+  scanTime = "-"
+  if (n <= 1000):  # The scan is quadratic; larger sets take minutes.
+    start = time.perf_counter()
+    assert len(IscloseScan(candidates)) == len(index)
+    scanTime = f"{(time.perf_counter() - start) * 1e3:.0f}"
+  dedupTable.add_row([len(candidates), len(index), scanTime, f"{hashTime:.1f}", index.multiplicities.max()])
+print(dedupTable)
+
+# Check the reduction against the seed grid.
+# The seed grid also keeps non-converged fsolve results; only its true equilibria are compared.
+spurious = 0
+for I, points, eq in zip(extValues, legacy, reduced):
+  for point in points:
+    if (np.max(np.abs(FitzHughNagumo(point, epsilon, a, b, I))) > 1e-8):
+      spurious += 1
+      continue
+    assert np.min(np.max(np.abs(eq - point), axis=1)) < 1e-6, I
+print(f"Every converged seed-grid equilibrium matches the reduction ({spurious} non-converged fsolve results).")
+for eq in three:
+  print(f"b = 2, I = 0.35: equilibrium {np.round(eq, 4)} is "
+        f"{Classify(FitzHughNagumo, eq, {'epsilon': epsilon, 'a': 0.7, 'b': 2.0, 'I': 0.35})}.")
+
+# Plot the fine FHN diagram and the Hill fallback.
+plt.figure(figsize=(14, 5))
+plt.subplot(1, 2, 1)
+rows = np.repeat(IFine, [len(eq) for eq in fine])
+v = np.concatenate(fine)[:, 0]
+stable = np.array([
+  Classify(FitzHughNagumo, eq, {"epsilon": epsilon, "a": a, "b": b, "I": I}) == "Stable"
+  for I, eq in zip(rows[::100], np.concatenate(fine)[::100])
+])
+plt.plot(rows, v, "k-", lw=0.5)
+plt.plot(rows[::100][stable], v[::100][stable], "b.", label="Stable")
+plt.plot(rows[::100][~stable], v[::100][~stable], "rx", label="Unstable")
+plt.xlabel("Parameter (I)", fontsize=12)
+plt.ylabel("Equilibrium v", fontsize=12)
+plt.title("FitzHugh-Nagumo Equilibria (100000 Values of I)", fontsize=14)
+plt.legend()  # Add legend to the plot.
+plt.grid()  # Add grid to the plot.
+
+plt.subplot(1, 2, 2)
+for n, eq in zip(nValues, hill):
+  plt.plot(np.full(len(eq), n), eq[:, 0], "b.")
+plt.xlabel("Hill Coefficient (n)", fontsize=12)
+plt.ylabel("Equilibrium x", fontsize=12)
+plt.title("Hill Equation Equilibria (Seeded Newton)", fontsize=14)
+plt.grid()  # Add grid to the plot.
+plt.tight_layout()  # Adjust layout to prevent overlap.
+
+plt.savefig("Lecture_10_Lab_Exercise_6_Equilibria.png", dpi=300, bbox_inches="tight")
+plt.show()  # Display the plot.
+plt.close()  # Close the plot to free memory.